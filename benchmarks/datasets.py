@@ -0,0 +1,92 @@
+import csv
+import random
+from pathlib import Path
+
+POSITIONS = (
+    "Backend Developer",
+    "Frontend Developer",
+    "Mobile Developer",
+    "DevOps Engineer",
+    "QA Engineer",
+    "Data Engineer",
+    "Data Scientist",
+    "Fullstack Developer",
+)
+TEAMS = (
+    "API Team",
+    "Web Team",
+    "Mobile Team",
+    "Infrastructure Team",
+    "Testing Team",
+    "Data Team",
+)
+SKILLS = (
+    "Python",
+    "Django",
+    "Java",
+    "Spring Boot",
+    "Go",
+    "Docker",
+    "Kubernetes",
+    "React",
+    "Vue.js",
+    "PostgreSQL",
+    "Redis",
+    "AWS",
+)
+HEADER = (
+    "name",
+    "position",
+    "completed_tasks",
+    "performance",
+    "skills",
+    "team",
+    "experience_years",
+)
+
+
+def write_dataset(
+    path: Path,
+    rows: int,
+    extra_columns: int = 0,
+    multiline: bool = False,
+    seed: int = 0,
+) -> Path:
+    """
+    Writing synthetic CSV file with the schema of csv/employees*.csv.
+
+    Skills are written as quoted comma-separated lists, like in real exports.
+
+    Args:
+        path: Output path.
+        rows: Number of rows.
+        extra_columns: Number of additional columns for wide files.
+        multiline: Whether to put line breaks inside quoted skills.
+        seed: Random seed, same seed gives the same file.
+
+    Returns:
+        Output path.
+    """
+
+    rng = random.Random(seed)
+    separator = ",\n" if multiline else ", "
+    header = HEADER + tuple(f"extra_{i}" for i in range(extra_columns))
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+
+        for index in range(rows):
+            row = [
+                f"Developer {index}",
+                rng.choice(POSITIONS),
+                rng.randint(10, 60),
+                round(rng.uniform(3.5, 5.0), 1),
+                separator.join(rng.sample(SKILLS, 4)),
+                rng.choice(TEAMS),
+                rng.randint(1, 15),
+            ]
+            row.extend(f"value {index}.{i}" for i in range(extra_columns))
+            writer.writerow(row)
+
+    return path
@@ -0,0 +1,304 @@
+"""
+Benchmark of CSV -> report -> table pipeline.
+
+Usage:
+    python -m benchmarks.run --rows 1000 100000 --shapes narrow wide
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --max-slowdown 20
+
+The "log" stage calls a decorated function once per row and fails the run
+if it is slower than plain call forwarding ("forward" stage) by more than
+--max-log-overhead percent.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.datasets import write_dataset
+from core import CsvReader, log, print_table
+from core.defined_reports import AveragePerformanceReport
+
+SHAPES = {
+    "narrow": {"extra_columns": 0, "multiline": False},
+    "wide": {"extra_columns": 33, "multiline": False},
+    "multiline": {"extra_columns": 0, "multiline": True},
+}
+
+
+def _reset_peak_rss() -> None:
+    """Resetting peak RSS of the process where supported (Linux)."""
+
+    with contextlib.suppress(OSError):
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+
+
+def _peak_rss_mib() -> float:
+    """Getting peak RSS since the last reset in MiB."""
+
+    with contextlib.suppress(OSError):
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> tuple[float, float, Any]:
+    """
+    Timing function call.
+
+    Args:
+        func: Function to call.
+        repeat: Number of calls, the fastest one is reported.
+
+    Returns:
+        Tuple of (seconds, peak RSS in MiB, last result).
+    """
+
+    best = float("inf")
+    peak = 0.0
+    result = None
+
+    for _ in range(repeat):
+        result = None
+        _reset_peak_rss()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, _peak_rss_mib())
+
+    return best, peak, result
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@log
+def _noop(value: Any) -> Any:
+    """Doing nothing, used to measure log wrapper overhead."""
+
+    return value
+
+
+def _forward(*args, **kwargs) -> Any:
+    """Forwarding call like the log wrapper, the least a decorator costs."""
+
+    return _identity(*args, **kwargs)
+
+
+def _call_per_row(func: Callable[[Any], Any], rows: int) -> None:
+    for index in range(rows):
+        func(index)
+
+
+def _render(rows: list[dict]) -> None:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        print_table(rows, title="Benchmark")
+
+
+def run_stages(
+    path: Path, rows: int, use_mmap: bool, repeat: int, render_rows: int
+) -> dict[str, tuple[float, float]]:
+    """
+    Timing every pipeline stage over one file.
+
+    Args:
+        path: CSV file.
+        rows: Number of rows in the file.
+        use_mmap: Whether to scan memory-mapped file.
+        repeat: Number of runs of each stage.
+        render_rows: Number of rows to render as a table, render time is
+            extrapolated to all rows.
+
+    Returns:
+        Mapping of stage name to (seconds, peak RSS in MiB).
+    """
+
+    report = AveragePerformanceReport()
+    results = {}
+
+    def reader() -> CsvReader:
+        return CsvReader(path, use_mmap=use_mmap)
+
+    seconds, peak, _ = _measure(lambda: reader().check_csv_file_valid, repeat)
+    results["validate"] = (seconds, peak)
+
+    seconds, peak, table = _measure(lambda: reader().load_table(report.columns), repeat)
+    results["load"] = (seconds, peak)
+
+    seconds, peak, _ = _measure(lambda: report.generate(table), repeat)
+    results["generate"] = (seconds, peak)
+
+    seconds, peak, _ = _measure(
+        lambda: report.generate(reader().iter_rows(report.columns)), repeat
+    )
+    results["stream"] = (seconds, peak)
+
+    detail = []
+    for row in table.iter_rows():
+        if len(detail) >= render_rows:
+            break
+        detail.append(row)
+    seconds, peak, _ = _measure(lambda: _render(detail), repeat)
+    results["render"] = (seconds * rows / max(len(detail), 1), peak)
+
+    seconds, peak, _ = _measure(lambda: _call_per_row(_forward, rows), repeat)
+    results["forward"] = (seconds, peak)
+
+    seconds, peak, _ = _measure(lambda: _call_per_row(_noop, rows), repeat)
+    results["log"] = (seconds, peak)
+
+    return results
+
+
+def compare(
+    current: dict[str, float], baseline: dict[str, float], max_slowdown: float
+) -> list[str]:
+    """
+    Finding benchmarks slower than baseline.
+
+    Args:
+        current: Mapping of benchmark key to seconds.
+        baseline: Mapping of benchmark key to baseline seconds.
+        max_slowdown: Allowed slowdown in percent.
+
+    Returns:
+        List of regression descriptions.
+    """
+
+    regressions = []
+    for key, seconds in current.items():
+        expected = baseline.get(key)
+        if expected and seconds > expected * (1 + max_slowdown / 100):
+            regressions.append(
+                f"{key}: {seconds:.4f}s vs baseline {expected:.4f}s "
+                f"(+{(seconds / expected - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def check_log_overhead(timings: dict[str, float], max_overhead: float) -> list[str]:
+    """
+    Finding log stages slower than plain call forwarding over the same rows.
+
+    Args:
+        timings: Mapping of benchmark key to seconds.
+        max_overhead: Allowed overhead in percent.
+
+    Returns:
+        List of regression descriptions.
+    """
+
+    regressions = []
+    for key, seconds in timings.items():
+        if not key.endswith("/log"):
+            continue
+        forward = timings[key.removesuffix("log") + "forward"]
+        if forward and seconds > forward * (1 + max_overhead / 100):
+            regressions.append(
+                f"{key}: {seconds:.4f}s vs forwarding {forward:.4f}s "
+                f"(+{(seconds / forward - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarking report pipeline.")
+    parser.add_argument(
+        "--rows", nargs="+", type=int, default=[1_000, 100_000], help="Row counts."
+    )
+    parser.add_argument(
+        "--shapes", nargs="+", choices=SHAPES, default=list(SHAPES), help="Shapes."
+    )
+    parser.add_argument("--mmap", action="store_true", help="Scan memory-mapped.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage.")
+    parser.add_argument(
+        "--render-rows", type=int, default=10_000, help="Rows rendered as table."
+    )
+    parser.add_argument("--data-dir", help="Directory to keep generated files.")
+    parser.add_argument("--baseline", help="JSON baseline to compare with.")
+    parser.add_argument("--save-baseline", help="Path to save results as baseline.")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=20.0,
+        help="Allowed slowdown against baseline in percent (default: 20).",
+    )
+    parser.add_argument(
+        "--max-log-overhead",
+        type=float,
+        default=25.0,
+        help="Allowed slowdown of decorated calls against plain forwarding "
+        "in percent (default: 25).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    """Entry point of benchmarks."""
+
+    args = parse_args(argv)
+    # Generated files are kept only in a given directory
+    data_dir = (
+        contextlib.nullcontext(args.data_dir)
+        if args.data_dir
+        else tempfile.TemporaryDirectory(prefix="csv-bench-")
+    )
+
+    timings: dict[str, float] = {}
+    table = []
+
+    with data_dir as directory:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+        for shape in args.shapes:
+            for rows in args.rows:
+                path = Path(directory) / f"{shape}_{rows}.csv"
+                if not path.is_file():
+                    write_dataset(path, rows, **SHAPES[shape])
+
+                for stage, (seconds, peak) in run_stages(
+                    path, rows, args.mmap, args.repeat, args.render_rows
+                ).items():
+                    key = f"{shape}/{rows}/{stage}"
+                    timings[key] = seconds
+                    table.append(
+                        {
+                            "benchmark": key,
+                            "seconds": round(seconds, 4),
+                            "rows/s": int(rows / seconds) if seconds else 0,
+                            "peak RSS, MiB": round(peak, 1),
+                        }
+                    )
+
+    print_table(table, title="Benchmarks")
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(timings, indent=2) + "\n")
+
+    regressions = check_log_overhead(timings, args.max_log_overhead)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions += compare(timings, baseline, args.max_slowdown)
+
+    if regressions:
+        print("Regressions:")
+        print("\n".join(regressions))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
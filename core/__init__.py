@@ -1,20 +1,136 @@
+"""
+Core package, submodules are imported on first access to their names.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __all__ = (
+    "AggregateReport",
     "ArgParser",
     "BaseReport",
+    "CheckpointStore",
+    "ClusterAccumulator",
+    "ColumnarReader",
+    "CombinedReport",
     "CsvReader",
+    "FileCache",
+    "GroupIndex",
+    "GroupedAccumulator",
+    "Profiler",
     "ReportRegistry",
+    "ReportServer",
+    "StatsAccumulator",
+    "StreamedReports",
+    "SumAccumulator",
+    "Table",
+    "TDigest",
+    "TableIndex",
+    "coerce_column",
+    "coerce_number",
+    "combine_reports",
+    "convert_csv",
     "convert_to_number",
+    "external_sort",
     "is_numeric",
+    "aggregate_files",
     "log",
     "get_logger",
+    "open_reader",
     "print_table",
+    "query_server",
     "setup_logging",
+    "stream_files",
+    "top_k",
+    "write_table",
 )
 
 
-from .arg_parser import ArgParser
-from .cli_tools import print_table
-from .csv_tools import CsvReader
-from .logger import log, get_logger, setup_logging
-from .reports import BaseReport, ReportRegistry
-from .shortcuts import convert_to_number, is_numeric
+_EXPORTS = {
+    "aggregate_files": "pipeline",
+    "AggregateReport": "reports",
+    "ArgParser": "arg_parser",
+    "BaseReport": "reports",
+    "CheckpointStore": "cache",
+    "ClusterAccumulator": "aggregation",
+    "coerce_column": "shortcuts",
+    "coerce_number": "shortcuts",
+    "combine_reports": "reports",
+    "ColumnarReader": "columnar",
+    "CombinedReport": "reports",
+    "convert_csv": "columnar",
+    "convert_to_number": "shortcuts",
+    "CsvReader": "csv_tools",
+    "external_sort": "sorting",
+    "FileCache": "cache",
+    "get_logger": "logger",
+    "GroupedAccumulator": "aggregation",
+    "GroupIndex": "index",
+    "is_numeric": "shortcuts",
+    "log": "logger",
+    "open_reader": "columnar",
+    "print_table": "cli_tools",
+    "Profiler": "profiling",
+    "query_server": "client",
+    "ReportRegistry": "reports",
+    "ReportServer": "server",
+    "setup_logging": "logger",
+    "StatsAccumulator": "aggregation",
+    "stream_files": "pipeline",
+    "StreamedReports": "reports",
+    "SumAccumulator": "aggregation",
+    "Table": "table",
+    "TableIndex": "index",
+    "TDigest": "sketches",
+    "top_k": "sorting",
+    "write_table": "columnar",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Importing submodule of the exported name on first access."""
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        error_msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_msg)
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .aggregation import (
+        ClusterAccumulator,
+        GroupedAccumulator,
+        StatsAccumulator,
+        SumAccumulator,
+    )
+    from .arg_parser import ArgParser
+    from .cache import CheckpointStore, FileCache
+    from .cli_tools import print_table
+    from .client import query_server
+    from .columnar import ColumnarReader, convert_csv, open_reader, write_table
+    from .csv_tools import CsvReader
+    from .index import GroupIndex, TableIndex
+    from .logger import log, get_logger, setup_logging
+    from .profiling import Profiler
+    from .pipeline import aggregate_files, stream_files
+    from .reports import (
+        AggregateReport,
+        BaseReport,
+        CombinedReport,
+        ReportRegistry,
+        StreamedReports,
+        combine_reports,
+    )
+    from .server import ReportServer
+    from .sketches import TDigest
+    from .sorting import external_sort, top_k
+    from .shortcuts import coerce_column, coerce_number, convert_to_number, is_numeric
+    from .table import Table
@@ -0,0 +1,263 @@
+from math import inf, sqrt
+from typing import Hashable, ItemsView, Optional
+
+# Normal quantile of two-sided 95% confidence intervals
+Z_95 = 1.96
+
+
+class SumAccumulator:
+    """Mergeable running count and sum of values."""
+
+    __slots__ = ("count", "total")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+
+    def add(self, value: int | float) -> None:
+        """
+        Adding single value.
+
+        Args:
+            value: Numeric value.
+        """
+
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "SumAccumulator") -> "SumAccumulator":
+        """
+        Merging another accumulator into this one.
+
+        Args:
+            other: Accumulator of the same type.
+
+        Returns:
+            This accumulator.
+        """
+
+        self.count += other.count
+        self.total += other.total
+        return self
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of added values, None if nothing was added."""
+
+        if not self.count:
+            return None
+        return self.total / self.count
+
+
+class StatsAccumulator(SumAccumulator):
+    """
+    Mergeable count, sum, min, max and variance of values.
+
+    Variance is tracked with Welford's online algorithm and merged
+    with Chan's parallel formula, so it stays numerically stable.
+    """
+
+    __slots__ = ("minimum", "maximum", "_mean", "_m2")
+
+    def __init__(self):
+        super().__init__()
+        self.minimum = inf
+        self.maximum = -inf
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: int | float) -> None:
+        self.count += 1
+        self.total += value
+
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    def merge(self, other: "StatsAccumulator") -> "StatsAccumulator":
+        if not other.count:
+            return self
+
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self._mean += delta * other.count / count
+
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Sample variance of added values, None for less than two values."""
+
+        if self.count < 2:
+            return None
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Sample standard deviation of added values."""
+
+        variance = self.variance
+        return None if variance is None else sqrt(variance)
+
+
+class ClusterAccumulator(StatsAccumulator):
+    """
+    Mergeable statistics of a cluster sample, e.g. sampled file blocks.
+
+    Values added between merges belong to one cluster, merging closes
+    the clusters of both accumulators, so an accumulator built per block
+    and merged with others knows the count and sum of every block. The
+    variance of the mean is then estimated from the differences between
+    clusters rather than between values, which are correlated within
+    a cluster.
+    """
+
+    __slots__ = (
+        "clusters",
+        "_open_count",
+        "_open_total",
+        "_counts_sq",
+        "_totals_sq",
+        "_products",
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.clusters = 0
+        self._open_count = 0
+        self._open_total = 0
+        self._counts_sq = 0
+        self._totals_sq = 0
+        self._products = 0
+
+    def add(self, value: int | float) -> None:
+        super().add(value)
+        self._open_count += 1
+        self._open_total += value
+
+    def merge(self, other: "ClusterAccumulator") -> "ClusterAccumulator":
+        self._close()
+        other._close()
+        super().merge(other)
+
+        self.clusters += other.clusters
+        self._counts_sq += other._counts_sq
+        self._totals_sq += other._totals_sq
+        self._products += other._products
+        return self
+
+    def _close(self) -> None:
+        """Closing the cluster of values added since the last merge."""
+
+        if not self._open_count:
+            return
+
+        count, total = self._open_count, self._open_total
+        self.clusters += 1
+        self._counts_sq += count * count
+        self._totals_sq += total * total
+        self._products += count * total
+        self._open_count = self._open_total = 0
+
+    @property
+    def mean_variance(self) -> Optional[float]:
+        """
+        Variance of the mean as a ratio estimator of a cluster sample.
+
+        The finite population correction is left out, so the variance is
+        slightly overestimated for big sample fractions. None for less
+        than two clusters.
+        """
+
+        count, total = self._open_count, self._open_total
+        clusters = self.clusters + (1 if count else 0)
+        if clusters < 2:
+            return None
+
+        # Sum of squared cluster residuals (total_i - mean * count_i) ** 2
+        mean = self.total / self.count
+        residuals = (
+            self._totals_sq
+            + total * total
+            - 2 * mean * (self._products + count * total)
+            + mean * mean * (self._counts_sq + count * count)
+        )
+        return (
+            clusters / (clusters - 1) * max(residuals, 0.0) / (self.count * self.count)
+        )
+
+    @property
+    def mean_error(self) -> Optional[float]:
+        """Half-width of the 95% confidence interval of the mean, None if unknown."""
+
+        variance = self.mean_variance
+        return None if variance is None else Z_95 * sqrt(variance)
+
+
+class GroupedAccumulator:
+    """
+    Mapping of group keys to accumulators.
+
+    Memory grows with the number of groups, not with the number of values,
+    and two grouped accumulators built from different inputs can be merged.
+    """
+
+    __slots__ = ("factory", "groups")
+
+    def __init__(self, factory: type[SumAccumulator] = SumAccumulator):
+        self.factory = factory
+        self.groups: dict[Hashable, SumAccumulator] = {}
+
+    def add(self, key: Hashable, value: int | float) -> None:
+        """
+        Adding value to the group.
+
+        Args:
+            key: Group key.
+            value: Numeric value.
+        """
+
+        accumulator = self.groups.get(key)
+        if accumulator is None:
+            accumulator = self.groups[key] = self.factory()
+        accumulator.add(value)
+
+    def merge(self, other: "GroupedAccumulator") -> "GroupedAccumulator":
+        """
+        Merging another grouped accumulator into this one.
+
+        Accumulators of `other` may be reused, so it shouldn't be
+        updated after merging.
+
+        Args:
+            other: Grouped accumulator with the same factory.
+
+        Returns:
+            This grouped accumulator.
+        """
+
+        for key, accumulator in other.groups.items():
+            own = self.groups.get(key)
+            if own is None:
+                self.groups[key] = accumulator
+            else:
+                own.merge(accumulator)
+        return self
+
+    def items(self) -> ItemsView[Hashable, SumAccumulator]:
+        """Group keys with their accumulators."""
+
+        return self.groups.items()
+
+    def __len__(self) -> int:
+        return len(self.groups)
@@ -1,4 +1,7 @@
 import argparse
+import os
+
+from .filters import Predicate, parse_predicate
 
 
 class OnceAction(argparse.Action):
@@ -10,6 +13,104 @@ class OnceAction(argparse.Action):
         setattr(namespace, self.dest, values)
 
 
+def jobs_count(value: str) -> int:
+    """
+    Converting --jobs value into number of worker processes.
+
+    Args:
+        value: Raw argument value, 0 means one worker per CPU.
+
+    Returns:
+        Number of worker processes.
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a non-negative integer.
+    """
+
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = -1
+
+    if jobs < 0:
+        error_msg = f"invalid jobs count: '{value}'"
+        raise argparse.ArgumentTypeError(error_msg)
+
+    return jobs or os.cpu_count() or 1
+
+
+def positive_int(value: str) -> int:
+    """
+    Converting argument value into positive integer.
+
+    Args:
+        value: Raw argument value.
+
+    Returns:
+        Positive integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive integer.
+    """
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        error_msg = f"invalid positive integer: '{value}'"
+        raise argparse.ArgumentTypeError(error_msg)
+
+    return number
+
+
+def sample_fraction(value: str) -> float:
+    """
+    Converting --sample value into fraction of files to read.
+
+    Args:
+        value: Raw argument value.
+
+    Returns:
+        Fraction in (0, 1].
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a number in (0, 1].
+    """
+
+    try:
+        fraction = float(value)
+    except ValueError:
+        fraction = 0.0
+
+    if not 0 < fraction <= 1:
+        error_msg = f"invalid sample fraction: '{value}'"
+        raise argparse.ArgumentTypeError(error_msg)
+
+    return fraction
+
+
+def filter_expression(value: str) -> Predicate:
+    """
+    Converting --where value into predicate.
+
+    Args:
+        value: Raw argument value like "experience_years >= 5".
+
+    Returns:
+        Predicate instance.
+
+    Raises:
+        argparse.ArgumentTypeError: If expression is malformed.
+    """
+
+    try:
+        return parse_predicate(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
 class ArgParser(argparse.ArgumentParser):
     """Parsing arguments."""
 
@@ -23,11 +124,101 @@ class ArgParser(argparse.ArgumentParser):
             nargs="+",
             required=True,
             action=OnceAction,
-            help="Path to CSV files.",
+            help="Path to CSV (.csv) or columnar (.csvb) files.",
         )
         self.add_argument(
             "--report",
+            nargs="+",
             required=True,
             action=OnceAction,
-            help="Creating <report-name> with given files.",
+            help="Creating <report-name> with given files, several reports "
+            "are created in one pass over the files.",
+        )
+        self.add_argument(
+            "--where",
+            nargs="+",
+            type=filter_expression,
+            action=OnceAction,
+            help="Keep only rows matching all expressions 'column OP value', "
+            "OP is one of ==, !=, >=, <=, >, < (e.g. 'experience_years >= 5').",
+        )
+        self.add_argument(
+            "--limit",
+            type=positive_int,
+            action=OnceAction,
+            help="Print at most <limit> rows of every report, sorted reports "
+            "keep only the top rows instead of sorting all of them.",
+        )
+        self.add_argument(
+            "--sample",
+            type=sample_fraction,
+            action=OnceAction,
+            help="Read only given fraction (0-1] of every CSV file as evenly "
+            "spread blocks of rows, aggregate reports (not ranking) show "
+            "approximate values with error bounds.",
+        )
+        self.add_argument(
+            "--server",
+            action=OnceAction,
+            help="Query report server at Unix socket path or host:port instead "
+            "of reading files in this process.",
+        )
+        self.add_argument(
+            "--jobs",
+            type=jobs_count,
+            action=OnceAction,
+            help="Number of worker processes, 0 for one per CPU (default: 1).",
+        )
+        self.add_argument(
+            "--cache-dir",
+            action=OnceAction,
+            help="Directory for cached per-file results of unchanged files.",
+        )
+        self.add_argument(
+            "--cache-size",
+            type=positive_int,
+            action=OnceAction,
+            help="Maximum cache size in MiB (default: 256).",
+        )
+        self.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Keep per-file checkpoints in --cache-dir and read only rows "
+            "appended since the last run.",
+        )
+        self.add_argument(
+            "--mmap",
+            action="store_true",
+            help="Scan memory-mapped files, decoding only used fields.",
+        )
+        self.add_argument(
+            "--chunk-size",
+            type=positive_int,
+            action=OnceAction,
+            help="Split files into chunks of given size in MiB, processed as "
+            "separate tasks (implies memory-mapped scanning of chunks).",
+        )
+        self.add_argument(
+            "--profile",
+            action="store_true",
+            help="Print time, CPU and memory per function and stage.",
+        )
+        self.add_argument(
+            "--profile-output",
+            action=OnceAction,
+            help="Write Chrome trace (.json) or cProfile stats (any other suffix).",
+        )
+        self.add_argument(
+            "--log-queue-size",
+            type=positive_int,
+            action=OnceAction,
+            help="Size of the queue of log records written in background "
+            "(default: 10000).",
+        )
+        self.add_argument(
+            "--log-overflow",
+            choices=("block", "drop"),
+            action=OnceAction,
+            help="Wait for free space or drop log records when the queue is full "
+            "(default: block).",
         )
@@ -0,0 +1,266 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+_SAMPLE_SIZE = 64 * 1024
+
+
+def file_fingerprint(file: Path) -> str:
+    """
+    Building fingerprint of file contents without reading the whole file.
+
+    Fingerprint combines resolved path, size, mtime and a hash of the first
+    and last 64 KiB, so rewritten files are detected even if mtime is kept.
+
+    Args:
+        file: Path to file.
+
+    Returns:
+        Hex digest.
+
+    Raises:
+        OSError: If file can't be read.
+    """
+
+    stat = file.stat()
+    digest = hashlib.sha256(
+        f"{file.resolve()}|{stat.st_size}|{stat.st_mtime_ns}".encode()
+    )
+
+    with open(file, "rb") as f:
+        digest.update(f.read(_SAMPLE_SIZE))
+        if stat.st_size > _SAMPLE_SIZE:
+            f.seek(max(_SAMPLE_SIZE, stat.st_size - _SAMPLE_SIZE))
+            digest.update(f.read(_SAMPLE_SIZE))
+
+    return digest.hexdigest()
+
+
+def content_digest(file: Path, offset: int) -> str:
+    """
+    Hashing the first and last 64 KiB of the first `offset` bytes of file.
+
+    Args:
+        file: Path to file.
+        offset: Number of bytes to hash samples of.
+
+    Returns:
+        Hex digest.
+
+    Raises:
+        OSError: If file can't be read.
+    """
+
+    digest = hashlib.sha256(str(offset).encode())
+
+    with open(file, "rb") as f:
+        digest.update(f.read(min(_SAMPLE_SIZE, offset)))
+        if offset > _SAMPLE_SIZE:
+            start = max(_SAMPLE_SIZE, offset - _SAMPLE_SIZE)
+            f.seek(start)
+            digest.update(f.read(offset - start))
+
+    return digest.hexdigest()
+
+
+def _load_entry(entry: Path) -> Optional[Any]:
+    """Loading pickled entry, broken entries are removed."""
+
+    try:
+        with open(entry, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        logger.warning(f"Dropping broken cache entry {entry}: {e}")
+        entry.unlink(missing_ok=True)
+        return None
+
+
+def _store_entry(entry: Path, value: Any) -> None:
+    """Pickling value into entry atomically."""
+
+    import tempfile
+
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_name, entry)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+class FileCache:
+    """
+    On-disk cache of values computed from files.
+
+    Entries are keyed by file fingerprint and a namespace (e.g. report
+    identity), so they become stale as soon as the file changes. Least
+    recently used entries are evicted when cache grows over `max_size`.
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, directory: Path, max_size: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_size = max_size
+
+    def _entry_path(self, file: Path, namespace: str) -> Optional[Path]:
+        try:
+            fingerprint = file_fingerprint(file)
+        except OSError:
+            return None
+
+        key = hashlib.sha256(f"{fingerprint}|{namespace}".encode()).hexdigest()
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, file: Path, namespace: str) -> Optional[Any]:
+        """
+        Getting cached value for the file.
+
+        Args:
+            file: Path to source file.
+            namespace: Namespace of the value.
+
+        Returns:
+            Cached value or None if there is no valid entry.
+        """
+
+        entry = self._entry_path(file, namespace)
+        if entry is None:
+            return None
+
+        value = _load_entry(entry)
+        if value is not None:
+            os.utime(entry)
+        return value
+
+    def put(self, file: Path, namespace: str, value: Any) -> None:
+        """
+        Storing value for the file.
+
+        Call `evict` after a batch of puts to keep cache size in limits.
+
+        Args:
+            file: Path to source file.
+            namespace: Namespace of the value.
+            value: Picklable value.
+        """
+
+        entry = self._entry_path(file, namespace)
+        if entry is None:
+            return
+
+        _store_entry(entry, value)
+
+    def evict(self) -> None:
+        """Removing least recently used entries over the size limit."""
+
+        entries = []
+        if not self.directory.is_dir():
+            return
+
+        for entry in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+class Checkpoint(NamedTuple):
+    """Partial report state of the file read up to `offset`."""
+
+    offset: int
+    lines: int
+    rows: int
+    digest: str
+    state: Any
+
+
+class CheckpointStore:
+    """
+    On-disk store of per-file checkpoints for incremental reports.
+
+    Entries are keyed by resolved file path and a namespace, so a file that
+    grows keeps its checkpoint. A checkpoint is dropped when the file got
+    shorter than its offset or the bytes before the offset changed.
+    """
+
+    suffix = ".checkpoint"
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def _entry_path(self, file: Path, namespace: str) -> Path:
+        key = hashlib.sha256(f"{file.resolve()}|{namespace}".encode()).hexdigest()
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, file: Path, namespace: str) -> Optional[Checkpoint]:
+        """
+        Getting checkpoint still matching the file.
+
+        Args:
+            file: Path to source file.
+            namespace: Namespace of the state.
+
+        Returns:
+            Checkpoint or None if there is none or file was truncated
+            or rewritten.
+        """
+
+        checkpoint = _load_entry(self._entry_path(file, namespace))
+        if checkpoint is None:
+            return None
+
+        try:
+            valid = file.stat().st_size >= checkpoint.offset and (
+                content_digest(file, checkpoint.offset) == checkpoint.digest
+            )
+        except OSError:
+            return None
+
+        if not valid:
+            logger.info(f"File {file} was truncated or rewritten, reading it again")
+            return None
+
+        return checkpoint
+
+    def put(
+        self, file: Path, namespace: str, offset: int, lines: int, rows: int, state: Any
+    ) -> None:
+        """
+        Storing checkpoint for the file.
+
+        Args:
+            file: Path to source file.
+            namespace: Namespace of the state.
+            offset: Record boundary the file was read up to.
+            lines: Number of lines before offset.
+            rows: Number of rows before offset.
+            state: Picklable report state of rows before offset.
+        """
+
+        try:
+            digest = content_digest(file, offset)
+        except OSError:
+            return
+
+        checkpoint = Checkpoint(offset, lines, rows, digest, state)
+        _store_entry(self._entry_path(file, namespace), checkpoint)
@@ -1,33 +1,211 @@
-from tabulate import tabulate
+import sys
+from collections.abc import Sequence
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, Optional, TextIO
+from unicodedata import combining, east_asian_width
 
 from .logger import log
+from .shortcuts import coerce_number
 
+SAMPLE_SIZE = 1000
+# Rendered lines (rows and borders) written at once
+CHUNK_LINES = 1000
 
-@log
-def print_table(data: list[dict], title: str = "") -> None:
+# Column types, a column gets the most generic type of its values
+_NONE, _INT, _FLOAT, _STR = range(4)
+
+# Space between column text and borders, as in tabulate
+_MIN_PADDING = 2
+
+# East Asian widths of characters taking two terminal cells
+_WIDE = ("W", "F")
+
+
+@log(max_repr=200)
+def print_table(
+    data: Iterable[dict],
+    title: str = "",
+    sample_size: int = SAMPLE_SIZE,
+    output: Optional[TextIO] = None,
+) -> None:
     """
     Printing data as a table to console.
 
+    The table is rendered in the "grid" format of tabulate row by row and
+    written in chunks, so output starts right away and is never held as
+    one string. Column widths and types are measured over all rows when
+    data is a sequence (a pass without rendering), and over the first
+    `sample_size` rows of other iterables; wider values of later rows
+    overflow their cells instead of being cut.
+
     Args:
-        data: List of dictionaries to display.
+        data: Dictionaries to display, a list or any iterable.
         title: Optional title for the table.
+        sample_size: Number of rows of an iterable to measure columns on.
+        output: Stream to write to (default: stdout).
     """
 
-    if not data:
-        print("No data to display.")
+    output = output or sys.stdout
+
+    if isinstance(data, Sequence):
+        sample, rest = data, iter(())
+    else:
+        rows = iter(data)
+        sample = list(islice(rows, sample_size))
+        rest = rows
+
+    if not sample:
+        print("No data to display.", file=output)
         return
 
     if title:
-        print(f"\n{title}")
-        print("=" * len(title))
-
-    print(
-        tabulate(
-            data,
-            headers="keys",
-            tablefmt="grid",
-            numalign="right",
-            stralign="left",
+        print(f"\n{title}", file=output)
+        print("=" * _text_width(title), file=output)
+
+    chunk = []
+    for line in _iter_table_lines(sample, rest):
+        chunk.append(line)
+        if len(chunk) >= CHUNK_LINES:
+            chunk.append("")
+            output.write("\n".join(chunk))
+            chunk = []
+
+    chunk.append("")
+    output.write("\n".join(chunk))
+    print(file=output)
+
+
+def _value_type(value: Any) -> int:
+    if value is None or value == "":
+        return _NONE
+    if isinstance(value, bool):
+        return _STR
+
+    number = coerce_number(value)
+    if number is None:
+        return _STR
+    return _INT if isinstance(number, int) else _FLOAT
+
+
+def _format_value(value: Any, column_type: int) -> str:
+    if value is None or value == "":
+        return ""
+    if column_type == _FLOAT:
+        return format(float(value), "g")
+    return str(value)
+
+
+def _text_width(text: str) -> int:
+    return max(map(_line_width, text.split("\n")))
+
+
+def _line_width(line: str) -> int:
+    """
+    Measuring line in terminal cells.
+
+    Wide characters (e.g. CJK) take two cells and combining characters
+    take none, as in tabulate with wcwidth.
+    """
+
+    if line.isascii():
+        return len(line)
+
+    return sum(
+        2 if east_asian_width(char) in _WIDE else 0 if combining(char) else 1
+        for char in line
+    )
+
+
+def _measure_column(values: list[Any]) -> tuple[int, int]:
+    """
+    Finding column type and width of its widest formatted value.
+
+    Distinct values are measured once, they are keyed by type as well,
+    since e.g. 4 and 4.0 are equal but may change the column type.
+
+    Args:
+        values: Column values.
+
+    Returns:
+        Tuple of (column type, width).
+    """
+
+    try:
+        distinct = [value for _, value in set(zip(map(type, values), values))]
+    except TypeError:
+        distinct = values
+
+    column_type = max(map(_value_type, distinct), default=_NONE)
+    texts = [_format_value(value, column_type) for value in distinct]
+    return column_type, _text_width("\n".join(texts))
+
+
+def _iter_table_lines(sample: Iterable[dict], rest: Iterator[dict]) -> Iterator[str]:
+    """
+    Rendering table lines with columns measured on the sample.
+
+    Args:
+        sample: Rows to measure columns on, rendered first.
+        rest: Rows rendered after the sample.
+
+    Yields:
+        Table lines without line breaks.
+    """
+
+    keys: dict[str, None] = {}
+    for row in sample:
+        keys.update(dict.fromkeys(row))
+    headers = list(keys)
+
+    types, widths = [], []
+    for header in headers:
+        column_type, width = _measure_column([row.get(header) for row in sample])
+        types.append(column_type)
+        widths.append(max(_text_width(header) + _MIN_PADDING, width))
+
+    right = [column_type in (_INT, _FLOAT) for column_type in types]
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+
+    yield separator
+    yield from _render_row(headers, widths, right)
+    yield separator.replace("-", "=")
+
+    for row in chain(sample, rest):
+        cells = [
+            _format_value(row.get(key), column_type)
+            for key, column_type in zip(headers, types)
+        ]
+        yield from _render_row(cells, widths, right)
+        yield separator
+
+
+def _render_row(cells: list[str], widths: list[int], right: list[bool]) -> list[str]:
+    """Rendering one row, cells with line breaks take several lines."""
+
+    if not any("\n" in cell for cell in cells):
+        return [_render_line(cells, widths, right)]
+
+    cell_lines = [cell.split("\n") for cell in cells]
+    height = max(map(len, cell_lines))
+    for lines in cell_lines:
+        lines.extend([""] * (height - len(lines)))
+
+    return [_render_line(line, widths, right) for line in zip(*cell_lines)]
+
+
+def _render_line(cells: Iterable[str], widths: list[int], right: list[bool]) -> str:
+    return (
+        "| "
+        + " | ".join(
+            _pad(cell, width, align) for cell, width, align in zip(cells, widths, right)
         )
+        + " |"
     )
-    print()
+
+
+def _pad(cell: str, width: int, right: bool) -> str:
+    """Padding cell to width in terminal cells."""
+
+    if not cell.isascii():
+        width += len(cell) - _line_width(cell)
+    return cell.rjust(width) if right else cell.ljust(width)
@@ -0,0 +1,84 @@
+"""
+Client of the report server, see `core.server` for the protocol.
+
+Kept apart from the server, so querying doesn't import asyncio and the
+report pipeline.
+"""
+
+import json
+import socket
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+
+def parse_address(address: str) -> str | tuple[str, int]:
+    """
+    Parsing server address.
+
+    Args:
+        address: Path to Unix socket or "host:port" of TCP server.
+
+    Returns:
+        Socket path or tuple of (host, port).
+    """
+
+    host, separator, port = address.rpartition(":")
+    if separator and host and "/" not in address and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def query_server(
+    address: str | tuple[str, int],
+    files: Sequence[Path],
+    report_names: Sequence[str],
+    timeout: Optional[float] = None,
+    where: Sequence[str] = (),
+    limit: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Querying running report server.
+
+    Args:
+        address: Path to Unix socket or tuple of (host, port).
+        files: Paths to files, sent as absolute paths.
+        report_names: Names of reports registered on the server.
+        timeout: Optional socket timeout in seconds.
+        where: Filter expressions rows must match.
+        limit: Optional maximum number of rows of every report.
+
+    Returns:
+        Server response.
+
+    Raises:
+        OSError: If server can't be reached.
+        ValueError: If server answers with an error.
+    """
+
+    request = {
+        "files": [str(Path(file).resolve()) for file in files],
+        "reports": list(report_names),
+        "where": list(where),
+        "limit": limit,
+    }
+
+    if isinstance(address, tuple):
+        connection = socket.create_connection(address, timeout)
+    else:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        connection.connect(address)
+
+    with connection, connection.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode() + b"\n")
+        stream.flush()
+        line = stream.readline()
+
+    if not line:
+        error_msg = "Report server closed connection without response"
+        raise ValueError(error_msg)
+
+    response = json.loads(line)
+    if "error" in response:
+        raise ValueError(response["error"])
+    return response
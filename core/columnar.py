@@ -0,0 +1,379 @@
+"""
+Binary columnar format for loaded CSV data (.csvb).
+
+Layout (native byte order, recorded in the footer):
+
+    b"CSVB" version(u32)
+    column blocks, each aligned to 8 bytes:
+        numeric column: array("q") or array("d") items
+        string column: array("I") codes, then UTF-8 dictionary values
+            separated by NUL bytes
+    footer: JSON with row count and per-column type, offsets, min and max
+    footer size (u64 little-endian) b"CSVB"
+
+Columns are read back as memoryviews over the memory-mapped file, so
+nothing but the footer and string dictionaries is parsed.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, Sequence
+
+from .csv_tools import CsvReader
+from .filters import Predicate
+from .logger import log
+from .table import DictColumn, Table
+
+COLUMNAR_SUFFIX = ".csvb"
+MAGIC = b"CSVB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sI")
+_TRAILER = struct.Struct("<Q4s")
+_ALIGNMENT = 8
+_SEPARATOR = "\0"
+
+
+class ColumnarReader:
+    """
+    Reading columnar files through memory mapping.
+
+    Has the same reading interface as CsvReader, so both can be used
+    by the pipeline. Rows hold typed values (int, float, str).
+    """
+
+    def __init__(self, file: Path):
+        self.file = file
+        self.rows_read = 0
+
+    def _check_file(self) -> None:
+        """
+        Checking if columnar file exists and has a .csvb suffix.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file is not a columnar file.
+        """
+
+        if not self.file.is_file():
+            error_msg = f"File {self.file} does not exist!"
+            raise FileNotFoundError(error_msg)
+
+        if not self.file.suffix == COLUMNAR_SUFFIX:
+            error_msg = f"File {self.file} is not a columnar file!"
+            raise ValueError(error_msg)
+
+    def _map(self) -> tuple[mmap.mmap, dict[str, Any]]:
+        """
+        Memory-mapping file and reading its footer.
+
+        Returns:
+            Tuple of (memory map, footer).
+
+        Raises:
+            ValueError: If file is not a valid columnar file.
+        """
+
+        self._check_file()
+        error_msg = f"File {self.file} is not a valid columnar file!"
+
+        with open(self.file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size + _TRAILER.size:
+                raise ValueError(error_msg)
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version = _HEADER.unpack_from(buffer, 0)
+            footer_size, end_magic = _TRAILER.unpack_from(buffer, size - _TRAILER.size)
+            if magic != MAGIC or end_magic != MAGIC or version != VERSION:
+                raise ValueError(error_msg)
+
+            footer_end = size - _TRAILER.size
+            footer = json.loads(buffer[footer_end - footer_size : footer_end])
+        except (ValueError, struct.error) as e:
+            buffer.close()
+            raise ValueError(error_msg) from e
+
+        if footer["byteorder"] != sys.byteorder:
+            buffer.close()
+            error_msg = f"File {self.file} was written with another byte order!"
+            raise ValueError(error_msg)
+
+        return buffer, footer
+
+    @property
+    def stats(self) -> dict[str, tuple[Any, Any]]:
+        """Minimum and maximum value of every column, from the footer."""
+
+        buffer, footer = self._map()
+        buffer.close()
+        return {
+            column["name"]: (column["min"], column["max"])
+            for column in footer["columns"]
+        }
+
+    @log
+    def load_table(self, columns: Optional[Sequence[str]] = None) -> Table:
+        """
+        Loading columnar file as a table backed by the memory map.
+
+        Numeric columns and dictionary codes are not copied, the file stays
+        mapped while the table is referenced.
+
+        Args:
+            columns: Column names to load (default: all columns).
+
+        Returns:
+            Table instance.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file is not a valid columnar file or has no
+                requested column.
+        """
+
+        buffer, footer = self._map()
+        by_name = {column["name"]: column for column in footer["columns"]}
+        names = list(by_name) if columns is None else list(columns)
+
+        missing = [name for name in names if name not in by_name]
+        if missing:
+            buffer.close()
+            error_msg = (
+                f"Columnar file {self.file} has no columns: {', '.join(missing)}"
+            )
+            raise ValueError(error_msg)
+
+        view = memoryview(buffer)
+        table = {}
+        for name in names:
+            column = by_name[name]
+            data = view[column["offset"] : column["offset"] + column["size"]]
+            if column["type"] == "dict":
+                values_end = column["values_offset"] + column["values_size"]
+                values = bytes(view[column["values_offset"] : values_end])
+                table[name] = DictColumn(
+                    (
+                        values.decode("utf-8").split(_SEPARATOR)
+                        if column["values_count"]
+                        else []
+                    ),
+                    data.cast("I"),
+                )
+            else:
+                table[name] = data.cast(column["type"])
+
+        return Table(table)
+
+    @log
+    def iter_rows(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[Sequence[Predicate]] = None,
+    ) -> Iterator[dict]:
+        """
+        Loading columnar file rows.
+
+        Args:
+            columns: Column names to keep in yielded rows (default: all).
+            where: Optional predicates rows must match, tested on column
+                values before rows are built.
+
+        Returns:
+            Iterator over rows as dictionaries.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file is not a valid columnar file or has no
+                requested or filter column.
+        """
+
+        if not where:
+            return self._stream_rows(self.load_table(columns).iter_rows())
+
+        loaded = None
+        if columns is not None:
+            loaded = list(dict.fromkeys([*columns, *(p.column for p in where)]))
+
+        return self._stream_rows(self.load_table(loaded).iter_rows(columns, where))
+
+    def _stream_rows(self, rows: Iterator[dict]) -> Iterator[dict]:
+        self.rows_read = 0
+        for row in rows:
+            self.rows_read += 1
+            yield row
+
+
+def open_reader(file: Path, use_mmap: bool = False) -> CsvReader | ColumnarReader:
+    """
+    Creating reader for the file by its suffix.
+
+    Args:
+        file: Path to CSV or columnar file.
+        use_mmap: Whether to scan memory-mapped CSV file.
+
+    Returns:
+        ColumnarReader for .csvb files, CsvReader otherwise.
+    """
+
+    if file.suffix == COLUMNAR_SUFFIX:
+        return ColumnarReader(file)
+    return CsvReader(file, use_mmap=use_mmap)
+
+
+def _column_block(values: Sequence[Any]) -> tuple[str, bytes, bytes, Any, Any]:
+    """
+    Encoding table column.
+
+    Args:
+        values: array("q"), array("d") or DictColumn.
+
+    Returns:
+        Tuple of (type, data, dictionary values, minimum, maximum).
+
+    Raises:
+        TypeError: If column type is not supported.
+        ValueError: If string value contains a NUL character.
+    """
+
+    if isinstance(values, array) and values.typecode in ("q", "d"):
+        minimum, maximum = (min(values), max(values)) if values else (None, None)
+        return values.typecode, values.tobytes(), b"", minimum, maximum
+
+    if isinstance(values, memoryview) and values.format in ("q", "d"):
+        minimum, maximum = (min(values), max(values)) if values else (None, None)
+        return values.format, values.tobytes(), b"", minimum, maximum
+
+    if not isinstance(values, DictColumn):
+        error_msg = f"Unsupported column type: {type(values).__name__}"
+        raise TypeError(error_msg)
+
+    text = _SEPARATOR.join(values.values)
+    if text.count(_SEPARATOR) != max(len(values.values) - 1, 0):
+        error_msg = "String values can't contain NUL characters"
+        raise ValueError(error_msg)
+
+    codes = values.codes
+    if not isinstance(codes, array) or codes.typecode != "I":
+        codes = array("I", codes)
+
+    minimum, maximum = (
+        (min(values.values), max(values.values)) if values.values else (None, None)
+    )
+    return "dict", codes.tobytes(), text.encode("utf-8"), minimum, maximum
+
+
+def _write_block(f: BinaryIO, block: bytes) -> tuple[int, int]:
+    """Writing block aligned to 8 bytes, returns its (offset, size)."""
+
+    f.write(b"\0" * (-f.tell() % _ALIGNMENT))
+    offset = f.tell()
+    f.write(block)
+    return offset, len(block)
+
+
+@log
+def write_table(table: Table, file: Path) -> None:
+    """
+    Writing table to columnar file atomically.
+
+    Args:
+        table: Table with numeric array and dictionary-encoded columns.
+        file: Output path.
+
+    Raises:
+        TypeError: If table has a column of unsupported type.
+        ValueError: If string value contains a NUL character.
+    """
+
+    columns = []
+    temp_file = file.with_name(f".{file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file, "xb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION))
+
+            for name, values in table.columns.items():
+                column_type, data, dictionary, minimum, maximum = _column_block(values)
+                offset, size = _write_block(f, data)
+                column = {
+                    "name": name,
+                    "type": column_type,
+                    "offset": offset,
+                    "size": size,
+                    "min": minimum,
+                    "max": maximum,
+                }
+                if column_type == "dict":
+                    offset, size = _write_block(f, dictionary)
+                    column["values_offset"] = offset
+                    column["values_size"] = size
+                    column["values_count"] = len(values.values)
+                columns.append(column)
+
+            footer = json.dumps(
+                {"byteorder": sys.byteorder, "rows": len(table), "columns": columns}
+            ).encode("utf-8")
+            f.write(footer)
+            f.write(_TRAILER.pack(len(footer), MAGIC))
+        os.replace(temp_file, file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
+@log
+def convert_csv(
+    file: Path,
+    output: Optional[Path] = None,
+    columns: Optional[Sequence[str]] = None,
+    delimiter: str = ",",
+) -> Path:
+    """
+    Validating CSV file and converting it into columnar file.
+
+    Args:
+        file: Path to CSV file.
+        output: Output path (default: CSV path with .csvb suffix).
+        columns: Column names to keep (default: all columns).
+        delimiter: CSV delimiter.
+
+    Returns:
+        Path to columnar file.
+
+    Raises:
+        FileNotFoundError: If csv file does not exist.
+        ValueError: If file is not a csv file.
+        csv.Error: If file validation fails.
+    """
+
+    output = output or file.with_suffix(COLUMNAR_SUFFIX)
+    table = CsvReader(file, delimiter=delimiter).load_table(columns)
+    write_table(table, output)
+    return output
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Converting CSV files given in command line."""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Converting CSV files into columnar files (.csvb)."
+    )
+    parser.add_argument("files", nargs="+", help="Path to CSV files.")
+    parser.add_argument("--columns", nargs="+", help="Columns to keep.")
+    args = parser.parse_args(argv)
+
+    for file in args.files:
+        output = convert_csv(Path(file), columns=args.columns)
+        print(f"CSV file {file} converted to {output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,53 @@
 import csv
+import mmap
+import os
+from contextlib import closing
+from operator import itemgetter
 from pathlib import Path
+from typing import Callable, Iterator, Optional, Sequence
 
+from .filters import Predicate, compile_filter
 from .logger import log
+from .scanner import (
+    NEWLINE,
+    count_bytes,
+    iter_records,
+    last_record_boundary,
+    next_record_boundary,
+)
+from .table import Table
+
+# (start, end, lines before start), lines are None if unknown
+ByteRange = tuple[int, int, Optional[int]]
+
+SAMPLE_BLOCK_SIZE = 64 * 1024
+# Bytes read past a sampled block to find record boundaries around it
+SAMPLE_LOOKAHEAD = 4 * 1024
+# Records that must parse with the header's field count after a guessed boundary
+PROBE_RECORDS = 4
 
 
 class CsvReader:
-    def __init__(self, file: Path, delimiter: str = ","):
+    """
+    Reading and validating CSV files.
+
+    With `use_mmap` the file is memory-mapped and scanned as raw bytes,
+    only fields kept in yielded rows are decoded.
+    """
+
+    def __init__(self, file: Path, delimiter: str = ",", use_mmap: bool = False):
         self.file = file
         self.delimiter = delimiter
+        self.use_mmap = use_mmap
+        self.rows_read = 0
 
-    @property
-    @log
-    def check_csv_file_valid(self) -> str:
+    def _check_file(self) -> None:
         """
-        Checking if csv file exists.
-
-        Returns:
-            Valid log info-string.
+        Checking if csv file exists and has a csv suffix.
 
         Raises:
             FileNotFoundError: If csv file does not exist.
             ValueError: If file is not a csv file.
-            csv.Error: If file validation fails.
         """
 
         if not self.file.is_file():
@@ -32,26 +58,25 @@ class CsvReader:
             error_msg = f"File {self.file} is not a CSV file!"
             raise ValueError(error_msg)
 
-        with open(self.file, "r", encoding="utf-8") as csvfile:
-            reader = csv.reader(csvfile, delimiter=self.delimiter)
-            header = next(reader)
-            header_count = len(header)
-            rows = list(reader)
+    @property
+    @log
+    def check_csv_file_valid(self) -> str:
+        """
+        Checking if csv file exists.
 
-            if len(rows) == 0:
-                error_msg = f"CSV file {self.file} is empty!"
-                raise csv.Error(error_msg)
+        Returns:
+            Valid log info-string.
 
-            for row in rows:
-                if len(row) != header_count:
-                    error_msg = f"More or less columns than headers in row: {row}"
-                    raise csv.Error(error_msg)
-                for value in row:
-                    if not value:
-                        error_msg = f"Empty value in row: {row}"
-                        raise csv.Error(error_msg)
+        Raises:
+            FileNotFoundError: If csv file does not exist.
+            ValueError: If file is not a csv file.
+            csv.Error: If file validation fails.
+        """
+
+        for _ in self.iter_rows():
+            pass
 
-            return f"CSV file {self.file} is valid with {len(rows)} rows."
+        return f"CSV file {self.file} is valid with {self.rows_read} rows."
 
     @property
     @log
@@ -67,3 +92,505 @@ class CsvReader:
             data = list(reader)
 
         return data
+
+    @log
+    def load_table(self, columns: Optional[Sequence[str]] = None) -> Table:
+        """
+        Validating and loading CSV file into a columnar table.
+
+        Args:
+            columns: Column names to keep (default: all columns).
+
+        Returns:
+            Table with typed numeric and dictionary-encoded string columns.
+        """
+
+        return Table.from_rows(self.iter_rows(columns), columns)
+
+    @log
+    def split_ranges(self, chunk_size: int) -> list[ByteRange]:
+        """
+        Splitting CSV file into byte ranges aligned to record boundaries.
+
+        Quoted fields are tracked by quote parity, so line breaks inside them
+        (e.g. in multiline skills) never split a record.
+
+        Args:
+            chunk_size: Approximate size of each range in bytes.
+
+        Returns:
+            List of (start, end, lines before start) tuples covering all rows.
+
+        Raises:
+            FileNotFoundError: If csv file does not exist.
+            ValueError: If file is not a csv file.
+            csv.Error: If file is empty or its header is broken.
+        """
+
+        self._check_file()
+        delimiter = self.delimiter.encode("utf-8")
+        ranges = []
+
+        with open(self.file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    try:
+                        _, start, lines = next(iter_records(buffer, 0, size, delimiter))
+                    except ValueError as e:
+                        raise csv.Error(f"CSV file {self.file}: {e}") from e
+
+                    ranges = _split(buffer, start, size, lines, chunk_size)
+
+        if not ranges:
+            error_msg = f"CSV file {self.file} is empty!"
+            raise csv.Error(error_msg)
+
+        return ranges
+
+    @log
+    def sample_ranges(
+        self, fraction: float, block_size: int = SAMPLE_BLOCK_SIZE
+    ) -> list[ByteRange]:
+        """
+        Choosing evenly spread byte ranges covering a fraction of CSV file.
+
+        Only the header and the chosen blocks of about `block_size` bytes
+        are read: the file is seeked to every block and the record boundary
+        after its offset is guessed as the first line break followed by
+        records with as many fields as the header. Skipped blocks are never
+        read.
+
+        Lines before a block are unknown after a skipped one, so rows of
+        such blocks are located in errors by their line after the block
+        start, e.g. "line 3 after byte 65536".
+
+        Args:
+            fraction: Fraction of blocks to keep, in (0, 1].
+            block_size: Approximate size of each range in bytes.
+
+        Returns:
+            List of (start, end, lines before start or None) tuples, at
+            least one.
+
+        Raises:
+            FileNotFoundError: If csv file does not exist.
+            ValueError: If file is not a csv file or fraction is not in (0, 1].
+            csv.Error: If file is empty or its header is broken.
+        """
+
+        if not 0 < fraction <= 1:
+            error_msg = f"Sample fraction must be in (0, 1], got {fraction}"
+            raise ValueError(error_msg)
+
+        self._check_file()
+        delimiter = self.delimiter.encode("utf-8")
+        ranges: list[ByteRange] = []
+
+        with open(self.file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            data, stop = _read_to_boundary(f, 0, 0, size)
+            try:
+                header, _, lines = next(iter_records(data, 0, len(data), delimiter))
+            except StopIteration:
+                header, lines = [], 0
+            except ValueError as e:
+                raise csv.Error(f"CSV file {self.file}: {e}") from e
+
+            data_start = stop
+            blocks = max(1, -(-(size - data_start) // block_size))
+            count = max(1, round(blocks * fraction))
+            step = blocks / count
+
+            for i in range(count):
+                offset = data_start + int(i * step) * block_size
+                if offset > stop:
+                    start = _find_boundary(f, offset, size, delimiter, len(header))
+                    lines = None
+                else:
+                    start = stop
+                if start is None or start >= size:
+                    continue
+
+                data, stop = _read_to_boundary(f, start, offset + block_size, size)
+                ranges.append((start, stop, lines))
+                if lines is not None:
+                    lines += data.count(NEWLINE)
+
+        if not ranges:
+            error_msg = f"CSV file {self.file} is empty!"
+            raise csv.Error(error_msg)
+
+        return ranges
+
+    @log
+    def unread_ranges(
+        self, offset: int = 0, lines: int = 0, chunk_size: Optional[int] = None
+    ) -> tuple[list[ByteRange], ByteRange]:
+        """
+        Splitting part of CSV file after offset into complete records and tail.
+
+        Tail is the last record without a trailing line break, which may still
+        be being appended, so it is read but not remembered as read.
+
+        Args:
+            offset: Record boundary to start from, 0 for the first row.
+            lines: Number of lines before offset.
+            chunk_size: Optional approximate size of each range in bytes
+                (default: one range).
+
+        Returns:
+            Tuple of (ranges of complete records, tail range), tail is empty
+            (start == end) if the file ends with a line break.
+
+        Raises:
+            FileNotFoundError: If csv file does not exist.
+            ValueError: If file is not a csv file.
+            csv.Error: If file has no rows or its header is broken.
+        """
+
+        self._check_file()
+        delimiter = self.delimiter.encode("utf-8")
+        from_start = not offset
+        ranges: list[ByteRange] = []
+        tail: ByteRange = (offset, offset, lines)
+
+        with open(self.file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    if from_start:
+                        try:
+                            _, offset, lines = next(
+                                iter_records(buffer, 0, size, delimiter)
+                            )
+                        except ValueError as e:
+                            raise csv.Error(f"CSV file {self.file}: {e}") from e
+
+                    end = last_record_boundary(buffer, offset, size)
+                    ranges = _split(buffer, offset, end, lines, chunk_size)
+                    lines += count_bytes(buffer, NEWLINE, offset, end)
+                    tail = (end, size, lines)
+
+        if from_start and not ranges and tail[0] == tail[1]:
+            error_msg = f"CSV file {self.file} is empty!"
+            raise csv.Error(error_msg)
+
+        return ranges, tail
+
+    @log
+    def iter_rows(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        byte_range: Optional[ByteRange] = None,
+        where: Optional[Sequence[Predicate]] = None,
+    ) -> Iterator[dict[str, str]]:
+        """
+        Validating and loading CSV file in a single streaming pass.
+
+        Each row is checked before it is yielded, so the first invalid row
+        stops the iteration. `rows_read` holds the number of yielded rows.
+
+        Args:
+            columns: Column names to keep in yielded rows (default: all).
+                Other fields are validated but never put into dictionaries.
+            byte_range: Optional range from `split_ranges` to read only its
+                rows, memory-mapped file is scanned in this case and line
+                numbers in errors stay global (relative to the range start
+                if lines before it are unknown).
+            where: Optional predicates rows must match, tested on raw fields
+                of validated rows; other rows are never decoded or yielded.
+
+        Returns:
+            Iterator over rows as dictionaries.
+
+        Raises:
+            FileNotFoundError: If csv file does not exist.
+            ValueError: If file is not a csv file.
+            csv.Error: If file validation fails or file has no requested
+                or filter column (raised while iterating).
+        """
+
+        self._check_file()
+        return self._stream_rows(columns, byte_range, where)
+
+    def _stream_rows(
+        self,
+        columns: Optional[Sequence[str]],
+        byte_range: Optional[ByteRange],
+        where: Optional[Sequence[Predicate]] = None,
+    ) -> Iterator[dict[str, str]]:
+        self.rows_read = 0
+        records_read = 0
+        decode = self.use_mmap or byte_range is not None
+        empty = b"" if decode else ""
+        records = self._scan_records(byte_range) if decode else self._read_records()
+
+        with closing(records):
+            header, _ = next(records, ([], 0))
+            if decode:
+                header = [name.decode("utf-8") for name in header]
+            header_count = len(header)
+            names, pick = self._projection(header, columns)
+            matches = self._row_filter(header, where, decode)
+
+            for row, line_num in records:
+                if len(row) != header_count:
+                    error_msg = (
+                        f"More or less columns than headers in row "
+                        f"(line {line_num}): {_as_text(row)}"
+                    )
+                    raise csv.Error(error_msg)
+                if empty in row:
+                    error_msg = f"Empty value in row (line {line_num}): {_as_text(row)}"
+                    raise csv.Error(error_msg)
+
+                records_read += 1
+                if matches is not None and not matches(row):
+                    continue
+
+                self.rows_read += 1
+                values = pick(row)
+                if decode:
+                    values = [value.decode("utf-8") for value in values]
+                yield dict(zip(names, values))
+
+        if records_read == 0 and byte_range is None:
+            error_msg = f"CSV file {self.file} is empty!"
+            raise csv.Error(error_msg)
+
+    def _read_records(self) -> Iterator[tuple[list[str], int]]:
+        """
+        Reading records through text-mode file and csv module.
+
+        Yields:
+            Tuples of (fields, line number of the record end).
+        """
+
+        with open(self.file, "r", encoding="utf-8", newline="") as csvfile:
+            reader = csv.reader(csvfile, delimiter=self.delimiter)
+            for row in reader:
+                yield row, reader.line_num
+
+    def _scan_records(
+        self, byte_range: Optional[ByteRange] = None
+    ) -> Iterator[tuple[list[bytes], int | str]]:
+        """
+        Scanning raw records of memory-mapped file.
+
+        Args:
+            byte_range: Optional range to scan after the header.
+
+        Yields:
+            Tuples of (raw fields, line number of the record end),
+            header record goes first. Line numbers of a range with unknown
+            lines before it are counted from its start, e.g.
+            "3 after byte 65536".
+
+        Raises:
+            csv.Error: If file ends inside a quoted field.
+        """
+
+        delimiter = self.delimiter.encode("utf-8")
+
+        with open(self.file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                start, end, line_num = 0, len(buffer), 0
+                block_start = None
+                try:
+                    if byte_range is not None:
+                        header, _, _ = next(iter_records(buffer, 0, end, delimiter))
+                        yield header, 1
+                        start, end, line_num = byte_range
+                        if line_num is None:
+                            block_start, line_num = start, 0
+
+                    for fields, _, lines in iter_records(buffer, start, end, delimiter):
+                        line_num += lines
+                        if block_start is None:
+                            yield fields, line_num
+                        else:
+                            yield fields, f"{line_num} after byte {block_start}"
+                except ValueError as e:
+                    raise csv.Error(f"CSV file {self.file}: {e}") from e
+
+    def _projection(
+        self, header: list[str], columns: Optional[Sequence[str]]
+    ) -> tuple[Sequence[str], Callable[[list[str]], Sequence[str]]]:
+        """
+        Building names and field picker for the requested columns.
+
+        Args:
+            header: CSV header.
+            columns: Requested column names, None for all columns.
+
+        Returns:
+            Tuple of (column names, function picking their fields from row).
+
+        Raises:
+            csv.Error: If header has no requested column.
+        """
+
+        if columns is None:
+            return header, _identity
+
+        missing = [name for name in columns if name not in header]
+        if missing:
+            error_msg = f"CSV file {self.file} has no columns: {', '.join(missing)}"
+            raise csv.Error(error_msg)
+
+        indices = [header.index(name) for name in columns]
+        if len(indices) > 1:
+            return columns, itemgetter(*indices)
+
+        return columns, lambda row: [row[index] for index in indices]
+
+    def _row_filter(
+        self, header: list[str], where: Optional[Sequence[Predicate]], raw: bool
+    ) -> Optional[Callable[[list[str] | list[bytes]], bool]]:
+        """
+        Compiling predicates into a test of row fields.
+
+        Args:
+            header: CSV header.
+            where: Predicates, None or empty for no filter.
+            raw: Whether fields are undecoded bytes.
+
+        Returns:
+            Test of row fields, None without predicates.
+
+        Raises:
+            csv.Error: If header has no filter column.
+        """
+
+        if not where:
+            return None
+
+        missing = [p.column for p in where if p.column not in header]
+        if missing:
+            error_msg = f"CSV file {self.file} has no columns: {', '.join(missing)}"
+            raise csv.Error(error_msg)
+
+        return compile_filter(where, header, raw)
+
+
+def _split(
+    buffer, start: int, end: int, lines: int, chunk_size: Optional[int]
+) -> list[ByteRange]:
+    """Splitting buffer[start:end] into ranges aligned to record boundaries."""
+
+    ranges = []
+    while start < end:
+        stop = end
+        if chunk_size is not None:
+            stop = next_record_boundary(buffer, start, start + chunk_size, end)
+        ranges.append((start, stop, lines))
+        lines += count_bytes(buffer, NEWLINE, start, stop)
+        start = stop
+
+    return ranges
+
+
+def _read_to_boundary(f, start: int, pos: int, size: int) -> tuple[bytes, int]:
+    """
+    Reading file from a record boundary up to the next one at or after pos.
+
+    Args:
+        f: Binary file.
+        start: Record boundary to read from, quotes are counted from it.
+        pos: Offset the boundary must not precede.
+        size: File size.
+
+    Returns:
+        Tuple of (bytes between start and the boundary, boundary offset).
+    """
+
+    length = max(pos - start, 0) + SAMPLE_LOOKAHEAD
+    while True:
+        f.seek(start)
+        data = f.read(length)
+        boundary = next_record_boundary(data, 0, min(pos - start, len(data)), len(data))
+        if boundary < len(data) or start + len(data) >= size:
+            return data[:boundary], start + boundary
+        length *= 2
+
+
+def _find_boundary(
+    f, pos: int, size: int, delimiter: bytes, field_count: int
+) -> Optional[int]:
+    """
+    Guessing the first record boundary after pos without reading before it.
+
+    A line break is taken for a boundary if records after it have as many
+    fields as the header, a line break inside a quoted field almost never
+    passes as the quotes of the following lines are paired the other way.
+
+    Args:
+        f: Binary file.
+        pos: Offset to search from.
+        size: File size.
+        delimiter: Field delimiter.
+        field_count: Number of header fields.
+
+    Returns:
+        Boundary offset, None if none is found.
+    """
+
+    length = SAMPLE_LOOKAHEAD
+    while True:
+        f.seek(pos)
+        data = f.read(length)
+        at_end = pos + len(data) >= size
+        candidate = data.find(NEWLINE) + 1
+        while candidate:
+            verdict = _probe_records(data, candidate, delimiter, field_count, at_end)
+            if verdict:
+                return pos + candidate
+            if verdict is None:
+                break
+            candidate = data.find(NEWLINE, candidate) + 1
+
+        if at_end:
+            return None
+        length *= 2
+
+
+def _probe_records(
+    data: bytes, start: int, delimiter: bytes, field_count: int, at_end: bool
+) -> Optional[bool]:
+    """
+    Checking whether data[start:] begins with well-formed records.
+
+    Returns:
+        True if the first records have field_count fields, False if not,
+        None if data ends before enough records are checked.
+    """
+
+    end = len(data) if at_end else data.rfind(NEWLINE) + 1
+    checked = 0
+    try:
+        for fields, _, _ in iter_records(data, start, end, delimiter):
+            if len(fields) != field_count:
+                return False
+            checked += 1
+            if checked == PROBE_RECORDS:
+                return True
+    except ValueError:
+        # Unpaired quote, either a misread quoted field or one cut by data end
+        return False if at_end or not checked else True
+
+    return True if at_end else None
+
+
+def _identity(row: list[str]) -> list[str]:
+    return row
+
+
+def _as_text(row: list[str] | list[bytes]) -> list[str]:
+    return [
+        value.decode("utf-8", "replace") if isinstance(value, bytes) else value
+        for value in row
+    ]
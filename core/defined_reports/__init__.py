@@ -1,3 +1,9 @@
-__all__ = ("AveragePerformanceReport",)
+__all__ = (
+    "AveragePerformanceReport",
+    "PerformanceDistributionReport",
+    "PerformanceRankingReport",
+)
 
+from .dev_distribution import PerformanceDistributionReport
 from .dev_performance import AveragePerformanceReport
+from .dev_ranking import PerformanceRankingReport
@@ -0,0 +1,153 @@
+from math import sqrt
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from core import (
+    AggregateReport,
+    ClusterAccumulator,
+    GroupedAccumulator,
+    TDigest,
+    coerce_number,
+    log,
+)
+from core.aggregation import Z_95
+from core.sorting import sort_rows
+
+if TYPE_CHECKING:
+    from core import TableIndex
+
+# Report columns with their quantiles
+QUANTILES = {"median": 0.5, "p90": 0.9, "p99": 0.99}
+
+
+class SampledDigest:
+    """T-digest of sampled values with statistics of their sampled blocks."""
+
+    __slots__ = ("digest", "blocks")
+
+    def __init__(self):
+        self.digest = TDigest()
+        self.blocks = ClusterAccumulator()
+
+    def add(self, value: int | float) -> None:
+        self.digest.add(value)
+        self.blocks.add(value)
+
+    def merge(self, other: "SampledDigest") -> "SampledDigest":
+        self.digest.merge(other.digest)
+        self.blocks.merge(other.blocks)
+        return self
+
+    @property
+    def count(self) -> int:
+        return self.digest.count
+
+    def quantile_error(self, q: float) -> Optional[float]:
+        """
+        Estimating half-width of the 95% confidence interval of a quantile.
+
+        The interval is read from the digest between quantiles q - z * se
+        and q + z * se, where se is the standard error of the share of
+        values below the quantile, inflated by the design effect of the
+        mean of sampled blocks (values within a block are correlated).
+
+        Args:
+            q: Quantile in [0, 1].
+
+        Returns:
+            Half-width, None if values come from a single block.
+        """
+
+        mean_variance = self.blocks.mean_variance
+        if mean_variance is None:
+            return None
+
+        count, variance = self.blocks.count, self.blocks.variance
+        design_effect = mean_variance * count / variance if variance else 1.0
+        error = Z_95 * sqrt(q * (1 - q) / count * design_effect)
+
+        lower = self.digest.quantile(max(q - error, 0.0))
+        upper = self.digest.quantile(min(q + error, 1.0))
+        return (upper - lower) / 2
+
+
+class PerformanceDistributionReport(AggregateReport):
+    """
+    Report for performance percentiles by dev's position.
+
+    Every position keeps a t-digest of its performances, so memory per
+    position is bounded however many rows there are, and digests of files
+    and chunks are merged like other report states.
+    """
+
+    columns = ("position", "performance")
+
+    @property
+    def factory(self) -> type[TDigest] | type[SampledDigest]:
+        """Digest of positions, with statistics of blocks in approximate mode."""
+
+        return SampledDigest if self.approximate else TDigest
+
+    def create_state(self) -> GroupedAccumulator:
+        return GroupedAccumulator(self.factory)
+
+    def update(self, state: GroupedAccumulator, row: dict[str, Any]) -> None:
+        performance = coerce_number(row["performance"])
+
+        if performance is not None:
+            state.add(row["position"], performance)
+
+    def state_from_index(
+        self, index: "TableIndex", where: Optional[Mapping[str, Any]] = None
+    ) -> Optional[GroupedAccumulator]:
+        # Pre-aggregated groups are not sampled blocks
+        if self.approximate:
+            return None
+        return index.aggregate("position", "performance", where, TDigest)
+
+    @log
+    def finalize(self, state: GroupedAccumulator) -> list[dict[str, Any]]:
+        """
+        Generating report with developers performance percentiles by position.
+
+        Percentiles of positions with a few dozen values are exact (up to
+        interpolation between neighbouring values), larger groups are
+        estimated by their digests. In approximate mode every percentile
+        is followed by its error, e.g. "median_error", the half-width of
+        its 95% confidence interval (None if values come from a single
+        block).
+
+        Args:
+            state: Performance digests grouped by position.
+
+        Returns:
+            List of dictionaries with positions and their median, p90 and
+            p99 performances, sorted by median(desc), first `limit` of them
+            if set.
+        """
+
+        report_data = (
+            self._report_row(position, digest) for position, digest in state.items()
+        )
+
+        return list(
+            sort_rows(
+                report_data, key=itemgetter("median"), reverse=True, limit=self.limit
+            )
+        )
+
+    def _report_row(
+        self, position: str, digest: TDigest | SampledDigest
+    ) -> dict[str, Any]:
+        if not self.approximate:
+            return {
+                "position": position,
+                **{name: round(digest.quantile(q), 2) for name, q in QUANTILES.items()},
+            }
+
+        row: dict[str, Any] = {"position": position}
+        for name, q in QUANTILES.items():
+            row[name] = round(digest.digest.quantile(q), 2)
+            error = digest.quantile_error(q)
+            row[f"{name}_error"] = None if error is None else round(error, 2)
+        return row
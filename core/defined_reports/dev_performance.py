@@ -1,44 +1,90 @@
-from collections import defaultdict
-from typing import Any
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
-from core import BaseReport, convert_to_number, is_numeric, log
+from core import (
+    AggregateReport,
+    ClusterAccumulator,
+    GroupedAccumulator,
+    SumAccumulator,
+    Table,
+    coerce_number,
+    log,
+)
+from core.sorting import sort_rows
 
+if TYPE_CHECKING:
+    from core import TableIndex
 
-class AveragePerformanceReport(BaseReport):
+
+class AveragePerformanceReport(AggregateReport):
     """Report for average performances by dev's position."""
 
+    columns = ("position", "performance")
+
+    @property
+    def factory(self) -> type[SumAccumulator]:
+        """Accumulator of positions, of sampled blocks in approximate mode."""
+
+        return ClusterAccumulator if self.approximate else SumAccumulator
+
+    def create_state(self) -> GroupedAccumulator:
+        return GroupedAccumulator(self.factory)
+
+    def update(self, state: GroupedAccumulator, row: dict[str, Any]) -> None:
+        performance = coerce_number(row["performance"])
+
+        if performance is not None:
+            state.add(row["position"], performance)
+
+    def state_from_table(self, table: Table) -> Optional[GroupedAccumulator]:
+        from core import vectorized
+
+        if self.approximate or not vectorized.HAS_NUMPY:
+            return None
+        return vectorized.grouped_sums(table, "position", "performance")
+
+    def state_from_index(
+        self, index: "TableIndex", where: Optional[Mapping[str, Any]] = None
+    ) -> Optional[GroupedAccumulator]:
+        # Pre-aggregated groups are not sampled blocks
+        if self.approximate:
+            return None
+        return index.aggregate("position", "performance", where)
+
     @log
-    def generate(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def finalize(self, state: GroupedAccumulator) -> list[dict[str, Any]]:
         """
         Generating report with developers performance by position.
 
+        In approximate mode rows also have "error", the half-width of the
+        95% confidence interval of the average, estimated from differences
+        between sampled blocks (None if values come from a single block).
+
         Args:
-            data: List of dictionaries with products data.
+            state: Performance accumulators grouped by position.
 
         Returns:
-            List of dictionaries with brands and their avf ratings,
-            sorted by rating(desc).
+            List of dictionaries with positions and their avg performances,
+            sorted by performance(desc), first `limit` of them if set.
         """
 
-        position_perf = defaultdict(list)
-
-        for developer in data:
-            position = developer["position"]
-            performance = developer["performance"]
+        report_data = (
+            self._report_row(position, accumulator)
+            for position, accumulator in state.items()
+        )
 
-            if not is_numeric(performance):
-                continue
-
-            performance = convert_to_number(performance)
-            position_perf[position].append(performance)
-
-        report_data = []
-        for position, performances in position_perf.items():
-            avg_performance = sum(performances) / len(performances)
-            report_data.append(
-                {"position": position, "performance": round(avg_performance, 2)}
+        return list(
+            sort_rows(
+                report_data,
+                key=itemgetter("performance"),
+                reverse=True,
+                limit=self.limit,
             )
+        )
 
-        report_data.sort(key=lambda x: x["performance"], reverse=True)
-
-        return report_data
+    def _report_row(self, position: str, accumulator: SumAccumulator) -> dict[str, Any]:
+        row = {"position": position, "performance": round(accumulator.mean, 2)}
+        if self.approximate:
+            error = accumulator.mean_error
+            row["error"] = None if error is None else round(error, 2)
+        return row
@@ -0,0 +1,44 @@
+from operator import itemgetter
+from typing import Any, Iterable
+
+from core import BaseReport, coerce_number, log
+from core.sorting import external_sort, top_k
+
+
+class PerformanceRankingReport(BaseReport):
+    """Report with every developer ranked by performance."""
+
+    columns = ("name", "position", "performance")
+
+    @log(max_repr=200)
+    def generate(self, data: Iterable[dict[str, Any]]) -> Iterable[dict[str, Any]]:
+        """
+        Generating report with developers sorted by performance.
+
+        Rows are sorted with bounded memory, spilling sorted runs to
+        temporary files, or only the first `limit` rows are kept in a heap.
+
+        Args:
+            data: Iterable of dictionaries with developers, consumed once.
+
+        Returns:
+            Dictionaries with developers' names, positions and performances,
+            sorted by performance(desc): a list of the first `limit` of them
+            if set, an iterator over all of them otherwise. Rows with
+            performance that is not a number are skipped.
+        """
+
+        rows = (
+            {
+                "name": row["name"],
+                "position": row["position"],
+                "performance": performance,
+            }
+            for row in data
+            if (performance := coerce_number(row["performance"])) is not None
+        )
+
+        key = itemgetter("performance")
+        if self.limit is not None:
+            return top_k(rows, self.limit, key, reverse=True)
+        return external_sort(rows, key, reverse=True)
@@ -0,0 +1,196 @@
+"""
+Row filters given as "column OP value" expressions.
+
+Examples: "team == Backend Team", "experience_years >= 5",
+"name != 'Bob'". Values that look like numbers are compared as numbers,
+quoted values are always compared as strings. Predicates are compiled once
+into a function testing raw CSV fields, so readers can drop rows before
+they are decoded or put into dictionaries.
+"""
+
+import operator
+import re
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Sequence
+
+from .shortcuts import coerce_number
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+_EXPRESSION = re.compile(
+    r"^\s*([^=!<>\s][^=!<>]*?)\s*(==|!=|>=|<=|>|<|=)\s*(.*?)\s*$", re.DOTALL
+)
+_QUOTES = ("'", '"')
+
+
+class Predicate(NamedTuple):
+    """Comparison of column values with a constant."""
+
+    column: str
+    operator: str
+    value: str | int | float
+
+    def __str__(self) -> str:
+        return f"{self.column} {self.operator} {self.value!r}"
+
+
+def parse_predicate(expression: str) -> Predicate:
+    """
+    Parsing filter expression.
+
+    Args:
+        expression: Expression like "experience_years >= 5", "=" is the
+            same as "==".
+
+    Returns:
+        Predicate instance.
+
+    Raises:
+        ValueError: If expression is malformed.
+    """
+
+    match = _EXPRESSION.match(expression)
+    if match is None or not match.group(3):
+        error_msg = (
+            f"Invalid filter '{expression}', expected 'column OP value' "
+            f"with OP one of: {', '.join(OPERATORS)}"
+        )
+        raise ValueError(error_msg)
+
+    column, op, text = match.groups()
+    if op == "=":
+        op = "=="
+
+    value: str | int | float
+    if len(text) > 1 and text[0] in _QUOTES and text[-1] == text[0]:
+        value = text[1:-1]
+    else:
+        number = coerce_number(text)
+        value = text if number is None else number
+
+    return Predicate(column, op, value)
+
+
+def filter_key(predicates: Optional[Sequence[Predicate]]) -> str:
+    """
+    Building canonical text of predicates, e.g. for cache namespaces.
+
+    Args:
+        predicates: Predicates combined with AND.
+
+    Returns:
+        Text of sorted predicates, empty without predicates.
+    """
+
+    return " & ".join(sorted(map(str, predicates or ())))
+
+
+def _compile_predicate(
+    predicate: Predicate, index: int, raw: bool
+) -> Callable[[Sequence[Any]], bool]:
+    compare = OPERATORS[predicate.operator]
+    value = predicate.value
+
+    if isinstance(value, str):
+        if raw:
+            value = value.encode("utf-8")
+
+        def test(row: Sequence[Any]) -> bool:
+            try:
+                return compare(row[index], value)
+            except TypeError:
+                return False
+
+        return test
+
+    def test_number(row: Sequence[Any]) -> bool:
+        # float accepts bytes as well, values that aren't numbers never match
+        try:
+            return compare(float(row[index]), value)
+        except ValueError:
+            return False
+
+    return test_number
+
+
+def compile_filter(
+    predicates: Sequence[Predicate], names: Sequence[str], raw: bool = False
+) -> Callable[[Sequence[Any]], bool]:
+    """
+    Compiling predicates into a single test of row fields.
+
+    Args:
+        predicates: Predicates combined with AND.
+        names: Column names in order of row fields.
+        raw: Whether fields are undecoded UTF-8 bytes.
+
+    Returns:
+        Function telling whether row fields match all predicates.
+
+    Raises:
+        ValueError: If there is no predicate column in names.
+    """
+
+    missing = [p.column for p in predicates if p.column not in names]
+    if missing:
+        error_msg = f"Unknown filter columns: {', '.join(dict.fromkeys(missing))}"
+        raise ValueError(error_msg)
+
+    indices = {name: index for index, name in reversed(list(enumerate(names)))}
+    tests = [_compile_predicate(p, indices[p.column], raw) for p in predicates]
+
+    if len(tests) == 1:
+        return tests[0]
+
+    def test_all(row: Sequence[Any]) -> bool:
+        for test in tests:
+            if not test(row):
+                return False
+        return True
+
+    return test_all
+
+
+def may_match(
+    predicates: Sequence[Predicate], stats: Mapping[str, tuple[Any, Any]]
+) -> bool:
+    """
+    Checking if any row may match predicates, by column minimum and maximum.
+
+    Args:
+        predicates: Predicates combined with AND.
+        stats: Minimum and maximum of columns (None for empty columns),
+            e.g. `ColumnarReader.stats`.
+
+    Returns:
+        False if no row can match, True if some may.
+    """
+
+    for predicate in predicates:
+        minimum, maximum = stats.get(predicate.column, (None, None))
+        value = predicate.value
+
+        comparable = minimum is not None and (
+            isinstance(value, str) == isinstance(minimum, str)
+        )
+        if not comparable:
+            continue
+
+        op = predicate.operator
+        if (
+            (op == "==" and not minimum <= value <= maximum)
+            or (op == "!=" and minimum == maximum == value)
+            or (op == ">=" and maximum < value)
+            or (op == ">" and maximum <= value)
+            or (op == "<=" and minimum > value)
+            or (op == "<" and minimum >= value)
+        ):
+            return False
+
+    return True
@@ -0,0 +1,194 @@
+from array import array
+from copy import copy
+from typing import Any, Hashable, Mapping, Optional, Sequence
+
+from .aggregation import GroupedAccumulator, SumAccumulator
+from .logger import log
+from .shortcuts import coerce_number
+from .table import DictColumn, Table
+
+
+class GroupIndex:
+    """
+    Row ids of every distinct key of the table's key columns.
+
+    Keys are tuples of values of the key columns, row ids of every key are
+    kept in ascending order in array("I").
+    """
+
+    __slots__ = ("columns", "groups")
+
+    def __init__(self, columns: tuple[str, ...], groups: dict[tuple, array]):
+        self.columns = columns
+        self.groups = groups
+
+    @classmethod
+    @log
+    def from_table(cls, table: Table, columns: Sequence[str]) -> "GroupIndex":
+        """
+        Building index over key columns of the table.
+
+        Dictionary-encoded columns are grouped by their integer codes, so
+        string values are looked up once per group rather than per row.
+
+        Args:
+            table: Table to index.
+            columns: Key column names.
+
+        Returns:
+            GroupIndex instance.
+
+        Raises:
+            KeyError: If table has no key column.
+        """
+
+        key_columns = [table.column(name) for name in columns]
+        codes = [
+            column.codes if isinstance(column, DictColumn) else column
+            for column in key_columns
+        ]
+
+        rows: dict[tuple, array] = {}
+        for row_id, key in enumerate(zip(*codes)):
+            row_ids = rows.get(key)
+            if row_ids is None:
+                row_ids = rows[key] = array("I")
+            row_ids.append(row_id)
+
+        groups = {}
+        for key, row_ids in rows.items():
+            values = tuple(
+                column.values[code] if isinstance(column, DictColumn) else code
+                for column, code in zip(key_columns, key)
+            )
+            groups[values] = row_ids
+
+        return cls(tuple(columns), groups)
+
+    def rows(self, key: tuple) -> array:
+        """
+        Getting row ids of the key.
+
+        Args:
+            key: Tuple of key column values.
+
+        Returns:
+            Row ids, empty for unknown keys.
+        """
+
+        return self.groups.get(key, array("I"))
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+
+class TableIndex:
+    """
+    Group indexes and pre-aggregated groups of a table.
+
+    Indexes and aggregates are built on first use and kept, so repeated
+    grouped queries take time proportional to the number of groups rather
+    than to the number of rows.
+    """
+
+    def __init__(self, table: Table):
+        self.table = table
+        self._indexes: dict[tuple[str, ...], GroupIndex] = {}
+        self._aggregates: dict[tuple, dict[tuple, SumAccumulator]] = {}
+
+    def group_index(self, columns: Sequence[str]) -> GroupIndex:
+        """
+        Getting index over key columns, building it on first use.
+
+        Args:
+            columns: Key column names.
+
+        Returns:
+            GroupIndex instance.
+
+        Raises:
+            KeyError: If table has no key column.
+        """
+
+        columns = tuple(columns)
+        index = self._indexes.get(columns)
+        if index is None:
+            index = self._indexes[columns] = GroupIndex.from_table(self.table, columns)
+        return index
+
+    def aggregate(
+        self,
+        by: str,
+        value: str,
+        where: Optional[Mapping[str, Hashable]] = None,
+        factory: type[SumAccumulator] = SumAccumulator,
+    ) -> GroupedAccumulator:
+        """
+        Aggregating numeric column grouped by another column.
+
+        Groups are pre-aggregated once by `by` and the `where` columns, then
+        matching groups are copied into the result. Values that are not
+        numeric are skipped.
+
+        Args:
+            by: Column to group by.
+            value: Column with values to aggregate.
+            where: Optional column values rows must be equal to.
+            factory: Accumulator class of groups.
+
+        Returns:
+            New grouped accumulator, it can be updated or merged freely.
+
+        Raises:
+            KeyError: If table has no requested column.
+        """
+
+        where = dict(where or {})
+        filter_columns = tuple(sorted(where))
+        columns = (by, *filter_columns)
+
+        key = (columns, value, factory)
+        aggregates = self._aggregates.get(key)
+        if aggregates is None:
+            aggregates = self._aggregates[key] = self._pre_aggregate(
+                columns, value, factory
+            )
+
+        expected = tuple(where[name] for name in filter_columns)
+        result = GroupedAccumulator(factory)
+        for (group, *filter_values), accumulator in aggregates.items():
+            if tuple(filter_values) != expected:
+                continue
+
+            own = result.groups.get(group)
+            if own is None:
+                result.groups[group] = copy(accumulator)
+            else:
+                own.merge(accumulator)
+
+        return result
+
+    def _pre_aggregate(
+        self, columns: tuple[str, ...], value: str, factory: type[SumAccumulator]
+    ) -> dict[tuple, SumAccumulator]:
+        """Building accumulator of every group of the key columns."""
+
+        values: Sequence[Any] = self.table.column(value)
+        index = self.group_index(columns)
+
+        if isinstance(values, DictColumn):
+            # Only distinct values are parsed
+            numbers = [coerce_number(text) for text in values.values]
+            values = [numbers[code] for code in values.codes]
+
+        aggregates = {}
+        for key, row_ids in index.groups.items():
+            accumulator = factory()
+            for row_id in row_ids:
+                number = values[row_id]
+                if number is not None:
+                    accumulator.add(number)
+            if accumulator.count:
+                aggregates[key] = accumulator
+
+        return aggregates
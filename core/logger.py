@@ -1,8 +1,100 @@
-import inspect
+import atexit
 import logging
+import os
+import time
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Callable, Optional
+from queue import Empty, SimpleQueue
+from types import GeneratorType
+from typing import Any, Callable, Optional
+
+from . import profiling
+
+LOG_BATCH_SIZE = 512
+OVERFLOW_POLICIES = ("block", "drop")
+
+_listener: Optional["_BatchQueueListener"] = None
+
+# Loggers of decorated functions and whether any of them logs DEBUG records
+# or a profiler is active, decorated calls skip both checks otherwise
+_wrapped_loggers: set[logging.Logger] = set()
+_instrumented = True
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler leaving flushes to the queue listener while it runs."""
+
+    buffered = True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if not self.buffered:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler blocking or dropping records when the queue is full.
+
+    SimpleQueue is used as it is much cheaper to put into than Queue,
+    so the size limit is checked with `qsize` and may be exceeded slightly
+    by concurrent threads.
+    """
+
+    def __init__(self, log_queue: SimpleQueue, maxsize: int = 0, block: bool = True):
+        super().__init__(log_queue)
+        self.maxsize = maxsize
+        self.block = block
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue stays in the process, so the record is not copied or
+        # formatted here, only arguments are merged before they change
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.maxsize and self.queue.qsize() >= self.maxsize:
+            if not self.block:
+                self.dropped += 1
+                return
+            while self.queue.qsize() >= self.maxsize:
+                time.sleep(0.001)
+
+        self.queue.put(record)
+
+
+class _BatchQueueListener(QueueListener):
+    """Queue listener handling records in batches and flushing once per batch."""
+
+    def _monitor(self) -> None:
+        stopped = False
+
+        while not stopped:
+            batch = [self.dequeue(True)]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.dequeue(False))
+                except Empty:
+                    break
+
+            for record in batch:
+                if record is self._sentinel:
+                    stopped = True
+                else:
+                    self.handle(record)
+
+            for handler in self.handlers:
+                handler.flush()
 
 
 def setup_logging(
@@ -10,17 +102,37 @@ def setup_logging(
     log_to_file: bool = True,
     log_to_console: bool = False,
     log_dir: str = "logs",
+    queue_size: Optional[int] = None,
+    overflow: str = "block",
 ) -> None:
     """
     Configuring logging for the application.
 
+    With `queue_size` set, loggers only put records into a queue and
+    handlers run in a background thread, which writes records to the file
+    in batches. Call `stop_logging` to write the remaining records, it is
+    also called at exit.
+
     Args:
         level: Logging level (default: DEBUG).
         log_to_file: Whether to log to file (default: True).
         log_to_console: Whether to log to console (default: False).
         log_dir: Directory for log files (default: "logs").
+        queue_size: Optional size of the queue of records, 0 for unbounded
+            (default: handlers are called synchronously).
+        overflow: What to do when the queue is full, "block" to wait for
+            free space or "drop" to discard records (default: "block").
+
+    Raises:
+        ValueError: If overflow policy is unknown.
     """
 
+    if overflow not in OVERFLOW_POLICIES:
+        error_msg = f"Unknown overflow policy: {overflow}"
+        raise ValueError(error_msg)
+
+    stop_logging()
+
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
     formatter = logging.Formatter(
@@ -32,6 +144,7 @@ def setup_logging(
     root_logger.setLevel(level)
 
     root_logger.handlers = []
+    handlers: list[logging.Handler] = []
 
     if log_to_file:
         from datetime import datetime
@@ -39,16 +152,127 @@ def setup_logging(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_path / f"app_{timestamp}.log"
 
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        handler_class = (
+            logging.FileHandler if queue_size is None else _BufferedFileHandler
+        )
+        file_handler = handler_class(log_file, encoding="utf-8")
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     if log_to_console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if queue_size is None or not handlers:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        return
+
+    global _listener
+
+    log_queue: SimpleQueue = SimpleQueue()
+    root_logger.addHandler(
+        _BoundedQueueHandler(log_queue, queue_size, overflow == "block")
+    )
+    _listener = _BatchQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """
+    Writing queued log records and stopping the background thread, if any.
+
+    The queue handler is replaced with the handlers it fed, so records
+    logged afterwards are handled synchronously.
+    """
+
+    global _listener
+
+    if _listener is None:
+        return
+
+    listener = _listener
+    _listener = None
+
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if not isinstance(handler, _BoundedQueueHandler):
+            continue
+
+        if handler.dropped:
+            record = logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": f"{handler.dropped} log records dropped, queue was full",
+                }
+            )
+            handler.dropped = 0
+            listener.queue.put(record)
+
+        root_logger.removeHandler(handler)
+
+    # Records queued before the swap are still written by the listener
+    for handler in listener.handlers:
+        if isinstance(handler, _BufferedFileHandler):
+            handler.buffered = False
+        root_logger.addHandler(handler)
+
+    listener.stop()
+
+
+def _lock_handlers() -> None:
+    """Flushing and locking queued handlers, so a forked child gets empty buffers."""
+
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.acquire()
+            handler.flush()
+
+
+def _unlock_handlers() -> None:
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.release()
+
+
+def _restart_listener_in_child() -> None:
+    """Starting own listener in forked child, e.g. a worker process."""
+
+    global _listener
+
+    if _listener is None:
+        return
+
+    # Handler locks are already reinitialized by logging in the child
+    log_queue: SimpleQueue = SimpleQueue()
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, _BoundedQueueHandler):
+            handler.queue = log_queue
+            handler.dropped = 0
+
+    _listener = _BatchQueueListener(
+        log_queue, *_listener.handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+    # Workers leave with os._exit, skipping atexit
+    from multiprocessing.util import Finalize
+
+    Finalize(None, stop_logging, exitpriority=0)
+
+
+atexit.register(stop_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_lock_handlers,
+        after_in_parent=_unlock_handlers,
+        after_in_child=_restart_listener_in_child,
+    )
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -65,10 +289,40 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def refresh_instrumentation() -> None:
+    """
+    Updating the flag checked by decorated functions on every call.
+
+    Called when logging levels change (logging clears its level cache then)
+    and when a profiler starts or stops.
+    """
+
+    global _instrumented
+
+    _instrumented = profiling.active_profiler is not None or any(
+        logger.isEnabledFor(logging.DEBUG) for logger in _wrapped_loggers
+    )
+
+
+def _clear_cache_and_refresh(clear_cache: Callable[[], None]) -> Callable[[], None]:
+    @wraps(clear_cache)
+    def wrapper() -> None:
+        clear_cache()
+        refresh_instrumentation()
+
+    return wrapper
+
+
+_manager = logging.Logger.manager
+_manager._clear_cache = _clear_cache_and_refresh(_manager._clear_cache)
+
+
 def _get_function_info(func: Callable) -> tuple[str, int]:
     """
     Extract function location information.
 
+    Line is taken from the code object, so no source file is read.
+
     Args:
         func: Function to extract info from.
 
@@ -78,10 +332,8 @@ def _get_function_info(func: Callable) -> tuple[str, int]:
 
     func_module = func.__module__.split(".")[-1]
 
-    try:
-        func_line = inspect.getsourcelines(func)[1]
-    except (OSError, TypeError):
-        func_line = 0
+    code = getattr(func, "__code__", None)
+    func_line = code.co_firstlineno if code is not None else 0
 
     return func_module, func_line
 
@@ -111,42 +363,139 @@ def _get_doc_first_line(func: Callable) -> str:
     return func.__name__
 
 
+def _summarize_arg(value: Any, max_repr: int) -> str:
+    """
+    Building a short representation of an argument for logging.
+
+    Args:
+        value: Argument value.
+        max_repr: Maximum length of the representation.
+
+    Returns:
+        Summary like "list[15000 dicts]" for large collections,
+        truncated repr otherwise.
+    """
+
+    if isinstance(value, (list, tuple, set, frozenset, dict)) and len(value) > 10:
+        first = next(iter(value))
+        return f"{type(value).__name__}[{len(value)} {type(first).__name__}s]"
+
+    text = repr(value)
+    if len(text) > max_repr:
+        return f"{text[:max_repr]}..."
+
+    return text
+
+
+def _format_args(args: tuple, kwargs: dict, max_repr: Optional[int]) -> str:
+    """
+    Formatting call arguments for logging.
+
+    Args:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+        max_repr: Maximum length of each argument representation,
+            None to log full representations.
+
+    Returns:
+        Formatted arguments string.
+    """
+
+    if max_repr is None:
+        return f"args={args}, kwargs={kwargs}"
+
+    args_repr = ", ".join(_summarize_arg(arg, max_repr) for arg in args)
+    kwargs_repr = ", ".join(
+        f"{key}={_summarize_arg(value, max_repr)}" for key, value in kwargs.items()
+    )
+    return f"args=({args_repr}), kwargs={{{kwargs_repr}}}"
+
+
+def _profile_call(
+    profiler: profiling.Profiler,
+    func_identifier: str,
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+) -> Any:
+    """Measuring call, and iteration over the generator it returns."""
+
+    with profiler.stage(func_identifier):
+        result = func(*args, **kwargs)
+
+    if isinstance(result, GeneratorType):
+        return profiler.iterate(f"{func_identifier} iteration", result)
+    return result
+
+
 def _create_wrapper(
-    func: Callable, logger: logging.Logger, func_module: str, func_line: int
+    func: Callable,
+    logger: logging.Logger,
+    func_module: str,
+    func_line: int,
+    max_repr: Optional[int] = None,
 ) -> Callable:
     """
     Creating wrapper function for logging.
 
+    Docstring and identifier are resolved once here. While no decorated
+    function logs DEBUG records and no profiler is active, calls only check
+    a cached flag and log exceptions. Calls are measured when there is an
+    active profiler, iteration over returned generators separately as
+    "<function> iteration".
+
     Args:
         func: Function to wrap.
         logger: Logger instance to use.
         func_module: Module name.
         func_line: Line number.
+        max_repr: Maximum length of logged argument representations.
 
     Returns:
         Wrapped function.
     """
 
+    func_identifier = f"{func_module}:{func_line} {func.__qualname__}"
+    start_msg = f"[{func_identifier}] Start {_get_doc_first_line(func)}"
+    complete_msg = f"[{func_identifier}] Completed successfully"
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        doc_first_line = _get_doc_first_line(func)
-        func_identifier = f"{func_module}:{func_line} {func.__qualname__}"
-
-        logger.debug(f"[{func_identifier}] Start {doc_first_line}")
-        logger.debug(f"[{func_identifier}] args={args}, kwargs={kwargs}")
+        if not _instrumented:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.exception(f"[{func_identifier}] Exception raised: {str(e)}")
+                raise
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(start_msg)
+            logger.debug(f"[{func_identifier}] {_format_args(args, kwargs, max_repr)}")
 
         try:
-            result = func(*args, **kwargs)
-            logger.debug(f"[{func_identifier}] Completed successfully")
-            return result
+            profiler = profiling.active_profiler
+            if profiler is None:
+                result = func(*args, **kwargs)
+            else:
+                result = _profile_call(profiler, func_identifier, func, args, kwargs)
         except Exception as e:
             logger.exception(f"[{func_identifier}] Exception raised: {str(e)}")
             raise
 
+        if debug:
+            logger.debug(complete_msg)
+        return result
+
     return wrapper
 
 
-def log(_func: Optional[Callable] = None, *, logger: Optional[logging.Logger] = None):
+def log(
+    _func: Optional[Callable] = None,
+    *,
+    logger: Optional[logging.Logger] = None,
+    max_repr: Optional[int] = None,
+):
     """
     Decorating function for logging purposes.
 
@@ -160,9 +509,15 @@ def log(_func: Optional[Callable] = None, *, logger: Optional[logging.Logger] =
         @log(logger=custom_logger)
         def func(): ...
 
+        @log(max_repr=100)
+        def func(data): ...
+
     Args:
         _func: Function to decorate
         logger: Optional logger instance (default: module logger)
+        max_repr: Optional maximum length of each logged argument; large
+            collections are summarized as "list[15000 dicts]"
+            (default: full representation)
 
     Returns:
         Decorated function
@@ -175,7 +530,11 @@ def log(_func: Optional[Callable] = None, *, logger: Optional[logging.Logger] =
         if logger is None:
             logger = get_logger(func.__module__)
 
-        return _create_wrapper(func, logger, func_module, func_line)
+        if logger not in _wrapped_loggers:
+            _wrapped_loggers.add(logger)
+            refresh_instrumentation()
+
+        return _create_wrapper(func, logger, func_module, func_line, max_repr)
 
     if _func is None:
         return decorator_log
@@ -0,0 +1,421 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence
+
+from . import profiling
+from .columnar import COLUMNAR_SUFFIX, ColumnarReader
+from .csv_tools import SAMPLE_BLOCK_SIZE, ByteRange, CsvReader
+from .filters import Predicate, filter_key, may_match
+from .logger import log
+from .reports import AggregateReport, CombinedReport
+
+if TYPE_CHECKING:
+    from .cache import CheckpointStore, FileCache
+
+
+def stream_files(
+    readers: list[CsvReader | ColumnarReader],
+    columns: Optional[Sequence[str]] = None,
+    where: Optional[Sequence[Predicate]] = None,
+    sample: Optional[float] = None,
+) -> Iterator[dict[str, str]]:
+    """
+    Streaming validated rows from all files one after another.
+
+    Args:
+        readers: CsvReader or ColumnarReader instances to read from.
+        columns: Column names to keep in rows (default: all columns).
+        where: Optional predicates rows must match; columnar files whose
+            column minimum and maximum can't match are skipped.
+        sample: Optional fraction of every CSV file to read, see
+            `CsvReader.sample_ranges`; columnar files are read fully.
+
+    Yields:
+        Rows as dictionaries.
+    """
+
+    for reader in readers:
+        if where and isinstance(reader, ColumnarReader):
+            if not may_match(where, reader.stats):
+                reader.rows_read = 0
+                continue
+
+        if sample is None or isinstance(reader, ColumnarReader):
+            yield from reader.iter_rows(columns, where=where)
+            continue
+
+        rows_read = 0
+        for byte_range in reader.sample_ranges(sample):
+            yield from reader.iter_rows(columns, byte_range, where)
+            rows_read += reader.rows_read
+        reader.rows_read = rows_read
+
+
+def aggregate_file(
+    file: Path,
+    report: AggregateReport,
+    use_mmap: bool = False,
+    byte_range: Optional[ByteRange] = None,
+    where: Optional[Sequence[Predicate]] = None,
+) -> tuple[Path, Any, int]:
+    """
+    Validating file and reducing it to a partial report state.
+
+    Args:
+        file: Path to CSV file.
+        report: Report to build the state for.
+        use_mmap: Whether to scan memory-mapped file.
+        byte_range: Optional range of the file to read, see
+            `CsvReader.split_ranges`.
+        where: Optional predicates rows must match. Columnar files are
+            not read if their column minimum and maximum can't match.
+
+    Returns:
+        Tuple of (file, partial state, number of matching rows).
+    """
+
+    stage_name = f"aggregate {file}"
+    if byte_range is not None:
+        stage_name += f" [{byte_range[0]}:{byte_range[1]}]"
+
+    with profiling.stage(stage_name):
+        if file.suffix == COLUMNAR_SUFFIX:
+            return _aggregate_columnar(file, report, where)
+
+        reader = CsvReader(file, use_mmap=use_mmap)
+        rows = reader.iter_rows(report.columns, byte_range, where)
+        state = report.accumulate(rows)
+
+    return file, state, reader.rows_read
+
+
+def _aggregate_columnar(
+    file: Path, report: AggregateReport, where: Optional[Sequence[Predicate]]
+) -> tuple[Path, Any, int]:
+    reader = ColumnarReader(file)
+    if not where:
+        # Columnar files are passed as tables, so reports can be vectorized
+        table = reader.load_table(report.columns)
+        return file, report.accumulate(table), len(table)
+
+    if not may_match(where, reader.stats):
+        return file, report.create_state(), 0
+
+    state = report.accumulate(reader.iter_rows(report.columns, where))
+    return file, state, reader.rows_read
+
+
+def _aggregate_file_profiled(
+    file: Path,
+    report: AggregateReport,
+    use_mmap: bool,
+    byte_range: Optional[ByteRange],
+    where: Optional[Sequence[Predicate]],
+    trace_memory: bool,
+) -> tuple[tuple[Path, Any, int], dict[str, list[float]], list[dict]]:
+    """Running aggregate_file in a worker with its own profiler."""
+
+    profiler = profiling.Profiler(trace_memory).start()
+    try:
+        result = aggregate_file(file, report, use_mmap, byte_range, where)
+    finally:
+        profiler.stop()
+
+    return result, profiler.stats, profiler.events
+
+
+def report_cache_key(
+    report: AggregateReport,
+    where: Optional[Sequence[Predicate]] = None,
+    sample: Optional[float] = None,
+    block_size: int = SAMPLE_BLOCK_SIZE,
+) -> str:
+    """
+    Building cache namespace for partial states of the report.
+
+    Args:
+        report: Report instance.
+        where: Optional predicates the states are filtered by.
+        sample: Optional fraction of files the states are built from.
+        block_size: Size of sampled blocks in bytes, other sizes select
+            other blocks.
+
+    Returns:
+        Namespace string, combined reports join namespaces of their reports.
+    """
+
+    if sample is not None:
+        key = report_cache_key(report, where)
+        return f"{key}|sample {sample:g} of {block_size} B blocks"
+
+    if where:
+        return f"{report_cache_key(report)}|where {filter_key(where)}"
+
+    if isinstance(report, CombinedReport):
+        return "+".join(map(report_cache_key, report.reports))
+
+    report_class = type(report)
+    key = f"{report_class.__module__}.{report_class.__qualname__}:{report.columns}"
+    # Approximate reports may build states of other types
+    return f"{key}:approximate" if report.approximate else key
+
+
+@log
+def aggregate_files(
+    files: list[Path],
+    report: AggregateReport,
+    jobs: int = 1,
+    cache: Optional["FileCache"] = None,
+    use_mmap: bool = False,
+    chunk_size: Optional[int] = None,
+    checkpoints: Optional["CheckpointStore"] = None,
+    where: Optional[Sequence[Predicate]] = None,
+    sample: Optional[float] = None,
+) -> Iterator[tuple[Path, Any, int]]:
+    """
+    Reducing files to partial report states, optionally in a process pool.
+
+    Only the small partial states are sent back from workers, so they can
+    be merged with `report.merge` without loading rows in the main process.
+    Results are yielded in the order of `files`.
+
+    Args:
+        files: Paths to CSV files.
+        report: Report to build states for.
+        jobs: Number of worker processes, 1 to run in the current process.
+        cache: Optional cache of partial states, unchanged files are
+            not read again.
+        use_mmap: Whether to scan memory-mapped files.
+        chunk_size: Optional size in bytes to split files into ranges
+            aligned to records, ranges are reduced as separate tasks
+            and merged back per file.
+        checkpoints: Optional store of per-file checkpoints, only bytes
+            appended since the last run are read (cache is not used then).
+        where: Optional predicates rows must match, applied by readers.
+        sample: Optional fraction of every CSV file to read as evenly
+            spread ranges of records (`chunk_size` sets their size, see
+            `CsvReader.sample_ranges`); columnar files are read fully.
+
+    Returns:
+        Iterator of (file, partial state, number of rows) tuples.
+
+    Raises:
+        ValueError: If both checkpoints and sample are given.
+    """
+
+    if checkpoints is not None:
+        if sample is not None:
+            error_msg = "Sampled files can't be read incrementally"
+            raise ValueError(error_msg)
+
+        return _aggregate_incremental(
+            files, report, jobs, use_mmap, chunk_size, checkpoints, where
+        )
+
+    if cache is None:
+        return _aggregate(files, report, jobs, use_mmap, chunk_size, where, sample)
+
+    return _aggregate_cached(
+        files, report, jobs, use_mmap, chunk_size, cache, where, sample
+    )
+
+
+def _aggregate(
+    files: list[Path],
+    report: AggregateReport,
+    jobs: int,
+    use_mmap: bool,
+    chunk_size: Optional[int],
+    where: Optional[Sequence[Predicate]],
+    sample: Optional[float] = None,
+) -> Iterator[tuple[Path, Any, int]]:
+    split = chunk_size is not None or sample is not None
+    if not split:
+        tasks = [(file, None) for file in files]
+    else:
+        ranges = [
+            (
+                [None]
+                if file.suffix == COLUMNAR_SUFFIX
+                else _file_ranges(file, chunk_size, sample)
+            )
+            for file in files
+        ]
+        tasks = [
+            (file, byte_range)
+            for file, file_ranges in zip(files, ranges)
+            for byte_range in file_ranges
+        ]
+
+    results = _run_tasks(tasks, report, jobs, use_mmap, where)
+    if not split:
+        return results
+
+    return _merge_ranges(results, [len(file_ranges) for file_ranges in ranges], report)
+
+
+def _file_ranges(
+    file: Path, chunk_size: Optional[int], sample: Optional[float]
+) -> list[ByteRange]:
+    """Splitting CSV file into ranges to read, a sample of them if requested."""
+
+    reader = CsvReader(file)
+    if sample is None:
+        return reader.split_ranges(chunk_size)
+    if chunk_size is None:
+        return reader.sample_ranges(sample)
+    return reader.sample_ranges(sample, chunk_size)
+
+
+def _run_tasks(
+    tasks: list[tuple[Path, Optional[ByteRange]]],
+    report: AggregateReport,
+    jobs: int,
+    use_mmap: bool,
+    where: Optional[Sequence[Predicate]],
+) -> Iterator[tuple[Path, Any, int]]:
+    if jobs == 1 or len(tasks) < 2:
+        return (
+            aggregate_file(file, report, use_mmap, byte_range, where)
+            for file, byte_range in tasks
+        )
+
+    return _aggregate_in_pool(tasks, report, jobs, use_mmap, where)
+
+
+def _aggregate_in_pool(
+    tasks: list[tuple[Path, Optional[ByteRange]]],
+    report: AggregateReport,
+    jobs: int,
+    use_mmap: bool,
+    where: Optional[Sequence[Predicate]],
+) -> Iterator[tuple[Path, Any, int]]:
+    count = len(tasks)
+    args = (
+        [file for file, _ in tasks],
+        [report] * count,
+        [use_mmap] * count,
+        [byte_range for _, byte_range in tasks],
+        [where] * count,
+    )
+    from concurrent.futures import ProcessPoolExecutor
+
+    profiler = profiling.active_profiler
+
+    with ProcessPoolExecutor(max_workers=min(jobs, count)) as executor:
+        if profiler is None:
+            yield from executor.map(aggregate_file, *args)
+            return
+
+        trace_memory = [profiler.trace_memory] * count
+        for result, stats, events in executor.map(
+            _aggregate_file_profiled, *args, trace_memory
+        ):
+            profiler.merge(stats, events)
+            yield result
+
+
+def _merge_ranges(
+    results: Iterator[tuple[Path, Any, int]],
+    counts: list[int],
+    report: AggregateReport,
+) -> Iterator[tuple[Path, Any, int]]:
+    """Merging consecutive range results into one result per file."""
+
+    for count in counts:
+        file, state, rows = next(results)
+        for _ in range(count - 1):
+            _, partial, partial_rows = next(results)
+            state = report.merge(state, partial)
+            rows += partial_rows
+        yield file, state, rows
+
+
+def _aggregate_cached(
+    files: list[Path],
+    report: AggregateReport,
+    jobs: int,
+    use_mmap: bool,
+    chunk_size: Optional[int],
+    cache: "FileCache",
+    where: Optional[Sequence[Predicate]],
+    sample: Optional[float],
+) -> Iterator[tuple[Path, Any, int]]:
+    namespace = report_cache_key(report, where, sample, chunk_size or SAMPLE_BLOCK_SIZE)
+    cached = {}
+    for file in files:
+        entry = cache.get(file, namespace)
+        if entry is not None:
+            cached[file] = entry
+
+    misses = [file for file in files if file not in cached]
+    computed = _aggregate(misses, report, jobs, use_mmap, chunk_size, where, sample)
+
+    for file in files:
+        if file in cached:
+            state, rows = cached[file]
+            yield file, state, rows
+            continue
+
+        result = next(computed)
+        cache.put(file, namespace, result[1:])
+        yield result
+
+    cache.evict()
+
+
+def _aggregate_incremental(
+    files: list[Path],
+    report: AggregateReport,
+    jobs: int,
+    use_mmap: bool,
+    chunk_size: Optional[int],
+    checkpoints: "CheckpointStore",
+    where: Optional[Sequence[Predicate]],
+) -> Iterator[tuple[Path, Any, int]]:
+    namespace = report_cache_key(report, where)
+    plans = []
+    tasks: list[tuple[Path, Optional[ByteRange]]] = []
+
+    for file in files:
+        if file.suffix == COLUMNAR_SUFFIX:
+            # Columnar files are rewritten as a whole, so they are read fully
+            tasks.append((file, None))
+            plans.append((file, None, 1, None))
+            continue
+
+        checkpoint = checkpoints.get(file, namespace)
+        offset, lines = 0, 0
+        if checkpoint is not None:
+            offset, lines = checkpoint.offset, checkpoint.lines
+        ranges, tail = CsvReader(file).unread_ranges(offset, lines, chunk_size)
+        tasks.extend((file, byte_range) for byte_range in ranges)
+        plans.append((file, checkpoint, len(ranges), tail))
+
+    results = _run_tasks(tasks, report, jobs, use_mmap, where)
+
+    for file, checkpoint, count, tail in plans:
+        if checkpoint is None:
+            state, rows = report.create_state(), 0
+        else:
+            state, rows = checkpoint.state, checkpoint.rows
+
+        for _ in range(count):
+            _, partial, partial_rows = next(results)
+            state = report.merge(state, partial)
+            rows += partial_rows
+
+        if tail is None:
+            yield file, state, rows
+            continue
+
+        if count or checkpoint is None:
+            checkpoints.put(file, namespace, tail[0], tail[2], rows, state)
+
+        if tail[0] < tail[1]:
+            _, partial, partial_rows = aggregate_file(
+                file, report, use_mmap, tail, where
+            )
+            state = report.merge(state, partial)
+            rows += partial_rows
+
+        yield file, state, rows
@@ -0,0 +1,227 @@
+import os
+import threading
+import time
+from contextlib import closing, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Generator, Iterator, Optional
+
+active_profiler: Optional["Profiler"] = None
+
+
+class Profiler:
+    """
+    Collecting wall time, CPU time, call counts and allocated memory.
+
+    Measurements are grouped by name (decorated function or pipeline
+    stage) and kept as events for Chrome trace export.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stats: dict[str, list[float]] = {}
+        self.events: list[dict[str, Any]] = []
+
+    def start(self) -> "Profiler":
+        """
+        Making profiler active for decorated functions and stages.
+
+        Returns:
+            This profiler.
+        """
+
+        global active_profiler
+
+        import tracemalloc
+
+        from .logger import refresh_instrumentation
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        active_profiler = self
+        refresh_instrumentation()
+        return self
+
+    def stop(self) -> None:
+        """Deactivating profiler."""
+
+        global active_profiler
+
+        import tracemalloc
+
+        from .logger import refresh_instrumentation
+
+        if active_profiler is self:
+            active_profiler = None
+        refresh_instrumentation()
+
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measuring code block.
+
+        Args:
+            name: Stage name.
+        """
+
+        import tracemalloc
+
+        memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        timestamp = time.time()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            self._finish(name, timestamp, wall, cpu, memory)
+
+    def iterate(self, name: str, items: Generator) -> Iterator[Any]:
+        """
+        Measuring iteration over a generator, e.g. rows streamed by a reader.
+
+        Only time spent producing items is counted, not the time consumer
+        takes between them, so a streamed stage isn't charged for the
+        stages it feeds. Iteration is recorded once it ends or is closed.
+
+        Args:
+            name: Stage name.
+            items: Generator to measure, closed with the returned one.
+
+        Yields:
+            Items of the generator.
+        """
+
+        import tracemalloc
+
+        memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        timestamp = time.time()
+        wall = cpu = 0.0
+
+        try:
+            with closing(items):
+                while True:
+                    started_wall = time.perf_counter()
+                    started_cpu = time.process_time()
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        return
+                    finally:
+                        wall += time.perf_counter() - started_wall
+                        cpu += time.process_time() - started_cpu
+                    yield item
+        finally:
+            self._finish(name, timestamp, wall, cpu, memory)
+
+    def _finish(
+        self, name: str, timestamp: float, wall: float, cpu: float, memory: float
+    ) -> None:
+        """Recording measurement and its trace event, memory is counted from start."""
+
+        import tracemalloc
+
+        if tracemalloc.is_tracing():
+            memory = max(tracemalloc.get_traced_memory()[0] - memory, 0)
+        self.record(name, wall, cpu, memory)
+        self.events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": timestamp * 1e6,
+                "dur": wall * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def record(self, name: str, wall: float, cpu: float, memory: float) -> None:
+        """
+        Adding measurement.
+
+        Args:
+            name: Function or stage name.
+            wall: Wall time in seconds.
+            cpu: CPU time in seconds.
+            memory: Allocated memory in bytes.
+        """
+
+        stats = self.stats.setdefault(name, [0, 0.0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += wall
+        stats[2] += cpu
+        stats[3] += memory
+
+    def merge(self, stats: dict[str, list[float]], events: list[dict]) -> None:
+        """
+        Merging measurements from another profiler, e.g. of a worker process.
+
+        Args:
+            stats: Stats of another profiler.
+            events: Events of another profiler.
+        """
+
+        for name, (calls, wall, cpu, memory) in stats.items():
+            own = self.stats.setdefault(name, [0, 0.0, 0.0, 0])
+            own[0] += calls
+            own[1] += wall
+            own[2] += cpu
+            own[3] += memory
+        self.events.extend(events)
+
+    def summary(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """
+        Building summary rows sorted by wall time.
+
+        Args:
+            limit: Optional maximum number of rows.
+
+        Returns:
+            List of dictionaries for print_table.
+        """
+
+        rows = [
+            {
+                "name": name,
+                "calls": int(calls),
+                "wall, s": round(wall, 4),
+                "cpu, s": round(cpu, 4),
+                "memory, KiB": round(memory / 1024, 1),
+            }
+            for name, (calls, wall, cpu, memory) in self.stats.items()
+        ]
+        rows.sort(key=lambda x: x["wall, s"], reverse=True)
+        return rows[:limit]
+
+    def dump_trace(self, path: Path) -> None:
+        """
+        Writing events as Chrome trace JSON (chrome://tracing, Perfetto).
+
+        Args:
+            path: Output path.
+        """
+
+        import json
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events}, f)
+
+
+def stage(name: str) -> ContextManager[None]:
+    """
+    Measuring code block with active profiler, doing nothing otherwise.
+
+    Args:
+        name: Stage name.
+
+    Returns:
+        Context manager.
+    """
+
+    if active_profiler is None:
+        return nullcontext()
+    return active_profiler.stage(name)
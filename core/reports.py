@@ -1,19 +1,102 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from importlib import import_module
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+)
 
 from .logger import log
+from .table import Table
+
+if TYPE_CHECKING:
+    from queue import Queue
+
+    from .index import TableIndex
 
 
 class BaseReport(ABC):
-    """Base report class."""
+    """
+    Base report class.
+
+    Attributes:
+        columns: Names of columns the report reads, None for all columns.
+            Readers keep only these columns in rows passed to the report.
+        limit: Maximum number of report rows, None for all rows. Reports
+            sorting their rows keep only the first ones with a top-K heap,
+            see `core.sorting`.
+        approximate: Whether rows are a sample of the data. Reports may
+            then use sketches (see `core.sketches`) and add error bounds
+            to their rows.
+    """
+
+    columns: Optional[tuple[str, ...]] = None
+    limit: Optional[int] = None
+    approximate: bool = False
 
     @abstractmethod
-    def generate(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def generate(self, data: Iterable[dict[str, Any]]) -> Iterable[dict[str, Any]]:
         """
         Generate report from data.
 
         Args:
-            data: list of dictionaries with some data.
+            data: iterable of dictionaries with some data (e.g. Table),
+                consumed once and completely before returning.
+
+        Returns:
+            Dictionaries for further operations: a list, or an iterator
+            for reports with more rows than fit in memory (see
+            `core.sorting`), which callers must consume once.
+        """
+
+        raise NotImplementedError
+
+
+class AggregateReport(BaseReport):
+    """
+    Base class for reports computed from a mergeable state.
+
+    Rows are fed one at a time into a state created by `create_state`,
+    so memory depends on the state size rather than on the number of rows.
+    States built from different inputs can be merged before `finalize`.
+    """
+
+    @abstractmethod
+    def create_state(self) -> Any:
+        """
+        Creating empty report state.
+
+        Returns:
+            Mergeable state object, e.g. GroupedAccumulator.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, state: Any, row: dict[str, Any]) -> None:
+        """
+        Feeding single row into the state.
+
+        Args:
+            state: Report state.
+            row: Row dictionary.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def finalize(self, state: Any) -> list[dict[str, Any]]:
+        """
+        Building report rows from the state.
+
+        Args:
+            state: Report state.
 
         Returns:
             List of dictionaries for further operations.
@@ -21,6 +104,364 @@ class BaseReport(ABC):
 
         raise NotImplementedError
 
+    def merge(self, state: Any, other: Any) -> Any:
+        """
+        Merging two report states.
+
+        Args:
+            state: Report state to merge into.
+            other: Report state to merge from.
+
+        Returns:
+            Merged state.
+        """
+
+        return state.merge(other)
+
+    def state_from_table(self, table: Table) -> Any:
+        """
+        Building state of a whole table at once.
+
+        Reports override this with vectorized computation over table
+        columns, see `core.vectorized`; `accumulate` uses it for tables.
+
+        Args:
+            table: Table with the report columns.
+
+        Returns:
+            Report state, or None if the report can't be computed this way
+            (e.g. NumPy is not installed).
+        """
+
+        return None
+
+    def state_from_index(
+        self, index: "TableIndex", where: Optional[Mapping[str, Any]] = None
+    ) -> Any:
+        """
+        Building state of a whole table from its group-by index.
+
+        Reports that can be answered from pre-aggregated groups override
+        this, so the state is built in time proportional to the number of
+        groups rather than rows.
+
+        Args:
+            index: Index of the table.
+            where: Optional column values rows must be equal to, see
+                `TableIndex.aggregate`.
+
+        Returns:
+            Report state, or None if the report can't use the index.
+        """
+
+        return None
+
+    def accumulate(self, data: Iterable[dict[str, Any]], state: Any = None) -> Any:
+        """
+        Feeding rows into the state.
+
+        Args:
+            data: Iterable of dictionaries, consumed once.
+            state: Optional state to continue, new one is created by default.
+
+        Returns:
+            Updated state.
+        """
+
+        if isinstance(data, Table):
+            table_state = self.state_from_table(data)
+            if table_state is not None:
+                return table_state if state is None else self.merge(state, table_state)
+            data = data.iter_rows(self.columns)
+
+        if state is None:
+            state = self.create_state()
+
+        update = self.update
+        for row in data:
+            update(state, row)
+
+        return state
+
+    @log(max_repr=200)
+    def generate(self, data: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        return self.finalize(self.accumulate(data))
+
+
+class CombinedReport(AggregateReport):
+    """
+    Aggregate reports computed together in one pass over the rows.
+
+    Each row is fed into the state of every report, so files are read once
+    for all of them. Reports that are not aggregate reports are combined
+    by `StreamedReports` instead, see `combine_reports`.
+
+    Rows hold the columns of all reports, as `columns` is their union
+    (None if any report reads all columns).
+    """
+
+    def __init__(self, reports: Sequence[AggregateReport]):
+        if not reports:
+            error_msg = "At least one report is required"
+            raise ValueError(error_msg)
+
+        not_aggregate = [
+            type(report).__name__
+            for report in reports
+            if not isinstance(report, AggregateReport)
+        ]
+        if not_aggregate:
+            error_msg = f"Reports are not aggregate reports: {', '.join(not_aggregate)}"
+            raise ValueError(error_msg)
+
+        self.reports = tuple(reports)
+        self._updates = tuple(report.update for report in self.reports)
+        self.columns = _union_columns(self.reports)
+
+    def create_state(self) -> list[Any]:
+        return [report.create_state() for report in self.reports]
+
+    def update(self, state: list[Any], row: dict[str, Any]) -> None:
+        for update, report_state in zip(self._updates, state):
+            update(report_state, row)
+
+    def merge(self, state: list[Any], other: list[Any]) -> list[Any]:
+        return [
+            report.merge(report_state, other_state)
+            for report, report_state, other_state in zip(self.reports, state, other)
+        ]
+
+    def state_from_table(self, table: Table) -> Optional[list[Any]]:
+        return self._build_states(lambda report: report.state_from_table(table))
+
+    def state_from_index(
+        self, index: "TableIndex", where: Optional[Mapping[str, Any]] = None
+    ) -> Optional[list[Any]]:
+        return self._build_states(lambda report: report.state_from_index(index, where))
+
+    def _build_states(
+        self, build: Callable[[AggregateReport], Any]
+    ) -> Optional[list[Any]]:
+        """Building states of all reports at once, None if any can't be built."""
+
+        states = []
+        for report in self.reports:
+            state = build(report)
+            if state is None:
+                return None
+            states.append(state)
+        return states
+
+    @log(max_repr=200)
+    def finalize(self, state: list[Any]) -> list[Iterable[dict[str, Any]]]:
+        """
+        Building rows of every report from the combined state.
+
+        Args:
+            state: Combined report state.
+
+        Returns:
+            List with report rows of every report, in order of reports.
+        """
+
+        return [
+            report.finalize(report_state)
+            for report, report_state in zip(self.reports, state)
+        ]
+
+
+class StreamedReports(BaseReport):
+    """
+    Reports of any kind generated from one stream of rows.
+
+    Aggregate reports are updated as rows pass by, the other reports
+    consume the stream with their own `generate`, so rows are never
+    collected into a state and reports keep their bounded memory (e.g.
+    `core.sorting`). If several reports consume the stream, all but the
+    first run in threads fed through bounded queues of row batches.
+    Reports must not modify rows, as rows are shared between them.
+    """
+
+    def __init__(self, reports: Sequence[BaseReport]):
+        if not reports:
+            error_msg = "At least one report is required"
+            raise ValueError(error_msg)
+
+        self.reports = tuple(reports)
+        aggregates = [
+            report for report in self.reports if isinstance(report, AggregateReport)
+        ]
+        self.aggregate = CombinedReport(aggregates) if aggregates else None
+        self.streams = tuple(
+            report for report in self.reports if not isinstance(report, AggregateReport)
+        )
+        self.columns = _union_columns(self.reports)
+
+    @log(max_repr=200)
+    def generate(
+        self, data: Iterable[dict[str, Any]]
+    ) -> list[Iterable[dict[str, Any]]]:
+        """
+        Generating every report from one pass over the rows.
+
+        Args:
+            data: Iterable of dictionaries, consumed once.
+
+        Returns:
+            List with report rows of every report, in order of reports.
+        """
+
+        rows: Iterator[dict[str, Any]] = iter(data)
+        state = None
+        if self.aggregate is not None:
+            state = self.aggregate.create_state()
+            rows = _updating(rows, self.aggregate.update, state)
+
+        if len(self.streams) == 1:
+            stream_results = [self.streams[0].generate(rows)]
+        else:
+            stream_results = _generate_in_threads(self.streams, rows)
+
+        # Reports may stop reading early, aggregate reports need all rows
+        for _ in rows:
+            pass
+
+        results = iter(stream_results)
+        aggregate_results = iter(
+            self.aggregate.finalize(state) if self.aggregate is not None else ()
+        )
+        return [
+            next(aggregate_results if isinstance(report, AggregateReport) else results)
+            for report in self.reports
+        ]
+
+
+def combine_reports(reports: Sequence[BaseReport]) -> BaseReport:
+    """
+    Combining reports to generate them from one pass over the rows.
+
+    Args:
+        reports: Report instances.
+
+    Returns:
+        The report itself if it's the only one, CombinedReport if all
+        reports are aggregate reports, StreamedReports otherwise. Combined
+        reports generate a list with rows of every report.
+
+    Raises:
+        ValueError: If there are no reports.
+    """
+
+    if len(reports) == 1:
+        return reports[0]
+    if all(isinstance(report, AggregateReport) for report in reports):
+        return CombinedReport(reports)  # type: ignore[arg-type]
+    return StreamedReports(reports)
+
+
+def _union_columns(reports: Sequence[BaseReport]) -> Optional[tuple[str, ...]]:
+    """Getting columns read by any of reports, None if any reads all columns."""
+
+    columns: dict[str, None] = {}
+    for report in reports:
+        if report.columns is None:
+            return None
+        columns.update(dict.fromkeys(report.columns))
+    return tuple(columns)
+
+
+def _updating(
+    rows: Iterator[dict[str, Any]],
+    update: Callable[[Any, dict[str, Any]], None],
+    state: Any,
+) -> Iterator[dict[str, Any]]:
+    """Passing rows through, feeding each of them into the state first."""
+
+    for row in rows:
+        update(state, row)
+        yield row
+
+
+# Rows are passed to threads in batches, one queue item per row is slow
+_BATCH_SIZE = 1024
+_QUEUE_BATCHES = 16
+
+
+def _generate_in_threads(
+    reports: Sequence[BaseReport], rows: Iterator[dict[str, Any]]
+) -> list[Iterable[dict[str, Any]]]:
+    """
+    Generating reports from one stream of rows.
+
+    The first report reads rows in the current thread, every row batch is
+    also put into a bounded queue of each other report's thread. Threads
+    read their queues to the end even if their report fails or stops
+    early, so the stream never blocks.
+    """
+
+    from queue import Queue
+    from threading import Thread
+
+    queues: list[Queue] = [Queue(_QUEUE_BATCHES) for _ in reports[1:]]
+    results: list[Any] = [None] * len(reports)
+    errors: list[BaseException] = []
+
+    threads = [
+        Thread(
+            target=_consume_batches,
+            args=(report, queue, results, position, errors),
+            daemon=True,
+        )
+        for position, (report, queue) in enumerate(zip(reports[1:], queues), 1)
+    ]
+    for thread in threads:
+        thread.start()
+
+    stream = _broadcast(rows, queues)
+    try:
+        results[0] = reports[0].generate(stream)
+        for _ in stream:
+            pass
+    finally:
+        for queue in queues:
+            queue.put(None)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+def _broadcast(
+    rows: Iterator[dict[str, Any]], queues: list["Queue"]
+) -> Iterator[dict[str, Any]]:
+    """Passing rows through, putting their batches into every queue first."""
+
+    while batch := list(islice(rows, _BATCH_SIZE)):
+        for queue in queues:
+            queue.put(batch)
+        yield from batch
+
+
+def _consume_batches(
+    report: BaseReport,
+    queue: "Queue",
+    results: list[Any],
+    position: int,
+    errors: list[BaseException],
+) -> None:
+    """Generating report from row batches of the queue until None is put."""
+
+    batches = iter(queue.get, None)
+    try:
+        results[position] = report.generate(row for batch in batches for row in batch)
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        for _ in batches:
+            pass
+
 
 class ReportRegMeta(type):
     """Metaclass for report registry."""
@@ -37,9 +478,14 @@ class ReportRegMeta(type):
 
 
 class ReportRegistry(metaclass=ReportRegMeta):
-    """Registry of available reports."""
+    """
+    Registry of available reports.
+
+    Reports may be registered by import path ("package.module:ClassName"),
+    such modules are imported only when the report is requested.
+    """
 
-    _reports: dict["str", type[BaseReport]] = {}
+    _reports: dict["str", type[BaseReport] | str] = {}
 
     @classmethod
     @log
@@ -54,7 +500,8 @@ class ReportRegistry(metaclass=ReportRegMeta):
             Report class instance.
 
         Raises:
-            ValueError: If report name is not found.
+            ValueError: If report name is not found or its import path
+                can't be resolved.
         """
 
         if report_name not in cls._reports:
@@ -64,23 +511,56 @@ class ReportRegistry(metaclass=ReportRegMeta):
             )
             raise ValueError(error_msg)
 
-        return cls._reports[report_name]()
+        report_class = cls._reports[report_name]
+        if isinstance(report_class, str):
+            report_class = cls._reports[report_name] = _import_report(report_class)
+
+        return report_class()
 
     @classmethod
     @log
     def register_report(
-        cls, report_name: str, report_class: type[BaseReport]
-    ) -> type[BaseReport]:
+        cls, report_name: str, report_class: type[BaseReport] | str
+    ) -> type[BaseReport] | str:
         """
         Registering report class.
 
         Args:
             report_name: report name.
-            report_class: report class.
+            report_class: report class or its import path
+                ("package.module:ClassName") to import on first use.
 
         Returns:
-            Registered report class.
+            Registered report class or import path.
         """
 
         cls._reports[report_name] = report_class
         return report_class
+
+
+def _import_report(path: str) -> type[BaseReport]:
+    """
+    Importing report class by path.
+
+    Args:
+        path: Import path as "package.module:ClassName".
+
+    Returns:
+        Report class.
+
+    Raises:
+        ValueError: If path is malformed or doesn't point to a report class.
+    """
+
+    module_name, _, class_name = path.partition(":")
+    try:
+        report_class = getattr(import_module(module_name), class_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        error_msg = f"Can't import report '{path}': {e}"
+        raise ValueError(error_msg) from e
+
+    if not (isinstance(report_class, type) and issubclass(report_class, BaseReport)):
+        error_msg = f"'{path}' is not a report class"
+        raise ValueError(error_msg)
+
+    return report_class
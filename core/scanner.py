@@ -0,0 +1,241 @@
+from typing import Iterator, Optional
+
+QUOTE = b'"'
+NEWLINE = b"\n"
+BLOCK_SIZE = 1024 * 1024
+
+
+def _split_quoted(
+    record: bytes, pos: int, delimiter: bytes
+) -> Optional[tuple[bytes, int]]:
+    """
+    Reading quoted field starting at record[pos].
+
+    Args:
+        record: Record bytes.
+        pos: Offset of the opening quote.
+        delimiter: Field delimiter.
+
+    Returns:
+        Tuple of (unquoted field, offset after the field or -1 at record end),
+        None if the closing quote is missing.
+    """
+
+    chunks = []
+    pos += 1
+    while True:
+        quote = record.find(QUOTE, pos)
+        if quote == -1:
+            return None
+        chunks.append(record[pos:quote])
+        pos = quote + 1
+        if not record.startswith(QUOTE, pos):
+            break
+        chunks.append(QUOTE)
+        pos += 1
+
+    end = record.find(delimiter, pos)
+    chunks.append(record[pos:] if end == -1 else record[pos:end])
+    return b"".join(chunks), end
+
+
+def split_record(record: bytes, delimiter: bytes) -> Optional[list[bytes]]:
+    """
+    Splitting record into raw fields with quotes handled.
+
+    Quoted fields may contain delimiters, newlines and doubled quotes,
+    quotes inside unquoted fields are kept as is (like csv module does).
+    Parts of the record without quotes are split in one call.
+
+    Args:
+        record: Record bytes without trailing line break.
+        delimiter: Field delimiter.
+
+    Returns:
+        List of raw fields, None if record ends inside a quoted field.
+    """
+
+    if QUOTE not in record:
+        return record.split(delimiter)
+
+    fields: list[bytes] = []
+    step = len(delimiter)
+    pos = 0
+
+    while True:
+        quote = record.find(QUOTE, pos)
+        if quote == -1:
+            fields.extend(record[pos:].split(delimiter))
+            return fields
+
+        field_start = record.rfind(delimiter, pos, quote)
+        field_start = pos if field_start == -1 else field_start + step
+        if field_start > pos:
+            fields.extend(record[pos : field_start - step].split(delimiter))
+
+        if field_start != quote:
+            end = record.find(delimiter, quote)
+            fields.append(
+                record[field_start:] if end == -1 else record[field_start:end]
+            )
+        else:
+            quoted = _split_quoted(record, quote, delimiter)
+            if quoted is None:
+                return None
+            field, end = quoted
+            fields.append(field)
+
+        if end == -1:
+            return fields
+        pos = end + step
+
+
+def iter_records(
+    buffer, start: int, end: int, delimiter: bytes
+) -> Iterator[tuple[list[bytes], int, int]]:
+    """
+    Scanning raw records in buffer[start:end].
+
+    Buffer is read in blocks of BLOCK_SIZE bytes, so it works with
+    memory-mapped files of any size without copying them into memory.
+
+    Args:
+        buffer: Bytes-like object supporting slicing, e.g. mmap.
+        start: Offset of the first record.
+        end: Offset to stop at.
+        delimiter: Field delimiter.
+
+    Yields:
+        Tuples of (raw fields, offset after the record, number of physical
+        lines in the record).
+
+    Raises:
+        ValueError: If the last record ends inside a quoted field.
+    """
+
+    pos = start
+    record_start = start
+    carry = b""
+    carry_lines = 0
+
+    while pos < end:
+        block_end = min(pos + BLOCK_SIZE, end)
+        lines = buffer[pos:block_end].split(NEWLINE)
+        pos = block_end
+
+        if pos < end:
+            tail = lines.pop()
+        else:
+            tail = None
+            if not lines[-1]:
+                lines.pop()
+
+        for line in lines:
+            if carry:
+                line = carry + line
+            carry_lines += 1
+
+            record = line[:-1] if line.endswith(b"\r") else line
+            fields = split_record(record, delimiter)
+            if fields is None:
+                carry = line + NEWLINE
+                continue
+
+            record_start = min(record_start + len(line) + 1, end)
+            yield fields, record_start, carry_lines
+            carry = b""
+            carry_lines = 0
+
+        if tail is not None:
+            carry += tail
+
+    if carry:
+        error_msg = f"Unterminated quoted field at offset {record_start}"
+        raise ValueError(error_msg)
+
+
+def count_bytes(buffer, needle: bytes, start: int, end: int) -> int:
+    """
+    Counting occurrences of single-byte needle in buffer[start:end].
+
+    Args:
+        buffer: Bytes-like object supporting slicing, e.g. mmap.
+        needle: Single byte to count.
+        start: Start offset.
+        end: End offset.
+
+    Returns:
+        Number of occurrences.
+    """
+
+    return sum(
+        buffer[pos : min(pos + BLOCK_SIZE, end)].count(needle)
+        for pos in range(start, end, BLOCK_SIZE)
+    )
+
+
+def next_record_boundary(buffer, start: int, pos: int, end: int) -> int:
+    """
+    Finding first record boundary at or after pos.
+
+    Quote parity is counted from `start`, which must be a record boundary,
+    so line breaks inside quoted fields are skipped.
+
+    Args:
+        buffer: Bytes-like object supporting find and slicing, e.g. mmap.
+        start: Offset of a record boundary before pos.
+        pos: Offset to search from.
+        end: End of data.
+
+    Returns:
+        Offset right after the line break ending a record, or `end`.
+    """
+
+    if pos >= end:
+        return end
+
+    inside_quotes = count_bytes(buffer, QUOTE, start, pos) % 2
+
+    while True:
+        line_end = buffer.find(NEWLINE, pos, end)
+        if line_end == -1:
+            return end
+
+        inside_quotes ^= count_bytes(buffer, QUOTE, pos, line_end) % 2
+        if not inside_quotes:
+            return line_end + 1
+        pos = line_end + 1
+
+
+def last_record_boundary(buffer, start: int, end: int) -> int:
+    """
+    Finding last record boundary at or before end.
+
+    Quote parity is counted from `start`, which must be a record boundary,
+    so a record with an unterminated quoted field or without a trailing
+    line break (e.g. still being appended) is left after the boundary.
+
+    Args:
+        buffer: Bytes-like object supporting rfind and slicing, e.g. mmap.
+        start: Offset of a record boundary.
+        end: End of data.
+
+    Returns:
+        Offset right after the line break ending the last complete record,
+        or `start`.
+    """
+
+    inside_quotes = count_bytes(buffer, QUOTE, start, end) % 2
+    pos = end
+
+    while pos > start:
+        line_end = buffer.rfind(NEWLINE, start, pos)
+        if line_end == -1:
+            return start
+
+        inside_quotes ^= count_bytes(buffer, QUOTE, line_end + 1, pos) % 2
+        if not inside_quotes:
+            return line_end + 1
+        pos = line_end
+
+    return start
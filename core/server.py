@@ -0,0 +1,414 @@
+"""
+Report server keeping loaded files and report states in memory.
+
+Clients send one JSON request per line:
+
+    {"files": ["/data/employees1.csv"], "reports": ["performance"],
+     "where": ["experience_years >= 5"], "limit": 10}
+
+and get one JSON response per line:
+
+    {"reports": [{"name": "performance", "rows": [...]}], "records": 15}
+
+or {"error": "..."}; "where" filter expressions and "limit" of report
+rows are optional and "records" counts rows matching the filter. Files
+are loaded into tables on first request and reloaded only when their
+size, modification time or inode changes; partial states of aggregate
+reports are kept per file, so repeated queries only merge and finalize
+them. Group-by indexes are kept next to loaded tables, reports grouping
+the same columns are built from them.
+"""
+
+import asyncio
+import json
+from copy import deepcopy
+from csv import Error as csv_Error
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple, Optional, Sequence
+
+from .columnar import open_reader
+from .filters import Predicate, filter_key, parse_predicate
+from .index import TableIndex
+from .logger import get_logger
+from .pipeline import report_cache_key
+from .reports import AggregateReport, BaseReport, ReportRegistry
+from .table import DictColumn, Table
+
+logger = get_logger(__name__)
+
+DEFAULT_WATCH_INTERVAL = 1.0
+
+# Line limit of asyncio streams, requests list files and report names only
+_REQUEST_LIMIT = 1024 * 1024
+
+
+class _Dataset(NamedTuple):
+    """
+    Loaded file with its group-by index and partial report states keyed
+    by report namespace.
+    """
+
+    file: Path
+    signature: tuple[int, int, int]
+    table: Table
+    index: TableIndex
+    states: dict[str, Any]
+
+
+def _file_signature(file: Path) -> tuple[int, int, int]:
+    try:
+        stat = file.stat()
+    except FileNotFoundError:
+        error_msg = f"File {file} does not exist!"
+        raise FileNotFoundError(error_msg) from None
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def _load_dataset(file: Path) -> _Dataset:
+    """Validating and loading file, signature is taken before reading."""
+
+    signature = _file_signature(file)
+    table = open_reader(file).load_table()
+    return _Dataset(file, signature, table, TableIndex(table), {})
+
+
+class ReportServer:
+    """
+    Serving report queries over loaded files.
+
+    Clients are served concurrently by asyncio, files are loaded and reports
+    are computed in worker threads so the event loop keeps accepting
+    connections. A background task reloads changed files.
+    """
+
+    def __init__(self, watch_interval: float = DEFAULT_WATCH_INTERVAL):
+        self.watch_interval = watch_interval
+        self._datasets: dict[Path, _Dataset] = {}
+        self._locks: dict[Path, asyncio.Lock] = {}
+
+    async def get_dataset(self, file: Path) -> _Dataset:
+        """
+        Getting loaded file, loading it if it is new or changed.
+
+        Args:
+            file: Path to CSV or columnar file.
+
+        Returns:
+            Loaded dataset.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file is not a valid CSV or columnar file.
+            csv.Error: If file validation fails.
+        """
+
+        lock = self._locks.setdefault(file, asyncio.Lock())
+        async with lock:
+            dataset = self._datasets.get(file)
+            if dataset is not None and dataset.signature == _file_signature(file):
+                return dataset
+
+            if dataset is not None:
+                logger.info(f"File {file} changed, reloading it")
+            dataset = await asyncio.to_thread(_load_dataset, file)
+            self._datasets[file] = dataset
+            return dataset
+
+    async def reload_changed(self) -> None:
+        """Reloading changed files and forgetting removed ones."""
+
+        for file in list(self._datasets):
+            try:
+                await self.get_dataset(file)
+            except FileNotFoundError:
+                logger.info(f"File {file} was removed, dropping it")
+                self._datasets.pop(file, None)
+            except (ValueError, csv_Error) as e:
+                logger.warning(f"File {file} can't be reloaded: {e}")
+                self._datasets.pop(file, None)
+
+    async def query(
+        self,
+        files: Sequence[str],
+        report_names: Sequence[str],
+        where: Sequence[str] = (),
+        limit: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Generating reports over files.
+
+        Args:
+            files: Paths to CSV or columnar files.
+            report_names: Names of registered reports.
+            where: Filter expressions rows must match, see `core.filters`.
+            limit: Optional maximum number of rows of every report.
+
+        Returns:
+            Response with rows of every report and number of records
+            matching the filter.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If report isn't found, filter expression is malformed
+                or file is not valid.
+            csv.Error: If file validation fails or file has no requested
+                column.
+        """
+
+        predicates = [parse_predicate(expression) for expression in where]
+        reports = [ReportRegistry.get_report(name) for name in report_names]
+        for report in reports:
+            report.limit = limit
+        datasets = [await self.get_dataset(Path(file)) for file in files]
+        results = await asyncio.to_thread(_generate, reports, datasets, predicates)
+        records = await asyncio.to_thread(_count_records, datasets, predicates)
+
+        return {
+            "reports": [
+                {"name": name, "rows": rows}
+                for name, rows in zip(report_names, results)
+            ],
+            "records": records,
+        }
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answering requests of one connection until it is closed.
+
+        Args:
+            reader: Connection reader.
+            writer: Connection writer.
+        """
+
+        try:
+            while line := await reader.readline():
+                response = await self._answer(line)
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError) as e:
+            logger.warning(f"Client connection closed: {e}")
+        finally:
+            writer.close()
+
+    async def _answer(self, line: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(line)
+            files, reports = request["files"], request["reports"]
+            where, limit = request.get("where", []), request.get("limit")
+            if not (_is_names(files) and _is_names(reports) and _is_names(where)):
+                raise TypeError
+            if limit is not None and not _is_positive_int(limit):
+                raise TypeError
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return {
+                "error": "Request must have 'files' and 'reports' lists, "
+                "optional 'where' list and positive 'limit'"
+            }
+
+        try:
+            return await self.query(files, reports, where, limit)
+        except (OSError, ValueError, csv_Error) as e:
+            return {"error": str(e)}
+        except Exception as e:
+            # The connection stays open for further requests
+            logger.exception(f"Request failed: {e}")
+            return {"error": "Internal server error"}
+
+    async def watch(self) -> None:
+        """Reloading changed files every `watch_interval` seconds."""
+
+        while True:
+            await asyncio.sleep(self.watch_interval)
+            await self.reload_changed()
+
+    async def serve(
+        self, address: str | tuple[str, int], started: Optional[asyncio.Event] = None
+    ) -> None:
+        """
+        Serving clients until cancelled.
+
+        Args:
+            address: Path to Unix socket or tuple of (host, port).
+            started: Optional event set once the server accepts connections.
+        """
+
+        if isinstance(address, tuple):
+            server = await asyncio.start_server(
+                self.handle_client, *address, limit=_REQUEST_LIMIT
+            )
+        else:
+            Path(address).unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(
+                self.handle_client, address, limit=_REQUEST_LIMIT
+            )
+
+        watcher = asyncio.create_task(self.watch())
+        logger.info(f"Report server is listening on {address}")
+        try:
+            async with server:
+                if started is not None:
+                    started.set()
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+            if not isinstance(address, tuple):
+                Path(address).unlink(missing_ok=True)
+
+
+def _is_names(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _is_positive_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def _dataset_rows(
+    dataset: _Dataset, columns: Optional[Sequence[str]], where: list[Predicate]
+) -> Iterator[dict[str, Any]]:
+    """
+    Iterating over dataset rows with the requested columns.
+
+    Args:
+        dataset: Loaded dataset.
+        columns: Column names to keep (default: all columns).
+        where: Predicates rows must match.
+
+    Returns:
+        Iterator over rows as dictionaries.
+
+    Raises:
+        csv.Error: If dataset has no requested or filter column.
+    """
+
+    names = [*(columns or ()), *(predicate.column for predicate in where)]
+    missing = [name for name in names if name not in dataset.table.columns]
+    if missing:
+        error_msg = f"File {dataset.file} has no columns: {', '.join(missing)}"
+        raise csv_Error(error_msg)
+
+    return dataset.table.iter_rows(columns, where)
+
+
+def _index_filter(table: Table, where: list[Predicate]) -> Optional[dict[str, Any]]:
+    """
+    Getting column values of equality predicates for `TableIndex.aggregate`.
+
+    Groups match predicates exactly only if values have the type of their
+    column: strings for dictionary-encoded columns, numbers for numeric
+    ones. Filters convert text to numbers when they are compared to one,
+    so e.g. "02134" matches 2134, which an index lookup wouldn't.
+
+    Args:
+        table: Table of the index.
+        where: Predicates rows must match.
+
+    Returns:
+        Dictionary of column values, None if any predicate is not an
+        equality of such a value or a column is compared twice.
+    """
+
+    values = {}
+    for predicate in where:
+        column = table.columns.get(predicate.column)
+        if (
+            predicate.operator != "=="
+            or predicate.column in values
+            or column is None
+            or isinstance(column, DictColumn) != isinstance(predicate.value, str)
+        ):
+            return None
+        values[predicate.column] = predicate.value
+    return values
+
+
+def _count_records(datasets: list[_Dataset], where: list[Predicate]) -> int:
+    """
+    Counting rows of datasets matching the predicates.
+
+    Counts are kept with partial report states, rows are counted from the
+    group-by index if it can answer the predicates (see `_index_filter`).
+
+    Args:
+        datasets: Loaded datasets.
+        where: Predicates rows must match.
+
+    Returns:
+        Number of matching rows.
+
+    Raises:
+        csv.Error: If dataset has no filter column.
+    """
+
+    if not where:
+        return sum(len(dataset.table) for dataset in datasets)
+
+    namespace = f"records|where {filter_key(where)}"
+    records = 0
+    for dataset in datasets:
+        count = dataset.states.get(namespace)
+        if count is None:
+            index_where = _index_filter(dataset.table, where)
+            if index_where is None:
+                count = sum(1 for _ in _dataset_rows(dataset, (), where))
+            else:
+                columns = tuple(sorted(index_where))
+                key = tuple(index_where[name] for name in columns)
+                count = len(dataset.index.group_index(columns).rows(key))
+            dataset.states[namespace] = count
+        records += count
+
+    return records
+
+
+def _generate(
+    reports: list[BaseReport], datasets: list[_Dataset], where: list[Predicate]
+) -> list[list[dict[str, Any]]]:
+    """
+    Generating reports over loaded datasets.
+
+    Partial states of aggregate reports are computed once per dataset and
+    filter, vectorized if the report supports it and there is no filter,
+    or from its group-by index if all predicates are equalities the index
+    can answer (see `_index_filter`), and copied before merging, since
+    merging may reuse parts of merged state.
+
+    Args:
+        reports: Report instances.
+        datasets: Loaded datasets.
+        where: Predicates rows must match.
+
+    Returns:
+        Rows of every report, in order of reports.
+    """
+
+    results = []
+    for report in reports:
+        if not isinstance(report, AggregateReport):
+            rows = chain.from_iterable(
+                _dataset_rows(dataset, report.columns, where) for dataset in datasets
+            )
+            results.append(list(report.generate(rows)))
+            continue
+
+        namespace = report_cache_key(report, where)
+        state = report.create_state()
+        for dataset in datasets:
+            partial = dataset.states.get(namespace)
+            if partial is None:
+                rows = _dataset_rows(dataset, report.columns, where)
+                if not where:
+                    partial = report.state_from_table(dataset.table)
+                index_where = _index_filter(dataset.table, where)
+                if partial is None and index_where is not None:
+                    partial = report.state_from_index(dataset.index, index_where)
+                if partial is None:
+                    partial = report.accumulate(rows)
+                dataset.states[namespace] = partial
+            state = report.merge(state, deepcopy(partial))
+        results.append(report.finalize(state))
+
+    return results
@@ -1,13 +1,16 @@
-from typing import Any
+from array import array
+from typing import Any, Iterable
 
 from .logger import log
 
 
-@log
 def is_numeric(value: Any) -> bool:
     """
     Checking if value is numeric.
 
+    Scalar helpers are left undecorated, a log wrapper would cost more
+    than the check itself.
+
     Returns:
         True if the value is numeric, False otherwise.
     """
@@ -19,7 +22,6 @@ def is_numeric(value: Any) -> bool:
         return False
 
 
-@log
 def convert_to_number(value: Any) -> int | float:
     """
     Converting value into numeric.
@@ -41,3 +43,58 @@ def convert_to_number(value: Any) -> int | float:
     except ValueError:
         error_msg = f"Cannot convert value {value} to numeric."
         raise ValueError(error_msg)
+
+
+def coerce_number(value: Any) -> int | float | None:
+    """
+    Converting value into numeric in a single parse.
+
+    Kept undecorated, since it's called once per cell on the hot path.
+
+    Returns:
+        Numeric value (int if value has no decimal point and is an integer,
+        float otherwise), or None if value is not numeric.
+    """
+
+    if isinstance(value, (int, float)):
+        return value
+
+    try:
+        return float(value) if "." in value else int(value)
+    except ValueError:
+        pass
+    except TypeError:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@log(max_repr=200)
+def coerce_column(values: Iterable[Any]) -> array | list[int | float | None]:
+    """
+    Converting column of values into numerics.
+
+    Returns:
+        array("q") if all values are integers, array("d") if all values
+        are numeric, otherwise list with None in place of non-numeric values.
+    """
+
+    column: array | list = array("q")
+
+    for value in values:
+        number = coerce_number(value)
+
+        if isinstance(column, array):
+            if number is None:
+                column = column.tolist()
+            elif column.typecode == "q" and (
+                not isinstance(number, int) or not -(2**63) <= number < 2**63
+            ):
+                column = array("d", column)
+
+        column.append(number)
+
+    return column
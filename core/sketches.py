@@ -0,0 +1,178 @@
+"""
+Mergeable sketches of big value streams with bounded memory.
+
+`TDigest` estimates quantiles. It has the interface of accumulators
+(`add`, `merge`, `count`), so it can be used as `GroupedAccumulator`
+factory and merged across files and worker processes like exact report
+states.
+"""
+
+from math import asin, inf, pi, sin
+from typing import Optional
+
+
+class TDigest:
+    """
+    Merging t-digest of numeric values (Dunning, Ertl).
+
+    Values are buffered and merged into at most about `compression`
+    centroids, which are small near the tails, so extreme quantiles like
+    p99 stay accurate.
+    """
+
+    __slots__ = ("compression", "count", "minimum", "maximum", "_means", "_weights")
+
+    def __init__(self, compression: int = 100):
+        self.compression = compression
+        self.count = 0
+        self.minimum = inf
+        self.maximum = -inf
+        self._means: list[float] = []
+        self._weights: list[float] = []
+
+    def add(self, value: int | float) -> None:
+        """
+        Adding single value.
+
+        Args:
+            value: Numeric value.
+        """
+
+        self.count += 1
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+        # Values are appended as unit centroids and compressed in batches
+        self._means.append(value)
+        self._weights.append(1)
+        if len(self._means) >= 10 * self.compression:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """
+        Merging another digest into this one.
+
+        Args:
+            other: Digest of other values.
+
+        Returns:
+            This digest.
+        """
+
+        if not other.count:
+            return self
+
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._means.extend(other._means)
+        self._weights.extend(other._weights)
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimating quantile of added values.
+
+        Args:
+            q: Quantile in [0, 1], e.g. 0.5 for the median.
+
+        Returns:
+            Estimated value, None if nothing was added.
+
+        Raises:
+            ValueError: If q is not in [0, 1].
+        """
+
+        if not 0 <= q <= 1:
+            error_msg = f"Quantile must be in [0, 1], got {q}"
+            raise ValueError(error_msg)
+
+        if not self.count:
+            return None
+
+        self._compress()
+        means, weights = self._means, self._weights
+        target = q * self.count
+
+        # Centroid means are placed at the middle of their weight, values
+        # between the middles are interpolated
+        if target <= weights[0] / 2:
+            return _interpolate(self.minimum, means[0], target, weights[0] / 2)
+
+        seen = 0.0
+        for i in range(len(means) - 1):
+            center = seen + weights[i] / 2
+            next_center = center + (weights[i] + weights[i + 1]) / 2
+            if target < next_center:
+                return _interpolate(
+                    means[i], means[i + 1], target - center, next_center - center
+                )
+            seen += weights[i]
+
+        center = self.count - weights[-1] / 2
+        return _interpolate(
+            means[-1], self.maximum, target - center, self.count - center
+        )
+
+    def __len__(self) -> int:
+        self._compress()
+        return len(self._means)
+
+    def __copy__(self) -> "TDigest":
+        # Centroid lists are extended by merge, so copies must not share them
+        digest = TDigest(self.compression)
+        digest.count = self.count
+        digest.minimum, digest.maximum = self.minimum, self.maximum
+        digest._means, digest._weights = self._means[:], self._weights[:]
+        return digest
+
+    def _compress(self) -> None:
+        """Merging centroids into as few as the size limits allow."""
+
+        if not self._means:
+            return
+
+        points = sorted(zip(self._means, self._weights))
+        total = self.count
+        means, weights = [], []
+
+        mean, weight = points[0]
+        seen = 0.0
+        limit = total * self._q_limit(0.0)
+        for point_mean, point_weight in points[1:]:
+            if seen + weight + point_weight <= limit:
+                weight += point_weight
+                mean += (point_mean - mean) * point_weight / weight
+                continue
+
+            means.append(mean)
+            weights.append(weight)
+            seen += weight
+            limit = total * self._q_limit(seen / total)
+            mean, weight = point_mean, point_weight
+
+        means.append(mean)
+        weights.append(weight)
+        self._means, self._weights = means, weights
+
+    def _q_limit(self, q: float) -> float:
+        """
+        Getting quantile where the centroid starting at q must end.
+
+        Uses k1 scale function k(q) = compression / (2 pi) * asin(2q - 1),
+        every centroid spans at most 1 in k.
+        """
+
+        k = self.compression / (2 * pi) * asin(2 * q - 1) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (sin(2 * pi * k / self.compression) + 1) / 2
+
+
+def _interpolate(start: float, end: float, offset: float, span: float) -> float:
+    if span <= 0:
+        return end
+    return start + (end - start) * min(offset / span, 1.0)
@@ -0,0 +1,174 @@
+"""
+Sorting of row streams bigger than memory.
+
+`external_sort` keeps at most `run_size` items in memory: full buffers are
+sorted and spilled as runs to temporary files, which are then merged
+lazily with a k-way heap merge. `top_k` keeps only `k` items in a heap for
+queries with a limit, and `sort_rows` picks one of them.
+"""
+
+import heapq
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Iterator, Optional
+
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    from tempfile import TemporaryDirectory
+
+logger = get_logger(__name__)
+
+RUN_SIZE = 100_000
+
+# Items are pickled in batches, one pickle per item is several times slower
+_BATCH_SIZE = 1024
+
+_Key = Optional[Callable[[Any], Any]]
+
+
+def external_sort(
+    items: Iterable[Any],
+    key: _Key = None,
+    reverse: bool = False,
+    run_size: int = RUN_SIZE,
+    tmp_dir: Optional[Path] = None,
+) -> Iterator[Any]:
+    """
+    Sorting items with bounded memory.
+
+    Items are sorted in memory if there are at most `run_size` of them.
+    Otherwise sorted runs are written to a temporary directory, removed when
+    the returned iterator is exhausted or closed. The sort is stable, as
+    `sorted`: equal items keep their input order.
+
+    Args:
+        items: Picklable items, consumed once.
+        key: Optional function of an item to sort by.
+        reverse: Whether to sort in descending order.
+        run_size: Maximum number of items kept in memory.
+        tmp_dir: Directory for temporary run files (default: system one).
+
+    Returns:
+        Iterator over sorted items.
+
+    Raises:
+        ValueError: If run_size is not positive.
+    """
+
+    if run_size < 1:
+        error_msg = f"Run size must be positive, got {run_size}"
+        raise ValueError(error_msg)
+
+    items = iter(items)
+    buffer = list(islice(items, run_size))
+    buffer.sort(key=key, reverse=reverse)
+
+    if len(buffer) < run_size:
+        return iter(buffer)
+
+    # Spilling is rare, its modules are imported only when needed
+    import tempfile
+
+    # Runs are written right away, so items are consumed before returning
+    directory = tempfile.TemporaryDirectory(prefix="csv-report-sort-", dir=tmp_dir)
+    runs = []
+    while buffer:
+        run = Path(directory.name) / f"run-{len(runs)}.pickle"
+        _write_run(run, buffer)
+        runs.append(run)
+
+        buffer = list(islice(items, run_size))
+        buffer.sort(key=key, reverse=reverse)
+
+    logger.info(f"Merging {len(runs)} sorted runs of up to {run_size} items")
+    return _merge_runs(directory, runs, key, reverse)
+
+
+def _merge_runs(
+    directory: "TemporaryDirectory",
+    runs: list[Path],
+    key: _Key,
+    reverse: bool,
+) -> Iterator[Any]:
+    """Merging sorted runs, removing their directory afterwards."""
+
+    files = []
+    try:
+        files = [open(run, "rb") for run in runs]
+        # heapq.merge takes equal items from earlier runs first, so the
+        # merge keeps input order of equal items
+        yield from heapq.merge(*(_read_run(f) for f in files), key=key, reverse=reverse)
+    finally:
+        for f in files:
+            f.close()
+        directory.cleanup()
+
+
+def _write_run(run: Path, items: list[Any]) -> None:
+    import pickle
+
+    with open(run, "wb") as f:
+        for start in range(0, len(items), _BATCH_SIZE):
+            pickle.dump(items[start : start + _BATCH_SIZE], f, pickle.HIGHEST_PROTOCOL)
+
+
+def _read_run(f: BinaryIO) -> Iterator[Any]:
+    import pickle
+
+    while True:
+        try:
+            batch = pickle.load(f)
+        except EOFError:
+            return
+        yield from batch
+
+
+def top_k(
+    items: Iterable[Any], k: int, key: _Key = None, reverse: bool = False
+) -> list[Any]:
+    """
+    Getting the first `k` items in sorted order.
+
+    Only `k` items are kept in a heap, so memory doesn't depend on the
+    number of items. The result is equal to `sorted(items, ...)[:k]`.
+
+    Args:
+        items: Items, consumed once.
+        k: Number of items to keep.
+        key: Optional function of an item to sort by.
+        reverse: Whether to sort in descending order.
+
+    Returns:
+        List of at most `k` sorted items.
+    """
+
+    if reverse:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+def sort_rows(
+    items: Iterable[Any],
+    key: _Key = None,
+    reverse: bool = False,
+    limit: Optional[int] = None,
+    run_size: int = RUN_SIZE,
+) -> Iterator[Any]:
+    """
+    Sorting items, keeping only the first `limit` of them if given.
+
+    Args:
+        items: Picklable items, consumed once.
+        key: Optional function of an item to sort by.
+        reverse: Whether to sort in descending order.
+        limit: Optional maximum number of items, uses `top_k`.
+        run_size: Maximum number of items kept in memory by `external_sort`.
+
+    Returns:
+        Iterator over sorted items.
+    """
+
+    if limit is not None:
+        return iter(top_k(items, limit, key, reverse))
+    return external_sort(items, key, reverse, run_size)
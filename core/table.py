@@ -0,0 +1,204 @@
+from array import array
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from .filters import Predicate, compile_filter
+from .logger import log
+from .shortcuts import coerce_column, coerce_number
+
+
+class DictColumn:
+    """
+    Dictionary-encoded string column.
+
+    Every distinct value is stored once, rows keep only its integer code.
+    """
+
+    __slots__ = ("values", "codes", "_index")
+
+    def __init__(
+        self, values: Optional[list[str]] = None, codes: Optional[Sequence[int]] = None
+    ):
+        self.values: list[str] = values if values is not None else []
+        self.codes = codes if codes is not None else array("I")
+        self._index: Optional[dict[str, int]] = None
+
+    def append(self, value: str) -> None:
+        """
+        Appending value to the column.
+
+        Args:
+            value: String value.
+        """
+
+        if self._index is None:
+            self._index = {value: code for code, value in enumerate(self.values)}
+
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self.values.__getitem__, self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, DictColumn):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __getstate__(self):
+        return self.values, self.codes
+
+    def __setstate__(self, state):
+        self.values, self.codes = state
+        self._index = None
+
+
+def _compact_column(column: DictColumn) -> array | DictColumn:
+    """
+    Converting dictionary-encoded column into numeric array if possible.
+
+    Only distinct values are parsed, so the check is proportional to the
+    dictionary size rather than to the number of rows. Columns are kept as
+    strings unless every value is the canonical text of its number, so
+    values like "007" or "4.50" are not changed.
+
+    Args:
+        column: Dictionary-encoded column.
+
+    Returns:
+        array("q") or array("d") for numeric columns, the same column otherwise.
+    """
+
+    numbers = coerce_column(column.values)
+    if not isinstance(numbers, array):
+        return column
+
+    if any(str(coerce_number(value)) != value for value in column.values):
+        return column
+
+    return array(numbers.typecode, map(numbers.__getitem__, column.codes))
+
+
+class Table:
+    """
+    Columnar in-memory table.
+
+    Numeric columns are stored as typed arrays, string columns are
+    dictionary-encoded, so each header key is stored only once.
+    """
+
+    def __init__(self, columns: dict[str, Sequence[Any]]):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            error_msg = f"Columns have different lengths: {sorted(lengths)}"
+            raise ValueError(error_msg)
+
+        self.columns = columns
+        self.length = lengths.pop() if lengths else 0
+
+    @classmethod
+    @log(max_repr=200)
+    def from_rows(
+        cls,
+        rows: Iterable[dict[str, Any]],
+        columns: Optional[Sequence[str]] = None,
+    ) -> "Table":
+        """
+        Building table from rows.
+
+        Args:
+            rows: Iterable of dictionaries, consumed once.
+            columns: Column names to keep (default: all columns of first row).
+
+        Returns:
+            Table instance.
+
+        Raises:
+            KeyError: If row has no requested column.
+        """
+
+        builders: Optional[dict[str, DictColumn]] = None
+
+        for row in rows:
+            if builders is None:
+                names = list(row) if columns is None else list(columns)
+                builders = {name: DictColumn() for name in names}
+
+            for name, builder in builders.items():
+                builder.append(row[name])
+
+        if builders is None:
+            return cls({name: DictColumn() for name in columns or ()})
+
+        return cls(
+            {name: _compact_column(builder) for name, builder in builders.items()}
+        )
+
+    @property
+    def column_names(self) -> list[str]:
+        """Names of table columns."""
+
+        return list(self.columns)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        Getting column by name.
+
+        Args:
+            name: Column name.
+
+        Returns:
+            Column values.
+
+        Raises:
+            KeyError: If column doesn't exist.
+        """
+
+        return self.columns[name]
+
+    def iter_rows(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[Sequence[Predicate]] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterating over rows as dictionaries.
+
+        Args:
+            columns: Column names to include (default: all columns).
+            where: Optional predicates rows must match, tested on column
+                values before rows are built.
+
+        Yields:
+            Row dictionaries.
+
+        Raises:
+            ValueError: If table has no filter column.
+        """
+
+        names = list(self.columns) if columns is None else list(columns)
+        if not where:
+            for values in zip(*(self.columns[name] for name in names)):
+                yield dict(zip(names, values))
+            return
+
+        all_names = list(self.columns)
+        matches = compile_filter(where, all_names)
+        indices = [all_names.index(name) for name in names]
+        for values in zip(*self.columns.values()):
+            if matches(values):
+                yield {name: values[index] for name, index in zip(names, indices)}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self.iter_rows()
+
+    def __len__(self) -> int:
+        return self.length
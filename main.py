@@ -1,53 +1,327 @@
 import sys
 from csv import Error as csv_Error
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from core import (
+    AggregateReport,
     ArgParser,
-    CsvReader,
     ReportRegistry,
+    aggregate_files,
+    combine_reports,
+    open_reader,
     print_table,
+    profiling,
     setup_logging,
+    stream_files,
 )
-from core.defined_reports import AveragePerformanceReport
+
+if TYPE_CHECKING:
+    import cProfile
+
+    from core import CheckpointStore, FileCache, Profiler
+    from core.filters import Predicate
+
+
+def run_report(
+    report,
+    files: list[Path],
+    jobs: int,
+    cache: Optional["FileCache"] = None,
+    use_mmap: bool = False,
+    chunk_size: Optional[int] = None,
+    checkpoints: Optional["CheckpointStore"] = None,
+    where: Optional[list["Predicate"]] = None,
+    sample: Optional[float] = None,
+) -> tuple[Iterable[dict], int]:
+    """
+    Generating report over all files.
+
+    Aggregate reports are reduced file by file into partial states that are
+    merged here; other reports (and their combinations with aggregate
+    reports) consume one stream of rows from all files.
+
+    Args:
+        report: Report instance.
+        files: Paths to CSV files.
+        jobs: Number of worker processes for aggregate reports.
+        cache: Optional cache of per-file partial states.
+        use_mmap: Whether to scan memory-mapped files.
+        chunk_size: Optional chunk size in bytes for splitting files.
+        checkpoints: Optional store of per-file checkpoints for reading
+            only appended rows.
+        where: Optional predicates rows must match.
+        sample: Optional fraction of every CSV file to read.
+
+    Returns:
+        Tuple of (report rows, number of processed records).
+    """
+
+    if not isinstance(report, AggregateReport):
+        readers = [open_reader(file, use_mmap) for file in files]
+        with profiling.stage("generate"):
+            rows = stream_files(readers, report.columns, where, sample)
+            result = report.generate(rows)
+        for reader in readers:
+            print(f"CSV file {reader.file} is valid with {reader.rows_read} rows.")
+        return result, sum(reader.rows_read for reader in readers)
+
+    state = report.create_state()
+    records = 0
+    for file, partial, rows in aggregate_files(
+        files, report, jobs, cache, use_mmap, chunk_size, checkpoints, where, sample
+    ):
+        print(f"CSV file {file} is valid with {rows} rows.")
+        with profiling.stage("merge"):
+            state = report.merge(state, partial)
+        records += rows
+
+    with profiling.stage("finalize"):
+        return report.finalize(state), records
+
+
+def start_profiling(
+    output: Optional[str],
+) -> tuple["Profiler", Optional["cProfile.Profile"]]:
+    """
+    Starting profiler and cProfile if cProfile stats were requested.
+
+    Args:
+        output: Optional output path, cProfile stats for non-.json suffix.
+
+    Returns:
+        Tuple of (profiler, cProfile instance or None).
+    """
+
+    from core import Profiler
+
+    profiler = Profiler().start()
+    if not output or Path(output).suffix == ".json":
+        return profiler, None
+
+    import cProfile
+
+    cprofile = cProfile.Profile()
+    cprofile.enable()
+    return profiler, cprofile
+
+
+def finish_profiling(
+    profiler: "Profiler",
+    cprofile: Optional["cProfile.Profile"],
+    output: Optional[str],
+) -> None:
+    """
+    Printing profiling summary and writing requested output file.
+
+    Args:
+        profiler: Active profiler.
+        cprofile: cProfile instance if cProfile stats were requested.
+        output: Optional output path.
+    """
+
+    profiler.stop()
+    print_table(profiler.summary(limit=30), title="Profile")
+
+    if cprofile is not None:
+        cprofile.disable()
+        cprofile.dump_stats(output)
+    elif output:
+        profiler.dump_trace(Path(output))
+
+
+def register_reports() -> None:
+    """Registering reports available in the application."""
+
+    ReportRegistry.register_report(
+        "performance", "core.defined_reports.dev_performance:AveragePerformanceReport"
+    )
+    ReportRegistry.register_report(
+        "ranking", "core.defined_reports.dev_ranking:PerformanceRankingReport"
+    )
+    ReportRegistry.register_report(
+        "distribution",
+        "core.defined_reports.dev_distribution:PerformanceDistributionReport",
+    )
+
+
+def print_server_reports(
+    address: str,
+    files: list[Path],
+    names: list[str],
+    where: Optional[list["Predicate"]] = None,
+    limit: Optional[int] = None,
+) -> None:
+    """
+    Printing reports generated by running report server.
+
+    Args:
+        address: Unix socket path or host:port of the server.
+        files: Paths to CSV files.
+        names: Report names.
+        where: Optional predicates rows must match.
+        limit: Optional maximum number of rows of every report.
+    """
+
+    from core import query_server
+    from core.client import parse_address
+
+    expressions = [str(predicate) for predicate in where or ()]
+    try:
+        response = query_server(
+            parse_address(address), files, names, where=expressions, limit=limit
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    records = response["records"]
+    for report in response["reports"]:
+        title = f"Report: {report['name'].upper()} ({records} records)"
+        print_table(report["rows"], title=title)
+
+
+def print_reports(
+    names: list[str],
+    results: list,
+    records: int,
+    limit: Optional[int] = None,
+    sampled: bool = False,
+) -> None:
+    """
+    Printing rows of every report as a table.
+
+    Args:
+        names: Report names.
+        results: Rows of every report, in order of names.
+        records: Number of processed records.
+        limit: Optional maximum number of rows of every report.
+        sampled: Whether records are a sample of files.
+    """
+
+    label = "sampled records" if sampled else "records"
+    for name, rows in zip(names, results):
+        # Reports that don't sort their rows aren't cut by themselves
+        if limit:
+            rows = list(islice(rows, limit))
+        print_table(rows, title=f"Report: {name.upper()} ({records} {label})")
+
+
+def check_arguments(parser: ArgParser, args) -> None:
+    """
+    Checking arguments that can't be combined.
+
+    Args:
+        parser: Parser that produced args, exits with its error.
+        args: Parsed arguments.
+    """
+
+    if args.incremental and not args.cache_dir:
+        parser.error("Argument --incremental: requires --cache-dir")
+
+    if args.sample is not None and (args.incremental or args.server):
+        parser.error("Argument --sample: not allowed with --incremental or --server")
+
+
+def check_sampled_reports(
+    parser: ArgParser, args, names: list[str], reports: list
+) -> None:
+    """
+    Checking that reports can be estimated from a sample of files.
+
+    Only aggregate reports are, other reports list sampled rows, which
+    have no error bounds.
+
+    Args:
+        parser: Parser that produced args, exits with its error.
+        args: Parsed arguments.
+        names: Report names.
+        reports: Report instances, in order of names.
+    """
+
+    if args.sample is None:
+        return
+
+    unsupported = [
+        name
+        for name, report in zip(names, reports)
+        if not isinstance(report, AggregateReport)
+    ]
+    if unsupported:
+        parser.error(
+            f"Argument --sample: not supported by reports: {', '.join(unsupported)}"
+        )
 
 
 def main():
     """Entry point for the application."""
 
-    setup_logging()
-
-    ReportRegistry.register_report("performance", AveragePerformanceReport)
+    register_reports()
 
     parser = ArgParser()
     args = parser.parse_args()
+    check_arguments(parser, args)
 
-    all_data = []
-    for file_path in args.files:
-        path = Path(file_path)
-        reader = CsvReader(path)
+    setup_logging(
+        queue_size=args.log_queue_size or 10_000,
+        overflow=args.log_overflow or "block",
+    )
 
-        try:
-            print(reader.check_csv_file_valid)
-        except (FileNotFoundError, ValueError, csv_Error) as e:
-            print(f"Error: {e}")
-            sys.exit(1)
+    files = [Path(file_path) for file_path in args.files]
+    report_names = list(dict.fromkeys(args.report))
+    if args.server:
+        print_server_reports(args.server, files, report_names, args.where, args.limit)
+        return
 
-        data = reader.load_csv
-        all_data.extend(data)
+    # Optional features are imported only when used to keep startup fast
+    cache = checkpoints = None
+    if args.incremental:
+        from core import CheckpointStore
 
-    try:
-        report_instance = ReportRegistry.get_report(args.report)
-        result = report_instance.generate(all_data)
+        checkpoints = CheckpointStore(Path(args.cache_dir))
+    elif args.cache_dir:
+        from core import FileCache
 
-        print_table(
-            result, title=f"Report: {args.report.upper()} ({len(all_data)} records)"
-        )
+        cache = FileCache(Path(args.cache_dir), (args.cache_size or 256) * 1024 * 1024)
+
+    profiler = cprofile = None
+    if args.profile or args.profile_output:
+        profiler, cprofile = start_profiling(args.profile_output)
 
-    except ValueError as e:
+    try:
+        reports = [ReportRegistry.get_report(name) for name in report_names]
+        for report in reports:
+            report.limit = args.limit
+            report.approximate = args.sample is not None
+        check_sampled_reports(parser, args, report_names, reports)
+        # Several reports are fed from one pass over the files
+        report_instance = combine_reports(reports)
+        chunk_size = args.chunk_size * 1024 * 1024 if args.chunk_size else None
+        result, records = run_report(
+            report_instance,
+            files,
+            args.jobs or 1,
+            cache,
+            args.mmap,
+            chunk_size,
+            checkpoints,
+            args.where,
+            args.sample,
+        )
+    except (FileNotFoundError, ValueError, csv_Error) as e:
         print(f"Error: {e}")
         sys.exit(1)
 
+    results = [result] if len(reports) == 1 else result
+    with profiling.stage("render"):
+        print_reports(
+            report_names, results, records, args.limit, args.sample is not None
+        )
+
+    if profiler is not None:
+        finish_profiling(profiler, cprofile, args.profile_output)
+
 
 if __name__ == "__main__":
     main()
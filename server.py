@@ -0,0 +1,41 @@
+import argparse
+import asyncio
+
+from core import ReportServer, setup_logging
+from core.client import parse_address
+from core.server import DEFAULT_WATCH_INTERVAL
+from main import register_reports
+
+
+def main():
+    """Entry point for the report server."""
+
+    parser = argparse.ArgumentParser(
+        description="Serving reports over files kept in memory.",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "address",
+        help="Unix socket path or host:port (e.g. localhost:8765) to listen on.",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL,
+        help="Seconds between checks of loaded files for changes "
+        f"(default: {DEFAULT_WATCH_INTERVAL:g}).",
+    )
+    args = parser.parse_args()
+
+    register_reports()
+    setup_logging(queue_size=10_000)
+
+    server = ReportServer(args.watch_interval)
+    try:
+        asyncio.run(server.serve(parse_address(args.address)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
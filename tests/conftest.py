@@ -1,10 +1,13 @@
 import csv
+import logging
 import tempfile
 from pathlib import Path
 from typing import Iterator
 
 import pytest
 
+from core.logger import stop_logging
+
 
 @pytest.fixture(name="perf_data")
 def _sample_data_avg_perf_report() -> list[dict[str, str]]:
@@ -104,6 +107,63 @@ def empty_value_csv_file() -> Iterator[Path]:
     temp_path.unlink()
 
 
+@pytest.fixture
+def bad_row_csv_file() -> Iterator[Path]:
+    """Creating a temporary CSV file with a short row after a valid one."""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+        f.write("name,position,performance\n")
+        f.write("John,Developer,4.5\n")
+        f.write("Jane,Developer\n")
+        f.write("Bob,Developer,4.9\n")
+        temp_path = Path(f.name)
+
+    yield temp_path
+
+    temp_path.unlink()
+
+
+@pytest.fixture
+def multiline_csv_file() -> Iterator[Path]:
+    """Creating a temporary CSV file with quoted multiline field."""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+        f.write("name,skills,performance\n")
+        f.write('John,"Python,\nDjango",4.5\n')
+        f.write('Jane,"Go",4.9\n')
+        temp_path = Path(f.name)
+
+    yield temp_path
+
+    temp_path.unlink()
+
+
+@pytest.fixture
+def zero_bytes_csv_file() -> Iterator[Path]:
+    """Creating a temporary CSV file without any content."""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+        temp_path = Path(f.name)
+
+    yield temp_path
+
+    temp_path.unlink()
+
+
+@pytest.fixture
+def unterminated_csv_file() -> Iterator[Path]:
+    """Creating a temporary CSV file ending inside a quoted field."""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+        f.write("name,skills\n")
+        f.write('John,"Python\n')
+        temp_path = Path(f.name)
+
+    yield temp_path
+
+    temp_path.unlink()
+
+
 @pytest.fixture
 def non_csv_file() -> Iterator[Path]:
     """Creating a temporary non-CSV file for testing csv_tools."""
@@ -212,3 +272,19 @@ def zero_files_args() -> list[str]:
     """Zero-files arguments for testing arg_parser."""
 
     return ["--files", "--report", "performance"]
+
+
+@pytest.fixture
+def log_dir() -> Iterator[Path]:
+    """Temporary log directory, root logger handlers are restored afterwards."""
+
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory)
+
+        stop_logging()
+        for handler in root_logger.handlers:
+            handler.close()
+        root_logger.handlers, root_logger.level = handlers, level
@@ -0,0 +1,169 @@
+import pickle
+from statistics import variance
+
+from pytest import approx
+
+from core import (
+    ClusterAccumulator,
+    GroupedAccumulator,
+    StatsAccumulator,
+    SumAccumulator,
+)
+
+
+class TestSumAccumulator:
+    """Tests for SumAccumulator class."""
+
+    def test_add_values(self):
+        accumulator = SumAccumulator()
+        for value in (1, 2, 3.5):
+            accumulator.add(value)
+
+        assert accumulator.count == 3
+        assert accumulator.total == 6.5
+        assert accumulator.mean == approx(6.5 / 3)
+
+    def test_empty_mean_is_none(self):
+        assert SumAccumulator().mean is None
+
+    def test_merge(self):
+        first, second = SumAccumulator(), SumAccumulator()
+        first.add(1)
+        second.add(3)
+
+        first.merge(second)
+
+        assert first.count == 2
+        assert first.mean == 2
+
+
+class TestStatsAccumulator:
+    """Tests for StatsAccumulator class."""
+
+    def test_min_max_variance(self):
+        values = [4.8, 4.6, 4.7, 4.9, 4.5]
+        accumulator = StatsAccumulator()
+        for value in values:
+            accumulator.add(value)
+
+        assert accumulator.minimum == 4.5
+        assert accumulator.maximum == 4.9
+        assert accumulator.variance == approx(variance(values))
+
+    def test_merge_matches_single_pass(self):
+        values = [1.0, 2.5, 3.0, 10.0, -4.0, 7.25]
+        whole, left, right = StatsAccumulator(), StatsAccumulator(), StatsAccumulator()
+        for value in values:
+            whole.add(value)
+        for value in values[:2]:
+            left.add(value)
+        for value in values[2:]:
+            right.add(value)
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.variance == approx(whole.variance)
+        assert left.minimum == whole.minimum
+        assert left.maximum == whole.maximum
+
+    def test_merge_empty(self):
+        accumulator = StatsAccumulator()
+        accumulator.add(2)
+
+        accumulator.merge(StatsAccumulator())
+
+        assert accumulator.count == 1
+        assert accumulator.variance is None
+
+
+def _cluster_accumulator(clusters):
+    accumulators = []
+    for values in clusters:
+        accumulator = ClusterAccumulator()
+        for value in values:
+            accumulator.add(value)
+        accumulators.append(accumulator)
+
+    merged = accumulators[0]
+    for accumulator in accumulators[1:]:
+        merged.merge(accumulator)
+    return merged
+
+
+class TestClusterAccumulator:
+    """Tests for ClusterAccumulator class."""
+
+    def test_mean_variance_of_clusters(self):
+        clusters = [[4.0, 4.2], [3.0], [5.0, 5.2, 4.8]]
+        accumulator = _cluster_accumulator(clusters)
+
+        mean = sum(map(sum, clusters)) / 6
+        residuals = sum((sum(c) - mean * len(c)) ** 2 for c in clusters)
+
+        assert accumulator.clusters == 3
+        assert accumulator.mean == approx(mean)
+        assert accumulator.mean_variance == approx(3 / 2 * residuals / 36)
+
+    def test_correlated_clusters_increase_variance(self):
+        values = [4.0, 4.1, 4.2, 5.0, 5.1, 5.2]
+        similar = _cluster_accumulator([values[:3], values[3:]])
+        mixed = _cluster_accumulator([values[::2], values[1::2]])
+
+        assert similar.mean_variance > mixed.mean_variance
+
+    def test_single_cluster_has_no_variance(self):
+        accumulator = _cluster_accumulator([[1.0, 2.0, 3.0]])
+        accumulator.merge(ClusterAccumulator())
+
+        assert accumulator.variance == 1.0
+        assert accumulator.mean_variance is None
+        assert accumulator.mean_error is None
+
+    def test_mean_error_is_95_percent_half_width(self):
+        accumulator = _cluster_accumulator([[4.0, 4.2], [3.0], [5.0, 5.2, 4.8]])
+
+        assert accumulator.mean_error == approx(1.96 * accumulator.mean_variance**0.5)
+
+    def test_unmerged_values_count_as_cluster(self):
+        accumulator = _cluster_accumulator([[1.0], [3.0]])
+        accumulator.add(5.0)
+
+        assert accumulator.mean_variance == approx(
+            _cluster_accumulator([[1.0], [3.0], [5.0]]).mean_variance
+        )
+
+    def test_pickle(self):
+        accumulator = _cluster_accumulator([[1.0], [2.0, 4.0]])
+
+        restored = pickle.loads(pickle.dumps(accumulator))
+
+        assert restored.mean_variance == accumulator.mean_variance
+
+
+class TestGroupedAccumulator:
+    """Tests for GroupedAccumulator class."""
+
+    def test_groups_values(self):
+        grouped = GroupedAccumulator()
+        grouped.add("a", 1)
+        grouped.add("a", 3)
+        grouped.add("b", 5)
+
+        assert len(grouped) == 2
+        assert {key: acc.mean for key, acc in grouped.items()} == {"a": 2, "b": 5}
+
+    def test_merge_and_pickle(self):
+        first, second = GroupedAccumulator(StatsAccumulator), GroupedAccumulator(
+            StatsAccumulator
+        )
+        first.add("a", 1)
+        second.add("a", 3)
+        second.add("b", 5)
+
+        merged = pickle.loads(pickle.dumps(first.merge(second)))
+
+        assert merged.factory is StatsAccumulator
+        assert merged.groups["a"].count == 2
+        assert merged.groups["a"].maximum == 3
+        assert merged.groups["b"].mean == 5
@@ -11,7 +11,7 @@ class TestArgParser:
         args = parser.parse_args(valid_args)
 
         assert args.files == ["file.csv"]
-        assert args.report == "performance"
+        assert args.report == ["performance"]
 
     def test_parse_multiple_files(self, valid_multiple_files_args):
         parser = ArgParser()
@@ -19,7 +19,15 @@ class TestArgParser:
 
         assert len(args.files) == 3
         assert args.files == ["file1.csv", "file2.csv", "file3.csv"]
-        assert args.report == "performance"
+        assert args.report == ["performance"]
+
+    def test_parse_multiple_reports(self):
+        parser = ArgParser()
+        args = parser.parse_args(
+            ["--files", "file.csv", "--report", "performance", "other"]
+        )
+
+        assert args.report == ["performance", "other"]
 
     def test_missing_files_argument_raises_error(self, no_files_args):
         """Test that missing --files raises SystemExit."""
@@ -68,3 +76,121 @@ class TestArgParser:
         parser = ArgParser()
         with pt_raises(SystemExit):
             parser.parse_args(zero_files_args)
+
+    def test_jobs_default_is_none(self, valid_args):
+        parser = ArgParser()
+        args = parser.parse_args(valid_args)
+
+        assert args.jobs is None
+
+    def test_jobs_argument(self, valid_args):
+        parser = ArgParser()
+        args = parser.parse_args(valid_args + ["--jobs", "4"])
+
+        assert args.jobs == 4
+
+    def test_jobs_zero_uses_all_cpus(self, valid_args):
+        parser = ArgParser()
+        args = parser.parse_args(valid_args + ["--jobs", "0"])
+
+        assert args.jobs >= 1
+
+    def test_jobs_negative_raises_error(self, valid_args):
+        parser = ArgParser()
+        with pt_raises(SystemExit):
+            parser.parse_args(valid_args + ["--jobs", "-2"])
+
+    def test_cache_arguments(self, valid_args):
+        parser = ArgParser()
+        args = parser.parse_args(
+            valid_args + ["--cache-dir", ".cache", "--cache-size", "16"]
+        )
+
+        assert args.cache_dir == ".cache"
+        assert args.cache_size == 16
+
+    def test_cache_size_zero_raises_error(self, valid_args):
+        parser = ArgParser()
+        with pt_raises(SystemExit):
+            parser.parse_args(valid_args + ["--cache-size", "0"])
+
+    def test_mmap_flag(self, valid_args):
+        parser = ArgParser()
+
+        assert parser.parse_args(valid_args).mmap is False
+        assert parser.parse_args(valid_args + ["--mmap"]).mmap is True
+
+    def test_chunk_size_argument(self, valid_args):
+        parser = ArgParser()
+        args = parser.parse_args(valid_args + ["--chunk-size", "64"])
+
+        assert args.chunk_size == 64
+
+    def test_profile_arguments(self, valid_args):
+        parser = ArgParser()
+        args = parser.parse_args(valid_args)
+
+        assert args.profile is False
+        assert args.profile_output is None
+
+        args = parser.parse_args(
+            valid_args + ["--profile", "--profile-output", "trace.json"]
+        )
+
+        assert args.profile is True
+        assert args.profile_output == "trace.json"
+
+    def test_log_queue_arguments(self, valid_args):
+        parser = ArgParser()
+        args = parser.parse_args(
+            valid_args + ["--log-queue-size", "100", "--log-overflow", "drop"]
+        )
+
+        assert args.log_queue_size == 100
+        assert args.log_overflow == "drop"
+
+        with pt_raises(SystemExit):
+            parser.parse_args(valid_args + ["--log-overflow", "ignore"])
+
+    def test_incremental_flag(self, valid_args):
+        parser = ArgParser()
+
+        assert parser.parse_args(valid_args).incremental is False
+        assert parser.parse_args(valid_args + ["--incremental"]).incremental is True
+
+    def test_limit_argument(self, valid_args):
+        parser = ArgParser()
+
+        assert parser.parse_args(valid_args).limit is None
+        assert parser.parse_args(valid_args + ["--limit", "10"]).limit == 10
+
+        with pt_raises(SystemExit):
+            parser.parse_args(valid_args + ["--limit", "0"])
+
+    def test_sample_argument(self, valid_args):
+        parser = ArgParser()
+
+        assert parser.parse_args(valid_args).sample is None
+        assert parser.parse_args(valid_args + ["--sample", "0.05"]).sample == 0.05
+
+        for value in ("0", "2", "half"):
+            with pt_raises(SystemExit):
+                parser.parse_args(valid_args + ["--sample", value])
+
+    def test_where_argument(self, valid_args):
+        parser = ArgParser()
+        args = parser.parse_args(
+            valid_args + ["--where", "position == QA Engineer", "performance>4"]
+        )
+
+        assert parser.parse_args(valid_args).where is None
+        assert [str(predicate) for predicate in args.where] == [
+            "position == 'QA Engineer'",
+            "performance > 4",
+        ]
+
+    def test_invalid_where_raises_error(self, valid_args):
+        parser = ArgParser()
+
+        with pt_raises(SystemExit):
+            parser.parse_args(valid_args + ["--where", "performance"])
@@ -0,0 +1,115 @@
+import os
+
+from core import CheckpointStore, FileCache
+from core.cache import content_digest, file_fingerprint
+
+
+class TestFileFingerprint:
+    """Tests for file_fingerprint function."""
+
+    def test_fingerprint_is_stable(self, valid_csv_file):
+        assert file_fingerprint(valid_csv_file) == file_fingerprint(valid_csv_file)
+
+    def test_fingerprint_changes_with_content(self, valid_csv_file):
+        before = file_fingerprint(valid_csv_file)
+        stat = valid_csv_file.stat()
+
+        with open(valid_csv_file, "r+") as f:
+            f.write("X")
+        os.utime(valid_csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert file_fingerprint(valid_csv_file) != before
+
+
+class TestFileCache:
+    """Tests for FileCache class."""
+
+    def test_put_and_get(self, tmp_path, valid_csv_file):
+        cache = FileCache(tmp_path / "cache")
+        cache.put(valid_csv_file, "report", {"a": 1})
+
+        assert cache.get(valid_csv_file, "report") == {"a": 1}
+        assert cache.get(valid_csv_file, "other") is None
+
+    def test_get_missing_file(self, tmp_path, nonexistent_file):
+        cache = FileCache(tmp_path)
+
+        assert cache.get(nonexistent_file, "report") is None
+
+    def test_changed_file_misses(self, tmp_path, valid_csv_file):
+        cache = FileCache(tmp_path)
+        cache.put(valid_csv_file, "report", 1)
+
+        with open(valid_csv_file, "a") as f:
+            f.write("Ann,Developer,4.1\n")
+
+        assert cache.get(valid_csv_file, "report") is None
+
+    def test_broken_entry_is_dropped(self, tmp_path, valid_csv_file):
+        cache = FileCache(tmp_path)
+        cache.put(valid_csv_file, "report", 1)
+        (entry,) = tmp_path.glob("*.pickle")
+        entry.write_bytes(b"broken")
+
+        assert cache.get(valid_csv_file, "report") is None
+        assert not entry.exists()
+
+    def test_evict_least_recently_used(self, tmp_path, valid_csv_file):
+        cache = FileCache(tmp_path)
+        cache.put(valid_csv_file, "old", "x" * 100)
+        (old_entry,) = tmp_path.glob("*.pickle")
+        os.utime(old_entry, ns=(0, 0))
+        cache.put(valid_csv_file, "new", "y")
+
+        cache.max_size = min(
+            entry.stat().st_size for entry in tmp_path.glob("*.pickle")
+        )
+        cache.evict()
+
+        assert not old_entry.exists()
+        assert cache.get(valid_csv_file, "new") == "y"
+
+
+class TestCheckpointStore:
+    """Tests for CheckpointStore class."""
+
+    def test_put_and_get(self, tmp_path, valid_csv_file):
+        store = CheckpointStore(tmp_path)
+        store.put(valid_csv_file, "report", 10, 1, 0, {"a": 1})
+
+        checkpoint = store.get(valid_csv_file, "report")
+
+        assert checkpoint.offset == 10
+        assert checkpoint.state == {"a": 1}
+        assert checkpoint.digest == content_digest(valid_csv_file, 10)
+        assert store.get(valid_csv_file, "other") is None
+
+    def test_appended_file_keeps_checkpoint(self, tmp_path, valid_csv_file):
+        store = CheckpointStore(tmp_path)
+        size = valid_csv_file.stat().st_size
+        store.put(valid_csv_file, "report", size, 6, 5, {})
+
+        with open(valid_csv_file, "a") as f:
+            f.write("Bob,QA,4.1\n")
+
+        assert store.get(valid_csv_file, "report").offset == size
+
+    def test_truncated_file_drops_checkpoint(self, tmp_path, valid_csv_file):
+        store = CheckpointStore(tmp_path)
+        size = valid_csv_file.stat().st_size
+        store.put(valid_csv_file, "report", size, 6, 5, {})
+
+        with open(valid_csv_file, "r+") as f:
+            f.truncate(size - 1)
+
+        assert store.get(valid_csv_file, "report") is None
+
+    def test_rewritten_file_drops_checkpoint(self, tmp_path, valid_csv_file):
+        store = CheckpointStore(tmp_path)
+        size = valid_csv_file.stat().st_size
+        store.put(valid_csv_file, "report", size, 6, 5, {})
+
+        with open(valid_csv_file, "r+") as f:
+            f.write("X")
+
+        assert store.get(valid_csv_file, "report") is None
@@ -1,4 +1,4 @@
-from core import print_table
+from core import cli_tools, print_table
 
 
 class TestPrintTable:
@@ -46,3 +46,68 @@ class TestPrintTable:
 
         assert "+" in captured.out
         assert "|" in captured.out
+
+    def test_print_table_matches_grid_format(self, capsys):
+        data = [
+            {"name": "John\nSmith", "rating": 4.0, "tasks": 3, "score": "4.80"},
+            {"name": "Jane", "rating": 12.25, "tasks": 10, "score": None},
+        ]
+        print_table(data)
+        captured = capsys.readouterr()
+
+        assert captured.out == (
+            "+--------+----------+---------+---------+\n"
+            "| name   |   rating |   tasks |   score |\n"
+            "+========+==========+=========+=========+\n"
+            "| John   |        4 |       3 |     4.8 |\n"
+            "| Smith  |          |         |         |\n"
+            "+--------+----------+---------+---------+\n"
+            "| Jane   |    12.25 |      10 |         |\n"
+            "+--------+----------+---------+---------+\n"
+            "\n"
+        )
+
+    def test_print_table_aligns_wide_characters(self, capsys):
+        data = [
+            {"name": "王小明", "position": "後端開発者", "performance": 4.8},
+            {"name": "Jose\u0301", "position": "QA", "performance": 4.5},
+        ]
+        print_table(data, title="Отчёт 報告")
+        captured = capsys.readouterr()
+
+        lines = captured.out.strip("\n").split("\n")
+        widths = {cli_tools._line_width(line) for line in lines[2:]}
+
+        assert lines[1] == "=" * cli_tools._line_width(lines[0])
+        assert widths == {len(lines[2])}
+        assert "| 王小明 |" in captured.out
+
+    def test_print_table_streams_iterables(self, capsys, monkeypatch):
+        monkeypatch.setattr(cli_tools, "CHUNK_LINES", 2)
+        written = []
+
+        def rows():
+            for index in range(5):
+                written.append(capsys.readouterr().out.count("row"))
+                yield {"name": f"row {index}"}
+
+        print_table(rows(), sample_size=1)
+
+        assert written[0] == 0
+        assert written[-1] > 0
+        assert "row 4" in capsys.readouterr().out
+
+    def test_print_table_sample_width(self, capsys):
+        rows = iter([{"name": "a"}, {"name": "longer"}])
+        print_table(rows, sample_size=1)
+        lines = capsys.readouterr().out.splitlines()
+
+        assert lines[0] == "+--------+"
+        assert lines[3] == "| a      |"
+        assert lines[5] == "| longer |"
+
+    def test_print_table_empty_iterable(self, capsys):
+        print_table(iter([]))
+        captured = capsys.readouterr()
+
+        assert "No data to display" in captured.out
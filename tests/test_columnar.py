@@ -0,0 +1,172 @@
+from array import array
+
+from pytest import raises as pt_raises
+
+from core import (
+    ColumnarReader,
+    CsvReader,
+    Table,
+    aggregate_files,
+    convert_csv,
+    open_reader,
+    write_table,
+)
+from core.defined_reports import AveragePerformanceReport
+from core.filters import parse_predicate
+from core.table import DictColumn
+
+
+class TestColumnarFormat:
+    """Tests for writing and reading columnar files."""
+
+    def test_round_trip(self, tmp_path):
+        table = Table(
+            {
+                "ints": array("q", [3, -1, 2]),
+                "floats": array("d", [4.5, 1.25, 3.0]),
+                "names": DictColumn(["b", "a"], array("I", [0, 1, 0])),
+            }
+        )
+        path = tmp_path / "data.csvb"
+        write_table(table, path)
+
+        loaded = ColumnarReader(path).load_table()
+
+        assert loaded.column_names == ["ints", "floats", "names"]
+        assert list(loaded.iter_rows()) == list(table.iter_rows())
+        assert ColumnarReader(path).stats == {
+            "ints": (-1, 3),
+            "floats": (1.25, 4.5),
+            "names": ("a", "b"),
+        }
+
+    def test_columns_are_memory_mapped(self, tmp_path):
+        path = tmp_path / "data.csvb"
+        write_table(Table({"ints": array("q", [1, 2])}), path)
+
+        column = ColumnarReader(path).load_table().column("ints")
+
+        assert isinstance(column, memoryview)
+        assert column.tolist() == [1, 2]
+
+    def test_loaded_table_can_be_written_again(self, tmp_path):
+        path, copy = tmp_path / "data.csvb", tmp_path / "copy.csvb"
+        table = Table(
+            {
+                "ints": array("q", [1, 2]),
+                "names": DictColumn([""], array("I", [0, 0])),
+            }
+        )
+        write_table(table, path)
+
+        write_table(ColumnarReader(path).load_table(), copy)
+
+        assert list(ColumnarReader(copy).iter_rows()) == list(table.iter_rows())
+
+    def test_load_selected_columns(self, tmp_path, valid_csv_file):
+        path = convert_csv(valid_csv_file, tmp_path / "data.csvb")
+        reader = ColumnarReader(path)
+
+        rows = list(reader.iter_rows(["position", "performance"]))
+
+        assert rows[0] == {"position": "Backend Developer", "performance": 4.8}
+        assert reader.rows_read == 5
+
+    def test_missing_column_raises_error(self, tmp_path, valid_csv_file):
+        path = convert_csv(valid_csv_file, tmp_path / "data.csvb")
+
+        with pt_raises(ValueError, match="has no columns: salary"):
+            ColumnarReader(path).load_table(["salary"])
+
+    def test_invalid_file_raises_error(self, tmp_path):
+        path = tmp_path / "data.csvb"
+        path.write_bytes(b"name,performance\nJohn,4.8\n")
+
+        with pt_raises(ValueError, match="is not a valid columnar file"):
+            ColumnarReader(path).load_table()
+
+    def test_wrong_suffix_raises_error(self, valid_csv_file):
+        with pt_raises(ValueError, match="is not a columnar file"):
+            ColumnarReader(valid_csv_file).load_table()
+
+    def test_nonexistent_file_raises_error(self, tmp_path):
+        with pt_raises(FileNotFoundError):
+            ColumnarReader(tmp_path / "missing.csvb").load_table()
+
+    def test_unsupported_column_raises_error(self, tmp_path):
+        with pt_raises(TypeError, match="Unsupported column type"):
+            write_table(Table({"values": [1, None]}), tmp_path / "data.csvb")
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestConvertCsv:
+    """Tests for convert_csv function."""
+
+    def test_default_output_path(self, valid_csv_file):
+        path = convert_csv(valid_csv_file)
+
+        try:
+            assert path == valid_csv_file.with_suffix(".csvb")
+            assert len(ColumnarReader(path).load_table()) == 5
+        finally:
+            path.unlink()
+
+    def test_invalid_csv_raises_error(self, tmp_path, nonexistent_file):
+        with pt_raises(FileNotFoundError):
+            convert_csv(nonexistent_file, tmp_path / "data.csvb")
+
+
+class TestOpenReader:
+    """Tests for open_reader function."""
+
+    def test_reader_by_suffix(self, tmp_path, valid_csv_file):
+        path = convert_csv(valid_csv_file, tmp_path / "data.csvb")
+
+        assert isinstance(open_reader(path), ColumnarReader)
+        assert isinstance(open_reader(valid_csv_file), CsvReader)
+
+    def test_aggregate_columnar_files(self, tmp_path, valid_csv_file):
+        path = convert_csv(valid_csv_file, tmp_path / "data.csvb")
+        report = AveragePerformanceReport()
+
+        results = list(aggregate_files([path, valid_csv_file], report, chunk_size=16))
+
+        assert [rows for _, _, rows in results] == [5, 5]
+        assert report.finalize(results[0][1]) == report.finalize(results[1][1])
+
+    def test_iter_rows_where(self, tmp_path, valid_csv_file):
+        path = convert_csv(valid_csv_file, tmp_path / "data.csvb")
+        where = [parse_predicate("position == QA Engineer")]
+        reader = ColumnarReader(path)
+
+        assert list(reader.iter_rows(["name"], where=where)) == [{"name": "Mike"}]
+        assert reader.rows_read == 1
+
+    def test_leading_zeros_survive_conversion(self, tmp_path):
+        csv_file = tmp_path / "zips.csv"
+        csv_file.write_text("name,zip\nBob,02134\nJane,10001\n", encoding="utf-8")
+        path = convert_csv(csv_file, tmp_path / "zips.csvb")
+        where = [parse_predicate('zip == "02134"')]
+
+        assert list(ColumnarReader(path).iter_rows(where=where)) == list(
+            CsvReader(csv_file).iter_rows(where=where)
+        )
+        assert list(ColumnarReader(path).iter_rows(["zip"])) == [
+            {"zip": "02134"},
+            {"zip": "10001"},
+        ]
+
+    def test_file_outside_filter_range_is_skipped(
+        self, tmp_path, valid_csv_file, monkeypatch
+    ):
+        path = convert_csv(valid_csv_file, tmp_path / "data.csvb")
+        where = [parse_predicate("performance > 5")]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Columns were loaded")
+
+        monkeypatch.setattr(ColumnarReader, "load_table", fail)
+        results = list(aggregate_files([path], AveragePerformanceReport(), where=where))
+
+        assert [rows for _, _, rows in results] == [0]
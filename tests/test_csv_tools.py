@@ -3,6 +3,8 @@ from csv import Error as csv_Error
 from pytest import raises as pt_raises
 
 from core import CsvReader
+from core import csv_tools as core_csv_tools
+from core.filters import parse_predicate
 
 
 class TestCsvReader:
@@ -109,3 +111,294 @@ class TestCsvReader:
 
         assert data1 == data2
         assert len(data1) == 5
+
+    def test_iter_rows_yields_dicts(self, valid_csv_file):
+        reader = CsvReader(valid_csv_file)
+        rows = reader.iter_rows()
+
+        assert not isinstance(rows, list)
+        assert next(rows) == {
+            "name": "John",
+            "position": "Backend Developer",
+            "performance": "4.8",
+        }
+        assert len(list(rows)) == 4
+        assert reader.rows_read == 5
+
+    def test_iter_rows_file_not_found(self, nonexistent_file):
+        """Test that missing file is reported before iteration starts."""
+
+        reader = CsvReader(nonexistent_file)
+
+        with pt_raises(FileNotFoundError, match="does not exist"):
+            reader.iter_rows()
+
+    def test_iter_rows_stops_at_first_bad_row(self, bad_row_csv_file):
+        """Test that rows before the bad one are yielded and line is reported."""
+
+        reader = CsvReader(bad_row_csv_file)
+        rows = reader.iter_rows()
+
+        assert next(rows)["name"] == "John"
+        with pt_raises(csv_Error, match=r"line 3"):
+            next(rows)
+
+    def test_iter_rows_empty_value_line_number(self, empty_value_csv_file):
+        reader = CsvReader(empty_value_csv_file)
+
+        with pt_raises(csv_Error, match=r"Empty value in row \(line 2\)"):
+            list(reader.iter_rows())
+
+    def test_iter_rows_empty_file(self, empty_csv_file):
+        reader = CsvReader(empty_csv_file)
+
+        with pt_raises(csv_Error, match="is empty"):
+            list(reader.iter_rows())
+
+    def test_iter_rows_projects_columns(self, valid_csv_file):
+        reader = CsvReader(valid_csv_file)
+        rows = list(reader.iter_rows(["performance", "position"]))
+
+        assert rows[0] == {"performance": "4.8", "position": "Backend Developer"}
+        assert len(rows) == 5
+
+    def test_iter_rows_projects_single_column(self, valid_csv_file):
+        reader = CsvReader(valid_csv_file)
+        rows = list(reader.iter_rows(["name"]))
+
+        assert rows[0] == {"name": "John"}
+
+    def test_iter_rows_missing_column(self, valid_csv_file):
+        reader = CsvReader(valid_csv_file)
+
+        with pt_raises(csv_Error, match="has no columns: team"):
+            list(reader.iter_rows(["position", "team"]))
+
+    def test_iter_rows_where(self, valid_csv_file):
+        reader = CsvReader(valid_csv_file)
+        where = [parse_predicate("performance >= 4.7")]
+        rows = list(reader.iter_rows(["name"], where=where))
+
+        assert rows == [{"name": "John"}, {"name": "Bob"}, {"name": "Alice"}]
+        assert reader.rows_read == 3
+
+    def test_iter_rows_where_matches_nothing(self, valid_csv_file):
+        reader = CsvReader(valid_csv_file)
+        rows = list(reader.iter_rows(where=[parse_predicate("name == Nobody")]))
+
+        assert rows == []
+        assert reader.rows_read == 0
+
+    def test_iter_rows_missing_filter_column(self, valid_csv_file):
+        reader = CsvReader(valid_csv_file)
+
+        with pt_raises(csv_Error, match="has no columns: team"):
+            list(reader.iter_rows(["name"], where=[parse_predicate("team == Web")]))
+
+
+class TestCsvReaderMmap:
+    """Tests for CsvReader in memory-mapped mode."""
+
+    def test_mmap_rows_match_text_mode(self, valid_csv_file):
+        text_rows = list(CsvReader(valid_csv_file).iter_rows())
+        mmap_rows = list(CsvReader(valid_csv_file, use_mmap=True).iter_rows())
+
+        assert mmap_rows == text_rows
+
+    def test_mmap_quoted_multiline_field(self, multiline_csv_file):
+        reader = CsvReader(multiline_csv_file, use_mmap=True)
+        rows = list(reader.iter_rows(["name", "skills"]))
+
+        assert rows == list(CsvReader(multiline_csv_file).iter_rows(["name", "skills"]))
+        assert rows[0]["skills"] == "Python,\nDjango"
+        assert reader.rows_read == 2
+
+    def test_mmap_custom_delimiter_and_quotes(
+        self, semicolon_csv_file, quotes_csv_file
+    ):
+        rows = list(CsvReader(semicolon_csv_file, ";", use_mmap=True).iter_rows())
+        assert rows[1] == {"name": "Jane", "position": "Designer", "performance": "4.9"}
+
+        rows = list(CsvReader(quotes_csv_file, use_mmap=True).iter_rows())
+        assert rows[0]["position"] == 'Fake "Developer"'
+
+    def test_mmap_bad_row_line_number(self, bad_row_csv_file):
+        reader = CsvReader(bad_row_csv_file, use_mmap=True)
+
+        with pt_raises(csv_Error, match=r"More or less columns.*line 3"):
+            list(reader.iter_rows())
+
+    def test_mmap_empty_value(self, empty_value_csv_file):
+        reader = CsvReader(empty_value_csv_file, use_mmap=True)
+
+        with pt_raises(csv_Error, match=r"Empty value in row \(line 2\)"):
+            list(reader.iter_rows())
+
+    def test_mmap_empty_files(self, empty_csv_file, zero_bytes_csv_file):
+        for file in (empty_csv_file, zero_bytes_csv_file):
+            with pt_raises(csv_Error, match="is empty"):
+                list(CsvReader(file, use_mmap=True).iter_rows())
+
+    def test_mmap_where_matches_text_mode(self, valid_csv_file):
+        where = [parse_predicate("position != Backend Developer")]
+        text_rows = list(CsvReader(valid_csv_file).iter_rows(where=where))
+        mmap_rows = list(
+            CsvReader(valid_csv_file, use_mmap=True).iter_rows(where=where)
+        )
+
+        assert mmap_rows == text_rows
+        assert len(mmap_rows) == 3
+
+    def test_mmap_unterminated_quote(self, unterminated_csv_file):
+        reader = CsvReader(unterminated_csv_file, use_mmap=True)
+
+        with pt_raises(csv_Error, match="Unterminated quoted field"):
+            list(reader.iter_rows())
+
+
+class TestCsvReaderRanges:
+    """Tests for CsvReader byte ranges."""
+
+    def test_split_ranges_cover_all_rows(self, multiline_csv_file):
+        reader = CsvReader(multiline_csv_file)
+        ranges = reader.split_ranges(1)
+
+        rows = []
+        for byte_range in ranges:
+            rows.extend(CsvReader(multiline_csv_file).iter_rows(byte_range=byte_range))
+
+        assert len(ranges) == 2
+        assert ranges[1][2] == 3
+        assert rows == list(CsvReader(multiline_csv_file).iter_rows())
+
+    def test_split_ranges_single_range(self, valid_csv_file):
+        ranges = CsvReader(valid_csv_file).split_ranges(1024 * 1024)
+
+        assert len(ranges) == 1
+        assert ranges[0][1] == valid_csv_file.stat().st_size
+
+    def test_range_errors_report_global_line(self, bad_row_csv_file):
+        reader = CsvReader(bad_row_csv_file)
+        last_range = reader.split_ranges(1)[-2]
+
+        with pt_raises(csv_Error, match="line 3"):
+            list(reader.iter_rows(byte_range=last_range))
+
+    def test_split_ranges_empty_file(self, empty_csv_file, zero_bytes_csv_file):
+        for file in (empty_csv_file, zero_bytes_csv_file):
+            with pt_raises(csv_Error, match="is empty"):
+                CsvReader(file).split_ranges(1)
+
+    def test_split_ranges_non_csv_file(self, non_csv_file):
+        with pt_raises(ValueError, match="is not a CSV file"):
+            CsvReader(non_csv_file).split_ranges(1)
+
+    def test_sample_ranges_are_spread_over_file(self, multiline_csv_file):
+        with open(multiline_csv_file, "a") as f:
+            f.writelines(f'Dev{i},"Go,\nRust",4.{i % 10}\n' for i in range(200))
+        reader = CsvReader(multiline_csv_file)
+        all_rows = list(CsvReader(multiline_csv_file).iter_rows())
+
+        ranges = reader.sample_ranges(1, block_size=64)
+        rows = [row for r in ranges for row in reader.iter_rows(byte_range=r)]
+
+        assert rows == all_rows
+        assert all(lines is not None for _, _, lines in ranges)
+
+        ranges = reader.sample_ranges(0.25, block_size=64)
+        rows = [row for r in ranges for row in reader.iter_rows(byte_range=r)]
+
+        assert ranges[0][2] == 1
+        assert all(lines is None for _, _, lines in ranges[1:])
+        assert all(prev[1] < start for prev, (start, _, _) in zip(ranges, ranges[1:]))
+        assert 0 < len(rows) < len(all_rows) / 2
+        assert all(row in all_rows for row in rows)
+
+    def test_sample_ranges_read_only_sampled_blocks(self, valid_csv_file, monkeypatch):
+        with open(valid_csv_file, "a") as f:
+            f.writelines(f"Dev{i},QA Engineer,4.{i % 10}\n" for i in range(20000))
+        size = valid_csv_file.stat().st_size
+        bytes_read = []
+
+        def counting_open(*args, **kwargs):
+            return _CountingFile(open(*args, **kwargs), bytes_read)
+
+        monkeypatch.setattr(core_csv_tools, "open", counting_open, raising=False)
+        ranges = CsvReader(valid_csv_file).sample_ranges(0.1, block_size=16 * 1024)
+
+        assert len(ranges) > 1
+        assert sum(bytes_read) < 2 * 0.1 * size
+
+    def test_sampled_range_errors_report_offset(self, valid_csv_file):
+        with open(valid_csv_file, "a") as f:
+            f.writelines(f"Dev{i},QA Engineer,4.1\n" for i in range(20))
+            f.writelines(f"Dev{i},,4.1\n" for i in range(20))
+        reader = CsvReader(valid_csv_file)
+        last_range = reader.sample_ranges(0.5, block_size=256)[-1]
+
+        with pt_raises(csv_Error, match=r"line \d+ after byte \d+"):
+            list(reader.iter_rows(byte_range=last_range))
+
+    def test_sample_ranges_invalid_fraction(self, valid_csv_file):
+        for fraction in (0, 1.5):
+            with pt_raises(ValueError, match="Sample fraction must be in"):
+                CsvReader(valid_csv_file).sample_ranges(fraction)
+
+    def test_unread_ranges_from_start(self, multiline_csv_file):
+        ranges, tail = CsvReader(multiline_csv_file).unread_ranges(chunk_size=1)
+        size = multiline_csv_file.stat().st_size
+
+        assert ranges == CsvReader(multiline_csv_file).split_ranges(1)
+        assert tail == (size, size, 4)
+
+    def test_unread_ranges_leave_unterminated_tail(self, multiline_csv_file):
+        with open(multiline_csv_file, "a") as f:
+            f.write('Bob,"C,\nC++",4.1')
+        size = multiline_csv_file.stat().st_size
+
+        ranges, tail = CsvReader(multiline_csv_file).unread_ranges()
+        rows = list(CsvReader(multiline_csv_file).iter_rows(byte_range=tail))
+
+        assert len(ranges) == 1
+        assert tail[1] == size
+        assert rows == [{"name": "Bob", "skills": "C,\nC++", "performance": "4.1"}]
+
+    def test_unread_ranges_from_offset(self, multiline_csv_file):
+        reader = CsvReader(multiline_csv_file)
+        _, (offset, _, lines) = reader.unread_ranges()
+
+        with open(multiline_csv_file, "a") as f:
+            f.write("Bob,C,4.1\n")
+
+        ranges, _ = reader.unread_ranges(offset, lines)
+        rows = list(reader.iter_rows(byte_range=ranges[0]))
+
+        assert ranges == [(offset, offset + 10, 4)]
+        assert rows == [{"name": "Bob", "skills": "C", "performance": "4.1"}]
+
+    def test_unread_ranges_empty_file(self, empty_csv_file, zero_bytes_csv_file):
+        for file in (empty_csv_file, zero_bytes_csv_file):
+            with pt_raises(csv_Error, match="is empty"):
+                CsvReader(file).unread_ranges()
+
+
+class _CountingFile:
+    """File wrapper recording sizes of its reads."""
+
+    def __init__(self, file, bytes_read: list[int]):
+        self._file = file
+        self._bytes_read = bytes_read
+
+    def read(self, *args):
+        data = self._file.read(*args)
+        self._bytes_read.append(len(data))
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._file.close()
@@ -0,0 +1,91 @@
+from pytest import raises as pt_raises
+
+from core.filters import Predicate, compile_filter, may_match, parse_predicate
+
+NAMES = ["name", "position", "performance"]
+
+
+class TestParsePredicate:
+    """Tests for parse_predicate function."""
+
+    def test_parse_number_value(self):
+        assert parse_predicate("performance >= 4.7") == Predicate(
+            "performance", ">=", 4.7
+        )
+
+    def test_parse_string_value_with_spaces(self):
+        assert parse_predicate("position == QA Engineer") == Predicate(
+            "position", "==", "QA Engineer"
+        )
+
+    def test_quoted_value_is_string(self):
+        assert parse_predicate("name != '5'") == Predicate("name", "!=", "5")
+
+    def test_single_equals_sign(self):
+        assert parse_predicate("name=Bob") == Predicate("name", "==", "Bob")
+
+    def test_str_round_trip(self):
+        predicate = parse_predicate("name == 5")
+
+        assert parse_predicate(str(parse_predicate("name == '5'"))).value == "5"
+        assert parse_predicate(str(predicate)) == predicate
+
+    def test_malformed_expression_raises_error(self):
+        for expression in ("performance", "performance >=", ">= 4"):
+            with pt_raises(ValueError, match="Invalid filter"):
+                parse_predicate(expression)
+
+
+class TestCompileFilter:
+    """Tests for compile_filter function."""
+
+    def test_filter_decoded_rows(self, perf_data):
+        matches = compile_filter(
+            [
+                parse_predicate("position == Backend Developer"),
+                parse_predicate("performance > 4.6"),
+            ],
+            NAMES,
+        )
+        rows = [list(row.values()) for row in perf_data]
+
+        assert [row[0] for row in rows if matches(row)] == ["John"]
+
+    def test_filter_raw_rows(self, perf_data):
+        matches = compile_filter([parse_predicate("position != QA Engineer")], NAMES)
+        raw_matches = compile_filter(
+            [parse_predicate("position != QA Engineer")], NAMES, raw=True
+        )
+        rows = [list(row.values()) for row in perf_data]
+        raw_rows = [[field.encode() for field in row] for row in rows]
+
+        assert [matches(row) for row in rows] == [raw_matches(row) for row in raw_rows]
+
+    def test_non_numeric_value_never_matches_number(self):
+        matches = compile_filter([parse_predicate("performance < 5")], NAMES)
+
+        assert matches(["John", "Developer", "n/a"]) is False
+        assert matches(["John", "Developer", 4]) is True
+
+    def test_unknown_column_raises_error(self):
+        with pt_raises(ValueError, match="Unknown filter columns: team"):
+            compile_filter([parse_predicate("team == Web")], NAMES)
+
+
+class TestMayMatch:
+    """Tests for may_match function."""
+
+    def test_range_outside_stats_cannot_match(self):
+        stats = {"performance": (4.5, 4.9), "position": ("Backend", "QA")}
+
+        assert may_match([parse_predicate("performance > 4.9")], stats) is False
+        assert may_match([parse_predicate("performance == 4")], stats) is False
+        assert may_match([parse_predicate("position < Backend")], stats) is False
+        assert may_match([parse_predicate("performance <= 4.5")], stats) is True
+
+    def test_unknown_or_incomparable_stats_may_match(self):
+        stats = {"performance": (None, None), "name": ("Alice", "Mike")}
+
+        assert may_match([parse_predicate("performance > 10")], stats) is True
+        assert may_match([parse_predicate("name == 5")], stats) is True
+        assert may_match([parse_predicate("team == Web")], stats) is True
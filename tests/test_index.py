@@ -0,0 +1,101 @@
+from array import array
+
+from pytest import raises as pt_raises
+
+from core import GroupIndex, Table, TableIndex
+from core.defined_reports import AveragePerformanceReport
+
+
+def _team_table(perf_data):
+    teams = ["Core", "Web", "Core", "Web", "Core"]
+    rows = [dict(row, team=team) for row, team in zip(perf_data, teams)]
+    return Table.from_rows(rows)
+
+
+class TestGroupIndex:
+    """Tests for GroupIndex class."""
+
+    def test_group_index_keeps_row_ids_of_keys(self, perf_data):
+        index = GroupIndex.from_table(Table.from_rows(perf_data), ["position"])
+
+        assert len(index) == 3
+        assert index.rows(("Backend Developer",)) == array("I", [0, 1])
+        assert index.rows(("QA Engineer",)) == array("I", [4])
+        assert index.rows(("Designer",)) == array("I")
+
+    def test_group_index_over_several_columns(self, perf_data):
+        index = GroupIndex.from_table(_team_table(perf_data), ["position", "team"])
+
+        assert index.rows(("Frontend Developer", "Core")) == array("I", [2])
+        assert index.rows(("Frontend Developer", "Web")) == array("I", [3])
+
+    def test_group_index_over_numeric_column(self, perf_data):
+        index = GroupIndex.from_table(Table.from_rows(perf_data), ["performance"])
+
+        assert index.rows((4.8,)) == array("I", [0])
+
+    def test_group_index_missing_column_raises_error(self, perf_data):
+        with pt_raises(KeyError):
+            GroupIndex.from_table(Table.from_rows(perf_data), ["team"])
+
+
+class TestTableIndex:
+    """Tests for TableIndex class."""
+
+    def test_aggregate_matches_row_by_row_state(self, perf_data):
+        report = AveragePerformanceReport()
+        index = TableIndex(Table.from_rows(perf_data))
+
+        state = index.aggregate("position", "performance")
+
+        assert report.finalize(state) == report.generate(perf_data)
+
+    def test_aggregate_with_filter(self, perf_data):
+        index = TableIndex(_team_table(perf_data))
+
+        state = index.aggregate("position", "performance", where={"team": "Web"})
+
+        assert {key: acc.total for key, acc in state.items()} == {
+            "Backend Developer": 4.6,
+            "Frontend Developer": 4.9,
+        }
+
+    def test_aggregate_skips_non_numeric_values(self, mixed_perf_data):
+        report = AveragePerformanceReport()
+        index = TableIndex(Table.from_rows(mixed_perf_data))
+
+        state = index.aggregate("position", "performance")
+
+        assert report.finalize(state) == report.generate(mixed_perf_data)
+
+    def test_repeated_aggregate_uses_pre_aggregated_groups(
+        self, perf_data, monkeypatch
+    ):
+        index = TableIndex(Table.from_rows(perf_data))
+        first = index.aggregate("position", "performance")
+
+        def fail(*args):
+            raise AssertionError("Rows were aggregated again")
+
+        monkeypatch.setattr(index, "_pre_aggregate", fail)
+        second = index.aggregate("position", "performance")
+
+        assert {key: acc.total for key, acc in first.items()} == {
+            key: acc.total for key, acc in second.items()
+        }
+
+    def test_aggregate_returns_independent_state(self, perf_data):
+        index = TableIndex(Table.from_rows(perf_data))
+
+        index.aggregate("position", "performance").groups["QA Engineer"].add(100)
+        state = index.aggregate("position", "performance")
+
+        assert state.groups["QA Engineer"].total == 4.5
+
+    def test_report_state_from_index(self, perf_data):
+        report = AveragePerformanceReport()
+        index = TableIndex(Table.from_rows(perf_data))
+
+        state = report.state_from_index(index)
+
+        assert report.finalize(state) == report.generate(perf_data)
@@ -0,0 +1,209 @@
+import logging
+from logging.handlers import QueueHandler
+
+from pytest import raises as pt_raises
+
+from core import Profiler, log, setup_logging
+from core import logger as logger_module
+from core.logger import stop_logging
+
+
+class ReprCounter:
+    """Object counting how many times it was formatted."""
+
+    calls = 0
+
+    def __repr__(self):
+        ReprCounter.calls += 1
+        return "ReprCounter()"
+
+
+class TestLog:
+    """Tests for log decorator."""
+
+    def test_log_skips_formatting_when_debug_disabled(self):
+        logger = logging.getLogger("tests.log.disabled")
+        logger.setLevel(logging.INFO)
+
+        @log(logger=logger)
+        def func(value):
+            """Doing nothing."""
+            return value
+
+        ReprCounter.calls = 0
+        func(ReprCounter())
+
+        assert ReprCounter.calls == 0
+
+    def test_log_formats_args_when_debug_enabled(self, caplog):
+        logger = logging.getLogger("tests.log.enabled")
+
+        @log(logger=logger)
+        def func(value):
+            """Doing nothing."""
+            return value
+
+        with caplog.at_level(logging.DEBUG, logger="tests.log.enabled"):
+            func(ReprCounter())
+
+        assert "Start Doing nothing." in caplog.text
+        assert "args=(ReprCounter(),)" in caplog.text
+        assert "Completed successfully" in caplog.text
+
+    def test_log_summarizes_large_arguments(self, caplog):
+        logger = logging.getLogger("tests.log.summary")
+
+        @log(logger=logger, max_repr=20)
+        def func(data, title):
+            return data
+
+        with caplog.at_level(logging.DEBUG, logger="tests.log.summary"):
+            func([{"a": "1"}] * 15000, title="x" * 100)
+
+        assert "list[15000 dicts]" in caplog.text
+        assert f"title='{'x' * 19}..." in caplog.text
+
+    def test_log_exception_logged_when_debug_disabled(self, caplog):
+        logger = logging.getLogger("tests.log.exception")
+        logger.setLevel(logging.INFO)
+
+        @log(logger=logger)
+        def func():
+            raise ValueError("boom")
+
+        with caplog.at_level(logging.INFO, logger="tests.log.exception"):
+            try:
+                func()
+            except ValueError:
+                pass
+
+        assert "Exception raised: boom" in caplog.text
+
+    def test_log_checks_no_level_while_not_instrumented(self, monkeypatch):
+        logger = logging.getLogger("tests.log.fast")
+        logger.setLevel(logging.INFO)
+        checked = []
+
+        @log(logger=logger)
+        def func(value):
+            return value
+
+        monkeypatch.setattr(logger_module, "_instrumented", False)
+        monkeypatch.setattr(logger, "isEnabledFor", checked.append)
+
+        assert func(1) == 1
+        assert checked == []
+
+    def test_instrumentation_follows_levels_and_profiler(self, monkeypatch):
+        logger = logging.getLogger("tests.log.refresh")
+        logger.setLevel(logging.INFO)
+        monkeypatch.setattr(logger_module, "_instrumented", True)
+        monkeypatch.setattr(logger_module, "_wrapped_loggers", set())
+
+        log(logger=logger)(lambda: None)
+        assert logger_module._instrumented is False
+
+        profiler = Profiler(trace_memory=False).start()
+        assert logger_module._instrumented is True
+        profiler.stop()
+        assert logger_module._instrumented is False
+
+        logger.setLevel(logging.DEBUG)
+        assert logger_module._instrumented is True
+
+    def test_log_preserves_function_metadata(self):
+        @log
+        def func():
+            """Docstring."""
+
+        assert func.__name__ == "func"
+        assert func.__doc__ == "Docstring."
+
+    def test_log_identifies_function_by_first_line(self, caplog):
+        logger = logging.getLogger("tests.log.line")
+        logger.setLevel(logging.DEBUG)
+
+        def func():
+            """Doing nothing."""
+
+        line = func.__code__.co_firstlineno
+        func = log(logger=logger)(func)
+
+        with caplog.at_level(logging.DEBUG, logger="tests.log.line"):
+            func()
+
+        assert f"test_logger:{line} " in caplog.text
+
+
+class TestSetupLogging:
+    """Tests for setup_logging function."""
+
+    @staticmethod
+    def _read_log(log_dir):
+        (log_file,) = log_dir.glob("app_*.log")
+        return log_file.read_text(encoding="utf-8")
+
+    def test_synchronous_by_default(self, log_dir):
+        setup_logging(log_dir=str(log_dir))
+        logging.getLogger("tests.sync").info("sync record")
+
+        assert type(logging.getLogger().handlers[0]) is logging.FileHandler
+        assert "sync record" in self._read_log(log_dir)
+
+    def test_queue_mode_writes_records_on_stop(self, log_dir):
+        setup_logging(log_dir=str(log_dir), queue_size=0)
+        logger = logging.getLogger("tests.queue")
+        for index in range(1000):
+            logger.debug("queued record %d", index)
+        stop_logging()
+
+        text = self._read_log(log_dir)
+
+        assert "queued record 0" in text
+        assert "queued record 999" in text
+
+    def test_drop_policy_counts_dropped_records(self, log_dir):
+        setup_logging(log_dir=str(log_dir), queue_size=1, overflow="drop")
+        logger = logging.getLogger("tests.drop")
+        (handler,) = logger_module._listener.handlers
+
+        handler.acquire()
+        try:
+            for index in range(100):
+                logger.info("record %d", index)
+        finally:
+            handler.release()
+        stop_logging()
+
+        text = self._read_log(log_dir)
+
+        assert text.count("record") < 100
+        assert "log records dropped, queue was full" in text
+
+    def test_block_policy_keeps_all_records(self, log_dir):
+        setup_logging(log_dir=str(log_dir), queue_size=1, overflow="block")
+        logger = logging.getLogger("tests.block")
+        for index in range(100):
+            logger.info("record %d", index)
+        stop_logging()
+
+        assert self._read_log(log_dir).count("record") == 100
+
+    def test_records_after_stop_are_handled_synchronously(self, log_dir):
+        setup_logging(log_dir=str(log_dir), queue_size=5, overflow="block")
+        assert isinstance(logging.getLogger().handlers[0], QueueHandler)
+        stop_logging()
+
+        logger = logging.getLogger("tests.stopped")
+        for index in range(10):
+            logger.debug("late record %d", index)
+
+        assert not any(
+            isinstance(handler, QueueHandler)
+            for handler in logging.getLogger().handlers
+        )
+        assert self._read_log(log_dir).count("late record") == 10
+
+    def test_unknown_overflow_policy_raises_error(self, log_dir):
+        with pt_raises(ValueError, match="Unknown overflow policy"):
+            setup_logging(log_dir=str(log_dir), queue_size=1, overflow="ignore")
@@ -0,0 +1,279 @@
+from csv import Error as csv_Error
+
+from pytest import raises as pt_raises
+
+from core import (
+    CheckpointStore,
+    CombinedReport,
+    CsvReader,
+    FileCache,
+    aggregate_files,
+    stream_files,
+)
+from core import pipeline as core_pipeline
+from core.defined_reports import (
+    AveragePerformanceReport,
+    PerformanceDistributionReport,
+)
+from core.filters import parse_predicate
+
+
+class TestStreamFiles:
+    """Tests for stream_files function."""
+
+    def test_stream_files_chains_readers(self, valid_csv_file):
+        readers = [CsvReader(valid_csv_file), CsvReader(valid_csv_file)]
+        rows = list(stream_files(readers))
+
+        assert len(rows) == 10
+        assert [reader.rows_read for reader in readers] == [5, 5]
+
+
+class TestAggregateFiles:
+    """Tests for aggregate_files function."""
+
+    def test_aggregate_files_single_process(self, valid_csv_file):
+        report = AveragePerformanceReport()
+        results = list(aggregate_files([valid_csv_file], report))
+
+        assert len(results) == 1
+        file, state, rows = results[0]
+        assert file == valid_csv_file
+        assert rows == 5
+        assert len(state) == 3
+
+    def test_aggregate_files_in_pool_matches_single_process(self, valid_csv_file):
+        report = AveragePerformanceReport()
+        files = [valid_csv_file, valid_csv_file]
+
+        sequential = report.create_state()
+        for _, partial, _ in aggregate_files(files, report):
+            report.merge(sequential, partial)
+
+        parallel = report.create_state()
+        for _, partial, rows in aggregate_files(files, report, jobs=2):
+            assert rows == 5
+            report.merge(parallel, partial)
+
+        assert report.finalize(parallel) == report.finalize(sequential)
+
+    def test_aggregate_files_in_pool_raises_worker_errors(
+        self, valid_csv_file, bad_row_csv_file
+    ):
+        report = AveragePerformanceReport()
+        files = [valid_csv_file, bad_row_csv_file]
+
+        with pt_raises(csv_Error, match="line 3"):
+            list(aggregate_files(files, report, jobs=2))
+
+    def test_aggregate_files_uses_cache(self, tmp_path, valid_csv_file, monkeypatch):
+        report = AveragePerformanceReport()
+        cache = FileCache(tmp_path)
+
+        first = list(aggregate_files([valid_csv_file], report, cache=cache))
+
+        def fail(*args):
+            raise AssertionError("File was read again")
+
+        monkeypatch.setattr("core.pipeline.aggregate_file", fail)
+        second = list(aggregate_files([valid_csv_file], report, cache=cache))
+
+        assert second[0][2] == first[0][2] == 5
+        assert report.finalize(second[0][1]) == report.finalize(first[0][1])
+
+    def test_aggregate_files_in_chunks(self, valid_csv_file):
+        report = AveragePerformanceReport()
+        files = [valid_csv_file, valid_csv_file]
+
+        results = list(aggregate_files(files, report, jobs=2, chunk_size=40))
+
+        assert [rows for _, _, rows in results] == [5, 5]
+        assert report.finalize(results[0][1]) == report.generate(
+            CsvReader(valid_csv_file).iter_rows()
+        )
+
+    def test_aggregate_files_combined_report_reads_file_once(
+        self, valid_csv_file, monkeypatch
+    ):
+        performance = AveragePerformanceReport()
+        report = CombinedReport([performance, AveragePerformanceReport()])
+        calls = []
+        aggregate_file = core_pipeline.aggregate_file
+
+        def counting(*args):
+            calls.append(args[0])
+            return aggregate_file(*args)
+
+        monkeypatch.setattr("core.pipeline.aggregate_file", counting)
+        ((_, state, rows),) = aggregate_files([valid_csv_file], report)
+
+        expected = performance.generate(CsvReader(valid_csv_file).iter_rows())
+        assert calls == [valid_csv_file]
+        assert rows == 5
+        assert report.finalize(state) == [expected, expected]
+
+    def test_combined_report_cache_key_includes_reports(self):
+        performance = AveragePerformanceReport()
+        single = core_pipeline.report_cache_key(performance)
+        combined = core_pipeline.report_cache_key(
+            CombinedReport([performance, performance])
+        )
+
+        assert combined == f"{single}+{single}"
+
+    def test_aggregate_files_where(self, valid_csv_file):
+        report = AveragePerformanceReport()
+        where = [parse_predicate("position == Backend Developer")]
+
+        results = list(aggregate_files([valid_csv_file], report, where=where))
+        rows = CsvReader(valid_csv_file).iter_rows(where=where)
+
+        assert [count for _, _, count in results] == [2]
+        assert report.finalize(results[0][1]) == report.generate(rows)
+
+    def test_cache_key_includes_filter(self):
+        report = AveragePerformanceReport()
+        where = [parse_predicate("performance > 4"), parse_predicate("name != Bob")]
+
+        key = core_pipeline.report_cache_key(report, where)
+
+        assert key != core_pipeline.report_cache_key(report)
+        assert key == core_pipeline.report_cache_key(report, where[::-1])
+
+    def test_aggregate_files_sample(self, valid_csv_file):
+        report = AveragePerformanceReport()
+        reader = CsvReader(valid_csv_file)
+        sampled = reader.sample_ranges(0.4, block_size=30)
+
+        results = list(
+            aggregate_files([valid_csv_file], report, chunk_size=30, sample=0.4)
+        )
+        rows = [row for r in sampled for row in reader.iter_rows(byte_range=r)]
+
+        assert 0 < len(rows) < 5
+        assert [count for _, _, count in results] == [len(rows)]
+        assert report.finalize(results[0][1]) == report.generate(rows)
+
+    def test_stream_files_sample(self, valid_csv_file):
+        reader = CsvReader(valid_csv_file)
+
+        assert list(stream_files([reader], sample=1)) == list(
+            CsvReader(valid_csv_file).iter_rows()
+        )
+        assert reader.rows_read == 5
+
+    def test_cache_key_of_approximate_and_sampled_states(self):
+        report = AveragePerformanceReport()
+        key = core_pipeline.report_cache_key(report)
+        sampled = core_pipeline.report_cache_key(report, sample=0.1)
+        sampled_blocks = core_pipeline.report_cache_key(report, None, 0.1, 1024)
+        report.approximate = True
+
+        assert sampled == f"{key}|sample 0.1 of 65536 B blocks"
+        assert sampled_blocks == f"{key}|sample 0.1 of 1024 B blocks"
+        assert core_pipeline.report_cache_key(report) == f"{key}:approximate"
+
+    def test_sample_with_checkpoints_raises_error(self, tmp_path, valid_csv_file):
+        with pt_raises(ValueError, match="can't be read incrementally"):
+            aggregate_files(
+                [valid_csv_file],
+                AveragePerformanceReport(),
+                checkpoints=CheckpointStore(tmp_path),
+                sample=0.5,
+            )
+
+
+class TestAggregateIncremental:
+    """Tests for aggregate_files with checkpoints."""
+
+    @staticmethod
+    def _run(files, checkpoints, **kwargs):
+        report = AveragePerformanceReport()
+        state, records = report.create_state(), 0
+        for _, partial, rows in aggregate_files(
+            files, report, checkpoints=checkpoints, **kwargs
+        ):
+            state = report.merge(state, partial)
+            records += rows
+        return report.finalize(state), records
+
+    @staticmethod
+    def _full(files):
+        report = AveragePerformanceReport()
+        rows = [row for file in files for row in CsvReader(file).iter_rows()]
+        return report.generate(rows), len(rows)
+
+    def test_appended_rows_are_merged(self, tmp_path, valid_csv_file):
+        checkpoints = CheckpointStore(tmp_path)
+
+        assert self._run([valid_csv_file], checkpoints) == self._full([valid_csv_file])
+
+        with open(valid_csv_file, "a") as f:
+            f.write("Bob,QA Engineer,1.0\n")
+
+        assert self._run([valid_csv_file], checkpoints, jobs=2, chunk_size=16) == (
+            self._full([valid_csv_file])
+        )
+
+    def test_distribution_of_appended_rows(self, tmp_path, valid_csv_file):
+        report = PerformanceDistributionReport()
+        checkpoints = CheckpointStore(tmp_path)
+        list(aggregate_files([valid_csv_file], report, checkpoints=checkpoints))
+
+        with open(valid_csv_file, "a") as f:
+            f.write("Bob,QA Engineer,1.0\n")
+
+        ((_, state, rows),) = aggregate_files(
+            [valid_csv_file], report, 2, checkpoints=checkpoints, chunk_size=16
+        )
+        expected = report.generate(CsvReader(valid_csv_file).iter_rows())
+
+        assert rows == 6
+        assert report.finalize(state) == expected
+
+    def test_only_appended_bytes_are_read(self, tmp_path, valid_csv_file, monkeypatch):
+        checkpoints = CheckpointStore(tmp_path)
+        self._run([valid_csv_file], checkpoints)
+        offset = valid_csv_file.stat().st_size
+
+        with open(valid_csv_file, "a") as f:
+            f.write("Bob,QA Engineer,1.0\n")
+
+        ranges = []
+        aggregate_file = core_pipeline.aggregate_file
+
+        def record_range(file, report, use_mmap, byte_range, where=None):
+            ranges.append(byte_range)
+            return aggregate_file(file, report, use_mmap, byte_range, where)
+
+        monkeypatch.setattr(core_pipeline, "aggregate_file", record_range)
+
+        assert self._run([valid_csv_file], checkpoints)[1] == 6
+        assert [byte_range[0] for byte_range in ranges] == [offset]
+
+        ranges.clear()
+
+        assert self._run([valid_csv_file], checkpoints)[1] == 6
+        assert ranges == []
+
+    def test_unterminated_row_is_read_again(self, tmp_path, valid_csv_file):
+        checkpoints = CheckpointStore(tmp_path)
+
+        with open(valid_csv_file, "a") as f:
+            f.write("Bob,QA Engineer,1")
+
+        assert self._run([valid_csv_file], checkpoints)[1] == 6
+
+        with open(valid_csv_file, "a") as f:
+            f.write(".5\n")
+
+        assert self._run([valid_csv_file], checkpoints) == self._full([valid_csv_file])
+
+    def test_rewritten_file_is_read_again(self, tmp_path, valid_csv_file):
+        checkpoints = CheckpointStore(tmp_path)
+        self._run([valid_csv_file], checkpoints)
+
+        text = valid_csv_file.read_text().replace("4.8", "1.8")
+        valid_csv_file.write_text(text[: len(text) // 2] + "\n")
+
+        assert self._run([valid_csv_file], checkpoints) == self._full([valid_csv_file])
@@ -0,0 +1,176 @@
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from pytest import raises as pt_raises
+
+from core import CsvReader, Profiler, aggregate_files, log, profiling
+from core.defined_reports import AveragePerformanceReport
+
+
+@log
+def _double(value):
+    """Doubling value."""
+
+    return value * 2
+
+
+@log
+def _slow_items(count):
+    """Yielding items slowly."""
+
+    for item in range(count):
+        time.sleep(0.01)
+        yield item
+
+
+class TestProfiler:
+    """Tests for Profiler class."""
+
+    def test_inactive_by_default(self):
+        assert profiling.active_profiler is None
+        assert _double(2) == 4
+
+        with profiling.stage("noop"):
+            pass
+
+    def test_start_and_stop(self):
+        profiler = Profiler().start()
+
+        assert profiling.active_profiler is profiler
+
+        profiler.stop()
+
+        assert profiling.active_profiler is None
+
+    def test_stage_records_measurements(self):
+        profiler = Profiler().start()
+        try:
+            with profiling.stage("load"):
+                data = [0] * 100_000
+            with profiling.stage("load"):
+                pass
+        finally:
+            profiler.stop()
+
+        calls, wall, cpu, memory = profiler.stats["load"]
+
+        assert calls == 2
+        assert wall >= 0 and cpu >= 0
+        assert memory >= len(data) * 8
+        assert len(profiler.events) == 2
+        assert profiler.events[0]["ph"] == "X"
+
+    def test_stage_records_on_exception(self):
+        profiler = Profiler(trace_memory=False).start()
+        try:
+            with pt_raises(ValueError):
+                with profiling.stage("broken"):
+                    raise ValueError("broken")
+        finally:
+            profiler.stop()
+
+        assert profiler.stats["broken"][0] == 1
+
+    def test_decorated_functions_are_measured(self):
+        profiler = Profiler(trace_memory=False).start()
+        try:
+            _double(1)
+            _double(2)
+        finally:
+            profiler.stop()
+
+        names = [name for name in profiler.stats if name.endswith("_double")]
+
+        assert len(names) == 1
+        assert profiler.stats[names[0]][0] == 2
+
+    def test_iteration_of_generators_is_measured(self):
+        profiler = Profiler(trace_memory=False).start()
+        try:
+            for _ in _slow_items(3):
+                time.sleep(0.05)
+        finally:
+            profiler.stop()
+
+        names = [name for name in profiler.stats if name.endswith("iteration")]
+        calls, wall, _, _ = profiler.stats[names[0]]
+
+        assert names[0].endswith("_slow_items iteration")
+        assert calls == 1
+        assert 0.03 <= wall < 0.15
+
+    def test_streamed_rows_are_measured(self, valid_csv_file):
+        with open(valid_csv_file, "a") as f:
+            f.writelines(f"Dev{i},QA Engineer,4.{i % 10}\n" for i in range(20000))
+        profiler = Profiler(trace_memory=False).start()
+        try:
+            rows = list(CsvReader(valid_csv_file).iter_rows())
+        finally:
+            profiler.stop()
+
+        call = next(s for n, s in profiler.stats.items() if n.endswith("iter_rows"))
+        iteration = next(
+            s for n, s in profiler.stats.items() if n.endswith("iter_rows iteration")
+        )
+
+        assert len(rows) == 20005
+        assert iteration[0] == 1
+        assert iteration[1] > call[1]
+
+    def test_merge(self):
+        profiler = Profiler(trace_memory=False)
+        profiler.record("stage", 1.0, 0.5, 1024)
+        profiler.merge({"stage": [2, 2.0, 1.0, 1024], "other": [1, 1.0, 1.0, 0]}, [{}])
+
+        assert profiler.stats["stage"] == [3, 3.0, 1.5, 2048]
+        assert profiler.stats["other"] == [1, 1.0, 1.0, 0]
+        assert profiler.events == [{}]
+
+    def test_summary(self):
+        profiler = Profiler(trace_memory=False)
+        profiler.record("fast", 0.1, 0.1, 0)
+        profiler.record("slow", 2.0, 1.0, 2048)
+
+        summary = profiler.summary()
+
+        assert [row["name"] for row in summary] == ["slow", "fast"]
+        assert summary[0]["calls"] == 1
+        assert summary[0]["memory, KiB"] == 2.0
+        assert len(profiler.summary(limit=1)) == 1
+
+    def test_dump_trace(self):
+        profiler = Profiler(trace_memory=False).start()
+        try:
+            with profiling.stage("render"):
+                pass
+        finally:
+            profiler.stop()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "trace.json"
+            profiler.dump_trace(path)
+            trace = json.loads(path.read_text())
+
+        assert trace["traceEvents"][0]["name"] == "render"
+
+    def test_worker_stats_are_merged(self, valid_csv_file):
+        files = [valid_csv_file, valid_csv_file]
+        profiler = Profiler(trace_memory=False).start()
+        try:
+            list(aggregate_files(files, AveragePerformanceReport(), jobs=2))
+        finally:
+            profiler.stop()
+
+        assert profiler.stats[f"aggregate {valid_csv_file}"][0] == 2
+        assert any(name.endswith("CsvReader.iter_rows") for name in profiler.stats)
+
+    def test_reader_unaffected(self, valid_csv_file):
+        profiler = Profiler(trace_memory=False).start()
+        try:
+            rows = list(CsvReader(valid_csv_file).iter_rows())
+        finally:
+            profiler.stop()
+
+        assert len(rows) == 5
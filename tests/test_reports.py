@@ -1,7 +1,20 @@
+from pytest import approx
 from pytest import raises as pt_raises
 
-from core import ReportRegistry
-from core.defined_reports import AveragePerformanceReport
+from core import (
+    BaseReport,
+    CombinedReport,
+    ReportRegistry,
+    StreamedReports,
+    Table,
+    TableIndex,
+    combine_reports,
+)
+from core.defined_reports import (
+    AveragePerformanceReport,
+    PerformanceDistributionReport,
+    PerformanceRankingReport,
+)
 
 
 class TestReportRegistry:
@@ -24,6 +37,31 @@ class TestReportRegistry:
         with pt_raises(ValueError, match="isn't found"):
             ReportRegistry.get_report("nonexistent_report")
 
+    def test_get_report_registered_by_import_path(self):
+        ReportRegistry.register_report(
+            "lazy_report", "core.defined_reports:AveragePerformanceReport"
+        )
+
+        assert ReportRegistry._reports["lazy_report"] == (
+            "core.defined_reports:AveragePerformanceReport"
+        )
+        assert isinstance(
+            ReportRegistry.get_report("lazy_report"), AveragePerformanceReport
+        )
+        assert ReportRegistry._reports["lazy_report"] is AveragePerformanceReport
+
+    def test_get_report_with_bad_import_path_raises_error(self):
+        ReportRegistry.register_report("broken_report", "core.missing:Report")
+
+        with pt_raises(ValueError, match="Can't import report"):
+            ReportRegistry.get_report("broken_report")
+
+    def test_get_report_with_non_report_path_raises_error(self):
+        ReportRegistry.register_report("not_report", "core.reports:ReportRegistry")
+
+        with pt_raises(ValueError, match="is not a report class"):
+            ReportRegistry.get_report("not_report")
+
 
 class TestAveragePerformanceReport:
     """Tests for AveragePerformanceReport class."""
@@ -122,3 +160,340 @@ class TestAveragePerformanceReport:
 
         assert len(result) == 1
         assert result[0]["performance"] == 4.5
+
+    def test_generate_report_from_iterator(self, perf_data):
+        report = AveragePerformanceReport()
+        result = report.generate(iter(perf_data))
+
+        assert [res["position"] for res in result] == [
+            "Frontend Developer",
+            "Backend Developer",
+            "QA Engineer",
+        ]
+
+    def test_merged_states_match_single_pass(self, perf_data):
+        report = AveragePerformanceReport()
+        state = report.accumulate(perf_data[:2])
+        other = report.accumulate(perf_data[2:])
+
+        result = report.finalize(report.merge(state, other))
+
+        assert result == report.generate(perf_data)
+
+    def test_accumulate_uses_state_from_table(self, perf_data):
+        class TableReport(AveragePerformanceReport):
+            def state_from_table(self, table):
+                state = self.create_state()
+                state.add("Table", len(table))
+                return state
+
+        report = TableReport()
+        state = report.accumulate(Table.from_rows(perf_data))
+        state = report.accumulate(Table.from_rows(perf_data), state)
+
+        assert report.finalize(state) == [{"position": "Table", "performance": 5}]
+
+    def test_generate_report_with_projected_rows(self, perf_data):
+        report = AveragePerformanceReport()
+        projected = [{name: row[name] for name in report.columns} for row in perf_data]
+
+        assert report.generate(projected) == report.generate(perf_data)
+
+    def test_generate_report_with_limit(self, perf_data):
+        report = AveragePerformanceReport()
+        full = report.generate(perf_data)
+        report.limit = 2
+
+        assert report.generate(perf_data) == full[:2]
+
+
+class TestApproximatePerformanceReport:
+    """Tests for AveragePerformanceReport in approximate mode."""
+
+    def test_rows_have_error_bounds_of_blocks(self, perf_data):
+        report = AveragePerformanceReport()
+        report.approximate = True
+        blocks = [report.accumulate(perf_data[::2]), report.accumulate(perf_data[1::2])]
+
+        rows = report.finalize(report.merge(*blocks))
+
+        assert rows == [
+            {"position": "Frontend Developer", "performance": 4.8, "error": 0.2},
+            {"position": "Backend Developer", "performance": 4.7, "error": 0.2},
+            {"position": "QA Engineer", "performance": 4.5, "error": None},
+        ]
+
+    def test_single_block_has_no_error_bounds(self, perf_data):
+        report = AveragePerformanceReport()
+        report.approximate = True
+
+        assert {row["error"] for row in report.generate(perf_data)} == {None}
+
+    def test_averages_match_exact_mode(self, perf_data):
+        report = AveragePerformanceReport()
+        report.approximate = True
+
+        rows = report.generate(Table.from_rows(perf_data))
+
+        assert [
+            {key: row[key] for key in ("position", "performance")} for row in rows
+        ] == AveragePerformanceReport().generate(perf_data)
+
+    def test_index_is_not_used_in_approximate_mode(self, perf_data):
+        report = AveragePerformanceReport()
+        report.approximate = True
+
+        assert report.state_from_index(TableIndex(Table.from_rows(perf_data))) is None
+
+
+class TestPerformanceDistributionReport:
+    """Tests for PerformanceDistributionReport."""
+
+    def test_percentiles_of_small_groups(self, perf_data):
+        rows = PerformanceDistributionReport().generate(perf_data)
+
+        assert rows == [
+            {"position": "Frontend Developer", "median": 4.8, "p90": 4.9, "p99": 4.9},
+            {"position": "Backend Developer", "median": 4.7, "p90": 4.8, "p99": 4.8},
+            {"position": "QA Engineer", "median": 4.5, "p90": 4.5, "p99": 4.5},
+        ]
+
+    def test_rows_without_performance_are_skipped(self, mixed_perf_data):
+        rows = PerformanceDistributionReport().generate(mixed_perf_data)
+
+        assert [row["position"] for row in rows] == ["Developer", "Tester"]
+        assert rows[1]["median"] == 4.6
+
+    def test_merged_states_match_single_pass(self):
+        report = PerformanceDistributionReport()
+        rows = [
+            {"position": "Developer", "performance": str(i % 97 / 20)}
+            for i in range(5000)
+        ]
+
+        first = report.accumulate(rows[::2])
+        merged = report.merge(first, report.accumulate(rows[1::2]))
+
+        for merged_row, row in zip(report.finalize(merged), report.generate(rows)):
+            assert merged_row == {
+                key: approx(value, abs=0.05) if key != "position" else value
+                for key, value in row.items()
+            }
+
+    def test_state_from_index_keeps_index_intact(self, perf_data):
+        report = PerformanceDistributionReport()
+        index = TableIndex(Table.from_rows(perf_data))
+
+        state = report.state_from_index(index)
+        state.merge(report.accumulate(perf_data))
+
+        assert report.finalize(report.state_from_index(index)) == report.generate(
+            perf_data
+        )
+
+    def test_approximate_rows_have_error_bounds_of_blocks(self):
+        report = PerformanceDistributionReport()
+        report.approximate = True
+        rows = [
+            {"position": "Developer", "performance": str(i % 97 / 20)}
+            for i in range(5000)
+        ]
+
+        state = report.create_state()
+        for start in range(0, len(rows), 500):
+            state = report.merge(state, report.accumulate(rows[start : start + 500]))
+        (row,) = report.finalize(state)
+        (exact_row,) = PerformanceDistributionReport().generate(rows)
+
+        for name in ("median", "p90", "p99"):
+            assert row[name] == approx(exact_row[name], abs=0.05)
+            assert 0 < row[f"{name}_error"] < 0.5
+
+    def test_single_block_has_no_error_bounds(self, perf_data):
+        report = PerformanceDistributionReport()
+        report.approximate = True
+
+        row, *_ = report.generate(perf_data)
+
+        assert row == {
+            "position": "Frontend Developer",
+            "median": 4.8,
+            "median_error": None,
+            "p90": 4.9,
+            "p90_error": None,
+            "p99": 4.9,
+            "p99_error": None,
+        }
+
+    def test_generate_report_with_limit(self, perf_data):
+        report = PerformanceDistributionReport()
+        report.limit = 1
+
+        assert [row["position"] for row in report.generate(perf_data)] == [
+            "Frontend Developer"
+        ]
+
+
+class TestPerformanceRankingReport:
+    """Tests for PerformanceRankingReport."""
+
+    def test_developers_sorted_by_performance(self, perf_data):
+        rows = list(PerformanceRankingReport().generate(perf_data))
+
+        assert [row["name"] for row in rows] == ["Alice", "John", "Bob", "Jane", "Mike"]
+        assert rows[0] == {
+            "name": "Alice",
+            "position": "Frontend Developer",
+            "performance": 4.9,
+        }
+
+    def test_rows_without_performance_are_skipped(self, mixed_perf_data):
+        rows = list(PerformanceRankingReport().generate(mixed_perf_data))
+
+        assert [row["name"] for row in rows] == ["Bob", "Mike", "John"]
+
+    def test_generate_report_with_limit(self, perf_data):
+        """Test that limited ranking is a list of the top rows, not an iterator."""
+
+        report = PerformanceRankingReport()
+        report.limit = 2
+
+        rows = report.generate(iter(perf_data))
+
+        assert isinstance(rows, list)
+        assert rows == list(PerformanceRankingReport().generate(perf_data))[:2]
+
+
+class RowCountReport(BaseReport):
+    """Report counting rows, not an aggregate report."""
+
+    def generate(self, data):
+        return [{"rows": sum(1 for _ in data)}]
+
+
+class FirstRowReport(BaseReport):
+    """Report reading only the first row."""
+
+    def generate(self, data):
+        return [next(iter(data), {})]
+
+
+class FailingReport(BaseReport):
+    """Report failing after reading some rows."""
+
+    def generate(self, data):
+        next(iter(data))
+        error_msg = "Report failed"
+        raise ValueError(error_msg)
+
+
+class TestCombinedReport:
+    """Tests for CombinedReport class."""
+
+    def test_combined_report_matches_separate_reports(self, perf_data):
+        performance = AveragePerformanceReport()
+        distribution = PerformanceDistributionReport()
+        report = CombinedReport([performance, distribution])
+
+        assert report.generate(iter(perf_data)) == [
+            performance.generate(perf_data),
+            distribution.generate(perf_data),
+        ]
+
+    def test_combined_report_columns(self):
+        assert CombinedReport([AveragePerformanceReport()] * 2).columns == (
+            "position",
+            "performance",
+        )
+        assert CombinedReport(
+            [AveragePerformanceReport(), PerformanceDistributionReport()]
+        ).columns == ("position", "performance")
+
+    def test_merged_combined_states_match_single_pass(self, perf_data):
+        report = CombinedReport(
+            [AveragePerformanceReport(), PerformanceDistributionReport()]
+        )
+        state = report.accumulate(perf_data[:2])
+        other = report.accumulate(perf_data[2:])
+
+        result = report.finalize(report.merge(state, other))
+
+        assert result == report.generate(perf_data)
+
+    def test_combined_report_without_reports_raises_error(self):
+        with pt_raises(ValueError, match="At least one report"):
+            CombinedReport([])
+
+    def test_combined_report_with_not_aggregate_report_raises_error(self):
+        with pt_raises(ValueError, match="not aggregate reports: RowCountReport"):
+            CombinedReport([AveragePerformanceReport(), RowCountReport()])
+
+
+class TestStreamedReports:
+    """Tests for StreamedReports class."""
+
+    def test_streamed_reports_match_separate_reports(self, perf_data):
+        performance = AveragePerformanceReport()
+        ranking = PerformanceRankingReport()
+        report = StreamedReports([RowCountReport(), performance, ranking])
+
+        rows_count, performance_rows, ranking_rows = report.generate(iter(perf_data))
+
+        assert rows_count == [{"rows": len(perf_data)}]
+        assert performance_rows == performance.generate(perf_data)
+        assert list(ranking_rows) == list(ranking.generate(perf_data))
+
+    def test_streamed_reports_read_rows_once(self, perf_data):
+        rows = iter(perf_data * 1000)
+        report = StreamedReports([RowCountReport(), RowCountReport()])
+
+        assert report.generate(rows) == [[{"rows": len(perf_data) * 1000}]] * 2
+        assert next(rows, None) is None
+
+    def test_aggregates_get_all_rows_if_report_stops_early(self, perf_data):
+        performance = AveragePerformanceReport()
+        report = StreamedReports([FirstRowReport(), performance])
+
+        first, performance_rows = report.generate(iter(perf_data))
+
+        assert first == [perf_data[0]]
+        assert performance_rows == performance.generate(perf_data)
+
+    def test_streamed_reports_columns(self):
+        ranking = PerformanceRankingReport()
+
+        assert StreamedReports([AveragePerformanceReport(), ranking]).columns == (
+            "position",
+            "performance",
+            "name",
+        )
+        assert StreamedReports([ranking, RowCountReport()]).columns is None
+
+    def test_failing_report_in_thread_raises_error(self, perf_data):
+        report = StreamedReports([RowCountReport(), FailingReport()])
+
+        with pt_raises(ValueError, match="Report failed"):
+            report.generate(iter(perf_data * 1000))
+
+    def test_streamed_reports_without_reports_raises_error(self):
+        with pt_raises(ValueError, match="At least one report"):
+            StreamedReports([])
+
+
+class TestCombineReports:
+    """Tests for combine_reports function."""
+
+    def test_single_report_is_returned_as_is(self):
+        report = PerformanceRankingReport()
+
+        assert combine_reports([report]) is report
+
+    def test_aggregate_reports_are_combined(self):
+        reports = [AveragePerformanceReport(), PerformanceDistributionReport()]
+
+        assert isinstance(combine_reports(reports), CombinedReport)
+
+    def test_other_reports_are_streamed(self):
+        reports = [PerformanceRankingReport(), AveragePerformanceReport()]
+
+        assert isinstance(combine_reports(reports), StreamedReports)
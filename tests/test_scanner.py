@@ -0,0 +1,92 @@
+import pytest
+
+from core import scanner
+from core.scanner import iter_records, last_record_boundary, split_record
+
+
+class TestSplitRecord:
+    """Tests for split_record function."""
+
+    @pytest.mark.parametrize(
+        "record, expected",
+        [
+            (b"a,b,c", [b"a", b"b", b"c"]),
+            (b'a,"b, c",d', [b"a", b"b, c", b"d"]),
+            (b'"a ""x""",b', [b'a "x"', b"b"]),
+            (b'a,,"",', [b"a", b"", b"", b""]),
+            (b'John,Fake "Developer",4.5', [b"John", b'Fake "Developer"', b"4.5"]),
+            (b'"ab"c,d', [b"abc", b"d"]),
+            (b'a,"b\nc"', [b"a", b"b\nc"]),
+        ],
+    )
+    def test_split_matches_csv_module(self, record, expected):
+        assert split_record(record, b",") == expected
+
+    def test_unterminated_quote_returns_none(self):
+        assert split_record(b'a,"b', b",") is None
+
+    def test_custom_delimiter(self):
+        assert split_record(b'a;"b;c"', b";") == [b"a", b"b;c"]
+
+
+class TestIterRecords:
+    """Tests for iter_records function."""
+
+    def test_records_offsets_and_lines(self):
+        data = b'h1,h2\r\n1,"a\nb"\n2,c'
+        records = list(iter_records(data, 0, len(data), b","))
+
+        assert [fields for fields, _, _ in records] == [
+            [b"h1", b"h2"],
+            [b"1", b"a\nb"],
+            [b"2", b"c"],
+        ]
+        assert [offset for _, offset, _ in records] == [7, 15, 18]
+        assert [lines for _, _, lines in records] == [1, 2, 1]
+
+    def test_records_across_blocks(self, monkeypatch):
+        monkeypatch.setattr(scanner, "BLOCK_SIZE", 3)
+        data = b'a,"x\ny",b\nc,d,e\n'
+
+        records = list(iter_records(data, 0, len(data), b","))
+
+        assert [fields for fields, _, _ in records] == [
+            [b"a", b"x\ny", b"b"],
+            [b"c", b"d", b"e"],
+        ]
+        assert records[-1][1] == len(data)
+
+    def test_records_from_offset(self):
+        data = b"h\n1\n2\n"
+        records = list(iter_records(data, 2, len(data), b","))
+
+        assert [fields for fields, _, _ in records] == [[b"1"], [b"2"]]
+
+    def test_unterminated_quote_raises_error(self):
+        data = b'a\n"b\n'
+
+        with pytest.raises(ValueError, match="Unterminated quoted field"):
+            list(iter_records(data, 0, len(data), b","))
+
+
+class TestLastRecordBoundary:
+    """Tests for last_record_boundary function."""
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            (b"h\n1\n2\n", 6),
+            (b"h\n1\n2", 4),
+            (b'h\n1\n"a\nb', 4),
+            (b'h\n"a\nb"\n', 8),
+            (b"h", 0),
+        ],
+    )
+    def test_last_complete_record(self, data, expected):
+        assert last_record_boundary(data, 0, len(data)) == expected
+
+    def test_boundary_from_offset(self):
+        data = b'h\n"a\n"\n2'
+
+        assert last_record_boundary(data, 2, len(data)) == 7
+        assert last_record_boundary(data, 7, len(data)) == 7
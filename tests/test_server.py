@@ -0,0 +1,290 @@
+import asyncio
+import os
+
+from pytest import raises as pt_raises
+
+from core import CsvReader, ReportRegistry, ReportServer, Table, query_server
+from core import server as core_server
+from core.client import parse_address
+from core.defined_reports import AveragePerformanceReport
+from core.filters import parse_predicate
+
+
+def _expected(*files):
+    rows = [row for file in files for row in CsvReader(file).iter_rows()]
+    return AveragePerformanceReport().generate(rows)
+
+
+class TestReportServer:
+    """Tests for ReportServer class."""
+
+    @staticmethod
+    def setup_method():
+        ReportRegistry.register_report("performance", AveragePerformanceReport)
+
+    def test_query_matches_local_report(self, valid_csv_file):
+        server = ReportServer()
+        files = [str(valid_csv_file), str(valid_csv_file)]
+
+        response = asyncio.run(server.query(files, ["performance"]))
+
+        assert response["records"] == 10
+        assert response["reports"] == [
+            {
+                "name": "performance",
+                "rows": _expected(valid_csv_file, valid_csv_file),
+            }
+        ]
+
+    def test_unchanged_file_is_not_loaded_again(self, valid_csv_file, monkeypatch):
+        server = ReportServer()
+        loads = []
+        load_dataset = core_server._load_dataset
+
+        def counting(file):
+            loads.append(file)
+            return load_dataset(file)
+
+        monkeypatch.setattr("core.server._load_dataset", counting)
+
+        async def run():
+            first = await server.query([str(valid_csv_file)], ["performance"])
+            second = await server.query([str(valid_csv_file)], ["performance"])
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert loads == [valid_csv_file]
+        assert first == second
+
+    def test_query_uses_group_by_index(self, valid_csv_file, monkeypatch):
+        expected = _expected(valid_csv_file)
+
+        def fail(*args):
+            raise AssertionError("Rows were accumulated")
+
+        monkeypatch.setattr(AveragePerformanceReport, "accumulate", fail)
+        server = ReportServer()
+
+        response = asyncio.run(server.query([str(valid_csv_file)], ["performance"]))
+
+        assert response["reports"][0]["rows"] == expected
+
+    def test_changed_file_is_reloaded(self, valid_csv_file):
+        server = ReportServer()
+
+        async def run():
+            await server.query([str(valid_csv_file)], ["performance"])
+            with open(valid_csv_file, "a", encoding="utf-8") as f:
+                f.write("Zed,QA Engineer,3.5\n")
+            os.utime(valid_csv_file, ns=(0, 0))
+            await server.reload_changed()
+            return await server.query([str(valid_csv_file)], ["performance"])
+
+        response = asyncio.run(run())
+
+        assert response["records"] == 6
+        assert response["reports"][0]["rows"] == _expected(valid_csv_file)
+
+    def test_removed_file_is_dropped(self, tmp_path, valid_csv_file):
+        server = ReportServer()
+        file = tmp_path / "removed.csv"
+        file.write_bytes(valid_csv_file.read_bytes())
+
+        async def run():
+            await server.query([str(file)], ["performance"])
+            file.unlink()
+            await server.reload_changed()
+
+        asyncio.run(run())
+
+        assert not server._datasets
+
+    def test_errors_are_answered(self, valid_csv_file):
+        server = ReportServer()
+
+        async def run():
+            return [
+                await server._answer(b"not json"),
+                await server._answer(b'{"files": "file.csv", "reports": []}'),
+                await server._answer(b'{"files": [], "reports": ["nonexistent"]}'),
+                await server._answer(b'{"files": ["missing.csv"], "reports": []}'),
+            ]
+
+        bad_json, bad_files, bad_report, missing = asyncio.run(run())
+
+        assert "must have 'files' and 'reports' lists" in bad_json["error"]
+        assert "must have 'files' and 'reports' lists" in bad_files["error"]
+        assert "isn't found" in bad_report["error"]
+        assert "does not exist" in missing["error"]
+
+    def test_unexpected_errors_are_answered(self, monkeypatch):
+        server = ReportServer()
+        request = b'{"files": ["file.csv"], "reports": ["performance"]}'
+
+        errors = iter([PermissionError("Permission denied"), RuntimeError("bug")])
+
+        async def run():
+            return [await server._answer(request), await server._answer(request)]
+
+        async def query(*args):
+            raise next(errors)
+
+        monkeypatch.setattr(server, "query", query)
+        denied, failed = asyncio.run(run())
+
+        assert denied == {"error": "Permission denied"}
+        assert failed == {"error": "Internal server error"}
+
+    def test_query_with_filter(self, valid_csv_file):
+        server = ReportServer()
+        where = ["position != QA Engineer"]
+        rows = CsvReader(valid_csv_file).iter_rows(
+            where=[parse_predicate(expression) for expression in where]
+        )
+
+        async def run():
+            filtered = await server.query([str(valid_csv_file)], ["performance"], where)
+            bad = await server._answer(
+                b'{"files": [], "reports": ["performance"], "where": ["oops"]}'
+            )
+            return filtered, bad
+
+        filtered, bad = asyncio.run(run())
+
+        assert filtered["reports"][0]["rows"] == AveragePerformanceReport().generate(
+            rows
+        )
+        assert filtered["records"] == 4
+        assert "Invalid filter" in bad["error"]
+
+    def test_query_with_equality_filter_uses_group_by_index(
+        self, valid_csv_file, monkeypatch
+    ):
+        where = ["position == Backend Developer", "performance == 4.8"]
+        rows = CsvReader(valid_csv_file).iter_rows(
+            where=[parse_predicate(expression) for expression in where]
+        )
+        expected = AveragePerformanceReport().generate(rows)
+
+        def fail(*args):
+            raise AssertionError("Rows were accumulated")
+
+        monkeypatch.setattr(AveragePerformanceReport, "accumulate", fail)
+        server = ReportServer()
+
+        response = asyncio.run(
+            server.query([str(valid_csv_file)], ["performance"], where)
+        )
+
+        assert response["reports"][0]["rows"] == expected
+        assert response["records"] == 1
+
+    def test_records_match_filter_with_index_and_scan(self, valid_csv_file):
+        server = ReportServer()
+        file = str(valid_csv_file)
+
+        async def run():
+            return [
+                (await server.query([file, file], [], where))["records"]
+                for where in (
+                    ["position == Backend Developer"],
+                    ["position >= Backend Developer", "performance < 4.8"],
+                    ["position == Backend Developer"],
+                )
+            ]
+
+        assert asyncio.run(run()) == [4, 6, 4]
+
+    def test_index_filter_only_takes_equalities_of_column_type(self, perf_data):
+        table = Table.from_rows(perf_data)
+
+        def index_filter(*expressions):
+            where = [parse_predicate(expression) for expression in expressions]
+            return core_server._index_filter(table, where)
+
+        assert index_filter() == {}
+        assert index_filter("name == Bob", "performance == 4.7") == {
+            "name": "Bob",
+            "performance": 4.7,
+        }
+        assert index_filter("name != Bob") is None
+        assert index_filter("name == Bob", "name == Jane") is None
+        assert index_filter("performance == '4.7'") is None
+        assert index_filter("name == 5") is None
+        assert index_filter("team == Backend") is None
+
+    def test_query_with_limit(self, valid_csv_file):
+        server = ReportServer()
+        expected = _expected(valid_csv_file)[:2]
+
+        async def run():
+            limited = await server.query(
+                [str(valid_csv_file)], ["performance"], limit=2
+            )
+            bad = await server._answer(
+                b'{"files": [], "reports": ["performance"], "limit": 0}'
+            )
+            return limited, bad
+
+        limited, bad = asyncio.run(run())
+
+        assert limited["reports"][0]["rows"] == expected
+        assert "positive 'limit'" in bad["error"]
+
+    def test_clients_are_served_over_unix_socket(self, tmp_path, valid_csv_file):
+        server = ReportServer()
+        address = str(tmp_path / "server.sock")
+
+        async def run():
+            started = asyncio.Event()
+            serving = asyncio.create_task(server.serve(address, started))
+            await started.wait()
+            try:
+                return await asyncio.gather(
+                    *(
+                        asyncio.to_thread(
+                            query_server, address, [valid_csv_file], ["performance"], 5
+                        )
+                        for _ in range(4)
+                    )
+                )
+            finally:
+                serving.cancel()
+
+        responses = asyncio.run(run())
+
+        assert len(responses) == 4
+        assert all(
+            response["reports"][0]["rows"] == _expected(valid_csv_file)
+            for response in responses
+        )
+
+    def test_query_server_raises_error_response(self, tmp_path):
+        server = ReportServer()
+        address = str(tmp_path / "server.sock")
+
+        async def run():
+            started = asyncio.Event()
+            serving = asyncio.create_task(server.serve(address, started))
+            await started.wait()
+            try:
+                await asyncio.to_thread(
+                    query_server, address, [tmp_path / "missing.csv"], [], 5
+                )
+            finally:
+                serving.cancel()
+
+        with pt_raises(ValueError, match="does not exist"):
+            asyncio.run(run())
+
+
+class TestParseAddress:
+    """Tests for parse_address function."""
+
+    def test_parse_tcp_address(self):
+        assert parse_address("localhost:8765") == ("localhost", 8765)
+
+    def test_parse_socket_path(self):
+        assert parse_address("/tmp/server.sock") == "/tmp/server.sock"
+        assert parse_address("server.sock") == "server.sock"
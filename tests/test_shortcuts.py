@@ -1,6 +1,8 @@
+from array import array
+
 from pytest import raises as pt_raises
 
-from core import convert_to_number, is_numeric
+from core import coerce_column, coerce_number, convert_to_number, is_numeric
 
 
 class TestIsNumeric:
@@ -152,3 +154,66 @@ class TestConvertToNumber:
 
         result = convert_to_number("100.0")
         assert isinstance(result, float)
+
+
+class TestCoerceNumber:
+    """Tests for coerce_number function."""
+
+    def test_coerce_integer_string(self):
+        result = coerce_number("42")
+
+        assert result == 42
+        assert isinstance(result, int)
+
+    def test_coerce_float_string(self):
+        result = coerce_number("-3.14")
+
+        assert result == -3.14
+        assert isinstance(result, float)
+
+    def test_coerce_exponent_string(self):
+        assert coerce_number("1e3") == 1000.0
+
+    def test_coerce_actual_numbers(self):
+        assert coerce_number(7) == 7
+        assert coerce_number(2.5) == 2.5
+
+    def test_coerce_non_numeric_returns_none(self):
+        assert coerce_number("abc") is None
+        assert coerce_number("") is None
+        assert coerce_number("12.34.56") is None
+        assert coerce_number("$100") is None
+        assert coerce_number(None) is None
+
+
+class TestCoerceColumn:
+    """Tests for coerce_column function."""
+
+    def test_coerce_integer_column(self):
+        result = coerce_column(["1", "2", "3"])
+
+        assert isinstance(result, array)
+        assert result.typecode == "q"
+        assert list(result) == [1, 2, 3]
+
+    def test_coerce_mixed_numeric_column(self):
+        result = coerce_column(["1", "2.5", "3"])
+
+        assert isinstance(result, array)
+        assert result.typecode == "d"
+        assert list(result) == [1.0, 2.5, 3.0]
+
+    def test_coerce_huge_integer_column(self):
+        result = coerce_column(["1", str(2**70)])
+
+        assert result.typecode == "d"
+
+    def test_coerce_non_numeric_column(self):
+        result = coerce_column(["1", "n/a", "2.5"])
+
+        assert result == [1, None, 2.5]
+
+    def test_coerce_empty_column(self):
+        result = coerce_column([])
+
+        assert len(result) == 0
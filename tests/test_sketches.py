@@ -0,0 +1,89 @@
+import pickle
+import random
+from copy import copy
+
+from pytest import approx
+from pytest import raises as pt_raises
+
+from core import GroupedAccumulator, TDigest
+
+
+def _values(count, seed=0):
+    rng = random.Random(seed)
+    return [rng.gauss(4.5, 0.3) for _ in range(count)]
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class TestTDigest:
+    """Tests for TDigest class."""
+
+    def test_quantiles_are_close_to_exact(self):
+        values = _values(20_000)
+        digest = TDigest()
+        for value in values:
+            digest.add(value)
+
+        for q in (0.01, 0.5, 0.9, 0.99):
+            assert digest.quantile(q) == approx(_exact_quantile(values, q), abs=0.02)
+        assert digest.quantile(0) == min(values)
+        assert digest.quantile(1) == max(values)
+
+    def test_memory_is_bounded(self):
+        digest = TDigest(compression=50)
+        for value in _values(20_000):
+            digest.add(value)
+
+        assert digest.count == 20_000
+        assert len(digest) <= 50
+
+    def test_few_values_are_interpolated(self):
+        digest = TDigest()
+        for value in (4, 1, 3, 2):
+            digest.add(value)
+
+        assert digest.quantile(0.5) == 2.5
+
+    def test_merged_digests_match_single_digest(self):
+        values = _values(10_000, seed=1)
+        parts = [TDigest() for _ in range(4)]
+        for i, value in enumerate(values):
+            parts[i % 4].add(value)
+
+        merged = pickle.loads(pickle.dumps(parts[0]))
+        for part in parts[1:]:
+            merged.merge(part)
+
+        assert merged.count == len(values)
+        assert merged.quantile(0.99) == approx(_exact_quantile(values, 0.99), abs=0.03)
+
+    def test_empty_digest(self):
+        digest = TDigest()
+
+        assert digest.quantile(0.5) is None
+        assert digest.merge(TDigest()).count == 0
+
+    def test_copy_does_not_share_centroids(self):
+        digest = TDigest()
+        digest.add(1)
+
+        copied = copy(digest)
+        copied.merge(digest)
+        copied.add(5)
+
+        assert (digest.count, len(digest), digest.maximum) == (1, 1, 1)
+        assert copied.quantile(1) == 5
+
+    def test_invalid_quantile_raises_error(self):
+        with pt_raises(ValueError, match="Quantile must be in"):
+            TDigest().quantile(1.5)
+
+    def test_grouped_digests(self):
+        state = GroupedAccumulator(TDigest)
+        for value in range(1, 6):
+            state.add("QA", value)
+
+        assert state.groups["QA"].quantile(0.5) == 3
@@ -0,0 +1,68 @@
+import random
+from operator import itemgetter
+
+from pytest import raises as pt_raises
+
+from core import external_sort, top_k
+from core.sorting import sort_rows
+
+
+def _rows(count, seed=0):
+    rng = random.Random(seed)
+    return [{"id": i, "score": rng.randint(0, 20)} for i in range(count)]
+
+
+class TestExternalSort:
+    """Tests for external_sort function."""
+
+    def test_sort_in_memory(self):
+        assert list(external_sort([3, 1, 2], run_size=10)) == [1, 2, 3]
+
+    def test_spilled_runs_match_sorted(self, tmp_path):
+        rows = _rows(1000)
+        key = itemgetter("score")
+
+        result = list(external_sort(rows, key, run_size=64, tmp_dir=tmp_path))
+
+        assert result == sorted(rows, key=key)
+        assert not list(tmp_path.iterdir())
+
+    def test_spilled_runs_descending_keep_order_of_equal_items(self):
+        rows = _rows(500, seed=1)
+        key = itemgetter("score")
+
+        result = list(external_sort(iter(rows), key, reverse=True, run_size=50))
+
+        assert result == sorted(rows, key=key, reverse=True)
+
+    def test_items_are_consumed_before_iteration(self, tmp_path):
+        rows = iter(_rows(200))
+
+        result = external_sort(rows, itemgetter("score"), run_size=30, tmp_dir=tmp_path)
+
+        assert next(rows, None) is None
+        assert len(list(tmp_path.iterdir())) == 1
+        result.close()
+        assert not list(tmp_path.iterdir())
+
+    def test_run_size_must_be_positive(self):
+        with pt_raises(ValueError, match="Run size must be positive"):
+            external_sort([1], run_size=0)
+
+
+class TestTopK:
+    """Tests for top_k and sort_rows functions."""
+
+    def test_top_k_matches_sorted_prefix(self):
+        rows = _rows(300, seed=2)
+        key = itemgetter("score")
+
+        assert top_k(iter(rows), 10, key) == sorted(rows, key=key)[:10]
+        assert top_k(rows, 10, key, True) == sorted(rows, key=key, reverse=True)[:10]
+
+    def test_sort_rows_with_limit(self):
+        rows = _rows(100, seed=3)
+        key = itemgetter("score")
+
+        assert list(sort_rows(rows, key, True, limit=5)) == top_k(rows, 5, key, True)
+        assert list(sort_rows(rows, key, run_size=16)) == sorted(rows, key=key)
@@ -0,0 +1,103 @@
+import pickle
+from array import array
+
+from pytest import raises as pt_raises
+
+from core import CsvReader, Table
+from core.defined_reports import AveragePerformanceReport
+from core.table import DictColumn
+
+
+class TestDictColumn:
+    """Tests for DictColumn class."""
+
+    def test_values_stored_once(self):
+        column = DictColumn()
+        for value in ("a", "b", "a", "a"):
+            column.append(value)
+
+        assert column.values == ["a", "b"]
+        assert list(column.codes) == [0, 1, 0, 0]
+        assert list(column) == ["a", "b", "a", "a"]
+        assert column[1] == "b"
+
+    def test_append_after_pickle(self):
+        column = DictColumn()
+        column.append("a")
+
+        restored = pickle.loads(pickle.dumps(column))
+        restored.append("a")
+
+        assert restored.values == ["a"]
+        assert len(restored) == 2
+
+
+class TestTable:
+    """Tests for Table class."""
+
+    def test_from_rows_types_columns(self, perf_data):
+        table = Table.from_rows(perf_data)
+
+        assert len(table) == 5
+        assert table.column_names == ["name", "position", "performance"]
+        assert isinstance(table.column("position"), DictColumn)
+        assert table.column("position").values == [
+            "Backend Developer",
+            "Frontend Developer",
+            "QA Engineer",
+        ]
+        assert isinstance(table.column("performance"), array)
+        assert table.column("performance").typecode == "d"
+
+    def test_from_rows_keeps_requested_columns(self, perf_data):
+        table = Table.from_rows(perf_data, columns=["position", "performance"])
+
+        assert table.column_names == ["position", "performance"]
+        with pt_raises(KeyError):
+            table.column("name")
+
+    def test_from_rows_mixed_column_stays_strings(self, mixed_perf_data):
+        table = Table.from_rows(mixed_perf_data)
+
+        assert isinstance(table.column("performance"), DictColumn)
+        assert list(table.column("performance"))[1] == "invalid"
+
+    def test_from_rows_keeps_non_canonical_numbers_as_strings(self):
+        rows = [
+            {"zip": "02134", "id": "007", "score": "4.50"},
+            {"zip": "10001", "id": "12", "score": "3.5"},
+        ]
+
+        table = Table.from_rows(rows)
+
+        for name in ("zip", "id", "score"):
+            assert isinstance(table.column(name), DictColumn)
+        assert list(table.iter_rows()) == rows
+
+    def test_from_rows_empty(self):
+        table = Table.from_rows([], columns=["position"])
+
+        assert len(table) == 0
+        assert table.column_names == ["position"]
+
+    def test_iter_rows(self, perf_data):
+        table = Table.from_rows(perf_data)
+        rows = list(table.iter_rows(["name", "performance"]))
+
+        assert rows[0] == {"name": "John", "performance": 4.8}
+        assert len(rows) == 5
+
+    def test_different_lengths_raise_error(self):
+        with pt_raises(ValueError, match="different lengths"):
+            Table({"a": [1], "b": [1, 2]})
+
+    def test_load_table_from_reader(self, valid_csv_file):
+        table = CsvReader(valid_csv_file).load_table(["position", "performance"])
+
+        assert len(table) == 5
+        assert table.column("performance")[0] == 4.8
+
+    def test_report_accepts_table(self, perf_data):
+        report = AveragePerformanceReport()
+
+        assert report.generate(Table.from_rows(perf_data)) == report.generate(perf_data)
@@ -0,0 +1,73 @@
+import pytest
+
+from core import ColumnarReader, Table, convert_csv, vectorized
+from core.defined_reports import AveragePerformanceReport
+
+pytest.importorskip("numpy")
+
+
+class TestGroupedSums:
+    """Tests for grouped_sums function."""
+
+    def test_grouped_sums_match_row_by_row_state(self, perf_data):
+        report = AveragePerformanceReport()
+        table = Table.from_rows(perf_data)
+
+        state = vectorized.grouped_sums(table, "position", "performance")
+        expected = report.accumulate(iter(perf_data))
+
+        assert [(key, acc.count, acc.total) for key, acc in state.items()] == [
+            (key, acc.count, acc.total) for key, acc in expected.items()
+        ]
+
+    def test_grouped_sums_skip_non_numeric_values(self, mixed_perf_data):
+        report = AveragePerformanceReport()
+        table = Table.from_rows(mixed_perf_data)
+
+        state = vectorized.grouped_sums(table, "position", "performance")
+
+        assert report.finalize(state) == report.generate(iter(mixed_perf_data))
+
+    def test_groups_ordered_by_first_numeric_value(self):
+        table = Table.from_rows(
+            [
+                {"position": "QA", "performance": "n/a"},
+                {"position": "Dev", "performance": "4.5"},
+                {"position": "QA", "performance": "4.5"},
+            ]
+        )
+
+        state = vectorized.grouped_sums(table, "position", "performance")
+
+        assert list(state.groups) == ["Dev", "QA"]
+
+    def test_grouped_sums_of_integer_column(self):
+        table = Table.from_rows(
+            [
+                {"team": 2, "tasks": "3"},
+                {"team": 1, "tasks": "4"},
+                {"team": 2, "tasks": "5"},
+            ]
+        )
+
+        state = vectorized.grouped_sums(table, "team", "tasks")
+
+        assert {key: acc.total for key, acc in state.items()} == {2: 8, 1: 4}
+        assert all(type(acc.total) is int for _, acc in state.items())
+
+    def test_report_uses_vectorized_state_for_tables(self, perf_data):
+        report = AveragePerformanceReport()
+
+        assert report.state_from_table(Table.from_rows(perf_data)) is not None
+        assert report.generate(Table.from_rows(perf_data)) == report.generate(
+            iter(perf_data)
+        )
+
+    def test_columnar_file_is_aggregated_vectorized(self, valid_csv_file, tmp_path):
+        report = AveragePerformanceReport()
+        output = convert_csv(valid_csv_file, tmp_path / "data.csvb")
+        table = ColumnarReader(output).load_table(report.columns)
+
+        assert report.finalize(report.state_from_table(table)) == report.generate(
+            table.iter_rows()
+        )